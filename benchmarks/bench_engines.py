@@ -0,0 +1,194 @@
+# benchmarks/bench_engines.py
+"""
+Benchmark suite for the pricing kernels of every engine.
+
+Records median wall time, throughput, peak memory and the error against a
+closed-form reference for:
+- vanilla_option_price_bs
+- barrier_option_price_bs (scalar) and barrier_option_price_bs_vec
+- option_price_pde across (nx, nt), and one grid per option against option_price_pde_batch
+- simulate_paths_gbm across path counts
+- barrier Monte Carlo on stored paths against barrier_option_payoffs_mc_streaming
+- variance_swap_swaption_price_mc
+
+Run from the repository root:
+    python -m benchmarks.bench_engines                    # compare with the saved baseline
+    python -m benchmarks.bench_engines --save-baseline    # record a new baseline
+    python -m benchmarks.bench_engines --quick            # smaller sizes, for a smoke run
+
+A regression against the baseline exits with a non-zero status.
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from benchmarks.harness import run_benchmark, print_results, save_baseline, check_against_baseline, BenchmarkRegression
+from src.models.black_scholes.black_scholes_functions import (vanilla_option_price_bs, barrier_option_price_bs,
+                                                              vanilla_option_price_bs_vec, barrier_option_price_bs_vec)
+from src.models.pde.pde_functions import option_price_pde, option_price_pde_batch
+from src.models.monte_carlo.monte_carlo_functions import (simulate_paths_gbm, variance_swap_swaption_price_mc,
+                                                          barrier_option_price_mc, barrier_option_payoffs_mc_streaming)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "engines.json")
+
+S0, K, T, R, Q, SIGMA = 100.0, 105.0, 1.0, 0.02, 0.0, 0.2
+
+
+def bench_black_scholes(n_calls: int):
+    results = []
+
+    # Hull, Options, Futures and Other Derivatives, Example 15.6: c = 4.76, p = 0.81
+    hull_call = 4.759422392871532
+    results.append(run_benchmark(
+        "vanilla_option_price_bs", lambda: [vanilla_option_price_bs(42, 40, 0.5, 0.1, 0.0, 0.2, "call")
+                                            for _ in range(n_calls)][-1],
+        n_items=n_calls, unit="options", reference=hull_call))
+
+    # In-out parity against the vanilla price
+    vanilla = vanilla_option_price_bs(S0, K, T, R, Q, SIGMA, "call")
+
+    def barrier_parity():
+        for _ in range(n_calls):
+            knock_in = barrier_option_price_bs(S0, K, T, R, Q, SIGMA, 80.0, "call", "down-and-in")
+            knock_out = barrier_option_price_bs(S0, K, T, R, Q, SIGMA, 80.0, "call", "down-and-out")
+        return knock_in + knock_out
+
+    results.append(run_benchmark("barrier_option_price_bs (in + out)", barrier_parity,
+                                 n_items=2 * n_calls, unit="options", reference=vanilla))
+
+    n_book = 100 * n_calls
+    strikes = np.random.default_rng(0).uniform(85.0, 115.0, n_book)
+    vanillas = vanilla_option_price_bs_vec(S0, strikes, T, R, Q, SIGMA, True)
+    results.append(run_benchmark(
+        f"barrier_option_price_bs_vec (in + out, n={n_book})",
+        lambda: barrier_option_price_bs_vec(S0, strikes, T, R, Q, SIGMA, 80.0, True, True, True)
+        + barrier_option_price_bs_vec(S0, strikes, T, R, Q, SIGMA, 80.0, True, True, False),
+        n_items=2 * n_book, unit="options", reference=vanillas))
+    return results
+
+
+def bench_pde(grids):
+    reference = vanilla_option_price_bs(S0, K, T, R, Q, SIGMA, "call")
+    return [run_benchmark(f"option_price_pde (nx={nx}, nt={nt})",
+                          lambda nx=nx, nt=nt: option_price_pde(S0, K, T, R, SIGMA, "call", nx, nt, 0.0, 3 * S0),
+                          n_items=1, unit="options", reference=reference, repeat=3)
+            for nx, nt in grids]
+
+
+def bench_pde_batch(n_options: int, nx: int, nt: int):
+    # A book of calls with its own (K, T, r, sigma) per option
+    rng = np.random.default_rng(0)
+    strikes, maturities = rng.uniform(85.0, 115.0, n_options), rng.uniform(0.25, 2.0, n_options)
+    rates, vols = rng.uniform(0.0, 0.05, n_options), rng.uniform(0.1, 0.4, n_options)
+    reference = np.array([vanilla_option_price_bs(S0, k, t, r, Q, v, "call")
+                          for k, t, r, v in zip(strikes, maturities, rates, vols)])
+
+    def one_grid_per_option():
+        return np.array([option_price_pde(S0, k, t, r, v, "call", nx, nt, 0.0, 3 * S0)
+                         for k, t, r, v in zip(strikes, maturities, rates, vols)])
+
+    return [run_benchmark(f"option_price_pde loop (n={n_options}, nx={nx}, nt={nt})", one_grid_per_option,
+                          n_items=n_options, unit="options", reference=reference, repeat=3),
+            run_benchmark(f"option_price_pde_batch (n={n_options}, nx={nx}, nt={nt})",
+                          lambda: option_price_pde_batch(S0, strikes, maturities, rates, vols, True, nx, nt, 0.0,
+                                                         3 * S0),
+                          n_items=n_options, unit="options", reference=reference, repeat=3)]
+
+
+def bench_gbm(path_counts, n_steps: int):
+    reference = vanilla_option_price_bs(S0, K, T, R, Q, SIGMA, "call")
+    discount = np.exp(-R * T)
+
+    def call_price(paths):
+        return discount * np.mean(np.maximum(paths[:, -1] - K, 0.0))
+
+    return [run_benchmark(f"simulate_paths_gbm (paths={n_paths}, steps={n_steps})",
+                          lambda n_paths=n_paths: simulate_paths_gbm(n_paths, n_steps, T, R, Q, SIGMA, S0),
+                          n_items=n_paths * n_steps, unit="steps", repeat=3,
+                          error_fn=lambda paths: abs(call_price(paths) - reference))
+            for n_paths in path_counts]
+
+
+def bench_barrier_mc(path_counts, n_steps: int):
+    # Discretely monitored, so the error includes the monitoring bias against the continuous barrier
+    B = 85.0
+    reference = barrier_option_price_bs(S0, K, T, R, Q, SIGMA, B, "call", "down-and-out")
+
+    def stored(n_paths):
+        paths = simulate_paths_gbm(n_paths, n_steps, T, R, Q, SIGMA, S0)
+        return barrier_option_price_mc(paths, K, T, R, B, 0.0, "call", "down-and-out")
+
+    results = []
+    for n_paths in path_counts:
+        results.append(run_benchmark(f"barrier mc, stored paths (paths={n_paths}, steps={n_steps})",
+                                     lambda n_paths=n_paths: stored(n_paths),
+                                     n_items=n_paths * n_steps, unit="steps", reference=reference, repeat=3))
+        results.append(run_benchmark(f"barrier mc, streaming (paths={n_paths}, steps={n_steps})",
+                                     lambda n_paths=n_paths: np.mean(barrier_option_payoffs_mc_streaming(
+                                         n_paths, n_steps, T, R, Q, SIGMA, S0, K, B, 0.0, "call", "down-and-out")),
+                                     n_items=n_paths * n_steps, unit="steps", reference=reference, repeat=3))
+    return results
+
+
+def bench_variance_swaption(n_paths: int, n_steps: int):
+    # With K = 0 the payoff is the forward variance swap rate itself, a martingale
+    # under the model, so the price is exp(-r T1) * var_swap_spot.
+    var_swap_spot, r, T1, T2 = 0.04, 0.01, 0.5, 1.0
+    params = {'nu': 1.50, 'theta': 0.312, 'k1': 2.63, 'k2': 0.42, 'rho': -0.7}
+    return [run_benchmark(f"variance_swap_swaption_price_mc (paths={n_paths}, steps={n_steps})",
+                          lambda: variance_swap_swaption_price_mc(var_swap_spot, 0.0, r, T1, T2, params,
+                                                                  n_paths, n_steps),
+                          n_items=n_paths, unit="paths", repeat=1,
+                          reference=np.exp(-r * T1) * var_swap_spot)]
+
+
+def run_suite(quick: bool = False) -> list:
+    if quick:
+        return (bench_black_scholes(n_calls=100)
+                + bench_pde([(100, 50), (200, 100)])
+                + bench_pde_batch(20, 100, 50)
+                + bench_gbm([1000, 10000], n_steps=50)
+                + bench_barrier_mc([10000], n_steps=50)
+                + bench_variance_swaption(n_paths=500, n_steps=20))
+    return (bench_black_scholes(n_calls=1000)
+            + bench_pde([(200, 100), (500, 252), (1000, 500)])
+            + bench_pde_batch(500, 200, 100)
+            + bench_gbm([1000, 10000, 100000], n_steps=252)
+            + bench_barrier_mc([100000], n_steps=252)
+            + bench_variance_swaption(n_paths=2000, n_steps=50))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Path of the JSON baseline.")
+    parser.add_argument("--save-baseline", action="store_true", help="Record the results as the new baseline.")
+    parser.add_argument("--quick", action="store_true", help="Smaller problem sizes.")
+    parser.add_argument("--time-tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown before failing (default 0.25).")
+    args = parser.parse_args(argv)
+
+    results = run_suite(quick=args.quick)
+    print_results(results)
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+
+    try:
+        check_against_baseline(results, args.baseline, time_tolerance=args.time_tolerance)
+    except BenchmarkRegression as e:
+        print(f"\n{e}", file=sys.stderr)
+        return 1
+    print("\nNo regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
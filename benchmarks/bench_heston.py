@@ -0,0 +1,51 @@
+# benchmarks/bench_heston.py
+"""
+Cost of pricing a Heston strike strip with the COS method.
+
+Compares one strike against a 500-strike strip, with and without the
+characteristic function cached for the maturity.
+
+Run from the repository root:
+    python -m benchmarks.bench_heston
+"""
+import time
+
+import numpy as np
+
+from src.models.heston.heston_pricing import HestonEngine
+
+
+def _time(fn, n_repeat: int = 20) -> float:
+    best = np.inf
+    for _ in range(n_repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    params = dict(interest_rate=0.02, spot_price=100.0, v0=0.04, kappa=2.0, theta=0.05, vol_of_vol=0.4, rho=-0.6)
+    strikes = np.linspace(50.0, 150.0, 500)
+
+    def cold(n_strikes):
+        return lambda: HestonEngine(**params).price_vanilla_strip(strikes[:n_strikes], 1.0, "call")
+
+    warm_engine = HestonEngine(**params)
+    warm_engine.price_vanilla_strip(strikes, 1.0, "call")
+
+    rows = [
+        ("1 strike, cold cache", _time(cold(1))),
+        ("500 strikes, cold cache", _time(cold(500))),
+        ("1 strike, cached maturity", _time(lambda: warm_engine.price_vanilla_strip(strikes[:1], 1.0, "call"))),
+        ("500 strikes, cached maturity", _time(lambda: warm_engine.price_vanilla_strip(strikes, 1.0, "call"))),
+    ]
+
+    print(f"{'Case':<35}{'Time (ms)':>12}")
+    print("=" * 47)
+    for name, seconds in rows:
+        print(f"{name:<35}{seconds * 1e3:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/bench_import.py
+"""
+Cold-start import benchmark: wall time of a fresh interpreter importing each
+engine module, and whether any of the heavy optional dependencies
+(scipy.stats, scipy.integrate, scipy.special, scipy.linalg, tqdm) got loaded
+at import.
+
+Run from the repository root:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --save-baseline
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from benchmarks.harness import run_benchmark, print_results, save_baseline, check_against_baseline, BenchmarkRegression
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "import.json")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "src.models.black_scholes.black_scholes_pricing",
+    "src.models.monte_carlo.monte_carlo_pricing",
+    "src.models.pde.pde_pricing",
+    "src.models.heston.heston_pricing",
+    "src.valuation.valuation_request",
+]
+HEAVY = ["scipy.stats", "scipy.integrate", "scipy.special", "scipy.linalg", "tqdm"]
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True,
+                          capture_output=True, text=True).stdout
+
+
+def heavy_modules_loaded(module: str) -> list:
+    code = f"import sys, {module}; print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    return _run(code).split()
+
+
+def run_suite(repeat: int) -> list:
+    results = [run_benchmark("python -c pass", lambda: _run("pass"), unit="starts", repeat=repeat),
+               run_benchmark("import numpy", lambda: _run("import numpy"), unit="starts", repeat=repeat)]
+    for module in MODULES:
+        results.append(run_benchmark(f"import {module}", lambda module=module: _run(f"import {module}"),
+                                     unit="starts", repeat=repeat))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Path of the JSON baseline.")
+    parser.add_argument("--save-baseline", action="store_true", help="Record the results as the new baseline.")
+    parser.add_argument("--repeat", type=int, default=7, help="Interpreter starts per module.")
+    parser.add_argument("--time-tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown before failing (default 0.25).")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.repeat)
+    print_results(results)
+
+    print("\nHeavy modules loaded at import:")
+    for module in MODULES:
+        print(f"  {module:<50} {', '.join(heavy_modules_loaded(module)) or '-'}")
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+
+    try:
+        check_against_baseline(results, args.baseline, time_tolerance=args.time_tolerance)
+    except BenchmarkRegression as e:
+        print(f"\n{e}", file=sys.stderr)
+        return 1
+    print("\nNo regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
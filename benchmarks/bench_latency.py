@@ -0,0 +1,82 @@
+# benchmarks/bench_latency.py
+"""
+Per-call latency (p50 / p99) of single-option pricing: the reference
+Black-Scholes formulas against the scalar kernels, interpreted and compiled
+with Numba (when installed), and the PDE time stepping with both backends.
+
+Run from the repository root:
+    python -m benchmarks.bench_latency
+    python -m benchmarks.bench_latency --calls 2000
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from src.instruments.barrier_option import BarrierOption
+from src.models.black_scholes import black_scholes_kernels
+from src.models.black_scholes.black_scholes_functions import vanilla_option_price_bs, barrier_option_price_bs
+from src.models.black_scholes.black_scholes_pricing import BlackScholesEngine
+from src.models.pde.pde_functions import option_price_pde
+from src.utils.jit import get_kernels, numba_available
+
+S0, K, T, R, Q, SIGMA, B = 100.0, 105.0, 1.0, 0.02, 0.01, 0.2, 80.0
+
+
+def latency(fn, n_calls: int, warmup: int = 10):
+    """p50 and p99 of the per-call wall time, in microseconds."""
+    for _ in range(warmup):
+        fn()
+    samples = np.empty(n_calls)
+    for i in range(n_calls):
+        start = time.perf_counter_ns()
+        fn()
+        samples[i] = time.perf_counter_ns() - start
+    return np.percentile(samples, 50) / 1e3, np.percentile(samples, 99) / 1e3
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=10000, help="Timed calls per closed-form case.")
+    parser.add_argument("--pde-calls", type=int, default=50, help="Timed calls per PDE case.")
+    args = parser.parse_args(argv)
+
+    backends = ["python"] + (["numba"] if numba_available() else [])
+    cases = [
+        ("vanilla_option_price_bs (reference)",
+         lambda: vanilla_option_price_bs(S0, K, T, R, Q, SIGMA, "call"), args.calls),
+        ("barrier_option_price_bs (reference)",
+         lambda: barrier_option_price_bs(S0, K, T, R, Q, SIGMA, B, "call", "down-and-out"), args.calls),
+    ]
+    for backend in backends:
+        vanilla, barrier = get_kernels(black_scholes_kernels.build, backend)
+        cases += [
+            (f"vanilla kernel [{backend}]", lambda v=vanilla: v(S0, K, T, R, Q, SIGMA, True), args.calls),
+            (f"barrier kernel [{backend}]",
+             lambda b=barrier: b(S0, K, T, R, Q, SIGMA, B, True, True, False), args.calls),
+        ]
+
+    option = BarrierOption(strike=K, maturity=T, option_type="call", barrier_level=B, barrier_type="down-and-out",
+                           rebate=0.0)
+    for backend in ["python", "numba"]:
+        engine = BlackScholesEngine(R, SIGMA, S0, Q, backend=backend)
+        cases.append((f"BlackScholesEngine.price_barrier_option [{backend}]",
+                      lambda e=engine: e.price_barrier_option(option), args.calls))
+    for backend in ["python", "numba"]:
+        cases.append((f"option_price_pde nx=200 nt=252 [{backend}]",
+                      lambda backend=backend: option_price_pde(S0, K, T, R, SIGMA, "call", 200, 252, 0.0, 3 * S0,
+                                                               q=Q, backend=backend), args.pde_calls))
+
+    if not numba_available():
+        print("numba is not installed: the [numba] rows run the interpreted kernels.\n")
+    print(f"{'Case':<55}{'p50 (us)':>12}{'p99 (us)':>12}")
+    print("=" * 79)
+    for name, fn, n_calls in cases:
+        p50, p99 = latency(fn, n_calls)
+        print(f"{name:<55}{p50:>12.2f}{p99:>12.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
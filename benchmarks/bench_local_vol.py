@@ -0,0 +1,68 @@
+# benchmarks/bench_local_vol.py
+"""
+Barrier repricing on a cached Dupire local-vol surface.
+
+Compares the one-off cost of building the local-vol grid with the cost of
+repricing a strip of barrier options on it, via PDE and Monte Carlo, and
+shows what rebuilding the grid on every repricing would cost.
+
+Run from the repository root:
+    python -m benchmarks.bench_local_vol
+"""
+import time
+
+import numpy as np
+
+from src.instruments.barrier_option import BarrierOption
+from src.market_data.market import Market
+from src.market_data.vol_surface import VolSurface
+from src.models.pde.pde_pricing import PDEPricingEngine
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+
+
+def build_market():
+    strikes = np.linspace(50.0, 200.0, 16)
+    expiries = np.array([0.25, 0.5, 1.0, 2.0])
+    vols = 0.2 - 0.1 * np.log(strikes / 100.0)[None, :] + 0.02 * np.sqrt(expiries)[:, None]
+    return Market(vol_surface_dict={"STOCK_XYZ": VolSurface(strikes, expiries, vols)},
+                  spot_prices={"STOCK_XYZ": 100.0})
+
+
+def main(n_options: int = 10, nx: int = 400, nt: int = 200, n_paths: int = 20000, n_steps: int = 100):
+    market = build_market()
+    options = [BarrierOption(strike=K, maturity=1.0, option_type="call", barrier_level=80.0,
+                             barrier_type="down-and-out")
+               for K in np.linspace(90.0, 120.0, n_options)]
+
+    start = time.perf_counter()
+    local_vol = market.get_local_vol_surface("STOCK_XYZ", interest_rate=0.02)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert market.get_local_vol_surface("STOCK_XYZ", interest_rate=0.02) is local_vol
+    cached_time = time.perf_counter() - start
+
+    pde_engine = PDEPricingEngine(0.02, local_vol, 100.0, nx=nx, nt=nt)
+    start = time.perf_counter()
+    pde_prices = [option.accept_pricer(pde_engine) for option in options]
+    pde_time = time.perf_counter() - start
+
+    mc_engine = MonteCarloEngine(0.02, local_vol, 100.0, n_paths=n_paths, n_steps=n_steps)
+    np.random.seed(0)
+    start = time.perf_counter()
+    mc_prices = [option.accept_pricer(mc_engine) for option in options]
+    mc_time = time.perf_counter() - start
+
+    print(f"{'Local-vol grid build':<35}{build_time * 1e3:>10.2f} ms")
+    print(f"{'Cached surface lookup':<35}{cached_time * 1e6:>10.2f} us")
+    print(f"{'PDE repricing, per option':<35}{pde_time / n_options * 1e3:>10.2f} ms  (nx={nx}, nt={nt})")
+    print(f"{'MC repricing, per option':<35}{mc_time / n_options * 1e3:>10.2f} ms  (paths={n_paths}, steps={n_steps})")
+    print(f"{'Rebuild share if not cached (PDE)':<35}{build_time / (build_time + pde_time / n_options):>10.1%}")
+    print("=" * 60)
+    print(f"{'Strike':<10}{'PDE':<12}{'MC':<12}")
+    for option, pde_price, mc_price in zip(options, pde_prices, mc_prices):
+        print(f"{option.strike:<10.2f}{pde_price:<12.4f}{mc_price:<12.4f}")
+
+
+if __name__ == "__main__":
+    main()
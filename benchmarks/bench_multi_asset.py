@@ -0,0 +1,67 @@
+# benchmarks/bench_multi_asset.py
+"""
+Scaling of the correlated multi-asset GBM simulator in the number of assets
+and of paths.
+
+Records wall time, throughput (asset-steps per second) and peak memory of
+simulate_paths_gbm_multi_asset streaming running extrema, against keeping
+the full paths. The accuracy column is the largest relative error of the
+terminal means against S0 * exp((r - q) T).
+
+Run from the repository root:
+    python -m benchmarks.bench_multi_asset
+    python -m benchmarks.bench_multi_asset --assets 2 8 --paths 10000 --steps 100
+"""
+import argparse
+import sys
+
+import numpy as np
+
+from benchmarks.harness import run_benchmark, print_results
+from src.models.monte_carlo.monte_carlo_functions import simulate_paths_gbm_multi_asset
+
+T, R = 1.0, 0.02
+
+
+def market(n_assets: int):
+    rng = np.random.default_rng(n_assets)
+    S0 = rng.uniform(50.0, 150.0, n_assets)
+    sigma = rng.uniform(0.15, 0.4, n_assets)
+    q = rng.uniform(0.0, 0.03, n_assets)
+    # Equicorrelated matrix, positive definite for rho > -1 / (n - 1)
+    correlation = np.full((n_assets, n_assets), 0.4)
+    np.fill_diagonal(correlation, 1.0)
+    return S0, sigma, q, correlation
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, nargs="+", default=[1, 2, 5, 10, 20])
+    parser.add_argument("--paths", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--steps", type=int, default=252)
+    parser.add_argument("--chunk-steps", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    results = []
+    for n_paths in args.paths:
+        for n_assets in args.assets:
+            S0, sigma, q, correlation = market(n_assets)
+            forward = S0 * np.exp((R - q) * T)
+
+            def terminal_error(simulation, forward=forward):
+                return np.max(np.abs(simulation.terminal.mean(axis=0) / forward - 1.0))
+
+            for keep_paths in (False, True):
+                label = "full paths" if keep_paths else "streamed extrema"
+                results.append(run_benchmark(
+                    f"multi-asset GBM [{label}] (assets={n_assets}, paths={n_paths})",
+                    lambda n_paths=n_paths, S0=S0, sigma=sigma, q=q, correlation=correlation, keep_paths=keep_paths:
+                    simulate_paths_gbm_multi_asset(n_paths, args.steps, T, R, S0, sigma, q, correlation,
+                                                   chunk_steps=args.chunk_steps, keep_paths=keep_paths),
+                    n_items=n_paths * args.steps * n_assets, unit="steps", error_fn=terminal_error, repeat=3))
+    print_results(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
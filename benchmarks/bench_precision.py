@@ -0,0 +1,66 @@
+# benchmarks/bench_precision.py
+"""
+float64 against float32 Monte Carlo path generation.
+
+For each path count, prices a European call with MonteCarloEngine in both
+precisions and records wall time, peak memory and the error against the
+Black-Scholes price (dominated by the Monte Carlo error). The precision
+error alone is measured separately by evolving the same normals in both
+precisions.
+
+Run from the repository root:
+    python -m benchmarks.bench_precision
+    python -m benchmarks.bench_precision --paths 10000 100000 --steps 50
+"""
+import argparse
+import sys
+
+import numpy as np
+
+from benchmarks.harness import run_benchmark, print_results
+from src.instruments.vanilla_option import VanillaOption
+from src.models.black_scholes.black_scholes_functions import vanilla_option_price_bs
+from src.models.monte_carlo.monte_carlo_functions import simulate_paths_gbm, vanilla_option_price_mc
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+
+S0, K, T, R, Q, SIGMA = 100.0, 105.0, 1.0, 0.02, 0.0, 0.2
+
+
+def precision_error(n_paths: int, n_steps: int) -> tuple:
+    """Largest relative terminal-price difference and price difference on identical normals."""
+    z = np.random.default_rng(0).standard_normal((n_paths, n_steps))
+    paths64 = simulate_paths_gbm(n_paths, n_steps, T, R, Q, SIGMA, S0, z=z)
+    paths32 = simulate_paths_gbm(n_paths, n_steps, T, R, Q, SIGMA, S0, z=z, dtype=np.float32)
+    rel = float(np.max(np.abs(paths32[:, -1] / paths64[:, -1] - 1.0)))
+    price = abs(vanilla_option_price_mc(paths32, K, T, R, "call") - vanilla_option_price_mc(paths64, K, T, R, "call"))
+    return rel, float(price)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paths", type=int, nargs="+", default=[10000, 100000, 500000])
+    parser.add_argument("--steps", type=int, default=252)
+    args = parser.parse_args(argv)
+
+    option = VanillaOption(strike=K, maturity=T, option_type="call", exercise_style="european")
+    reference = vanilla_option_price_bs(S0, K, T, R, Q, SIGMA, "call")
+
+    results = []
+    for n_paths in args.paths:
+        for dtype in ("float64", "float32"):
+            engine = MonteCarloEngine(R, SIGMA, S0, Q, n_paths=n_paths, n_steps=args.steps, dtype=dtype)
+            results.append(run_benchmark(f"MC call [{dtype}] (paths={n_paths}, steps={args.steps})",
+                                         lambda engine=engine: option.accept_pricer(engine),
+                                         n_items=n_paths * args.steps, unit="steps", reference=reference,
+                                         repeat=3))
+    print_results(results)
+
+    print(f"\n{'Precision error on identical normals':<45}{'max rel S_T':>15}{'|price diff|':>15}")
+    for n_paths in args.paths:
+        rel, price = precision_error(n_paths, args.steps)
+        print(f"{f'paths={n_paths}, steps={args.steps}':<45}{rel:>15.2e}{price:>15.2e}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+# benchmarks/bench_scheduler.py
+"""
+Scaling of BookScheduler from 1 to N worker processes.
+
+Prices a mixed Monte Carlo / PDE / Black-Scholes book with a process pool
+of each size and reports wall time, throughput, speed-up and parallel
+efficiency against one worker. Prices are checked to be identical across
+pool sizes (fixed seed and shard count).
+
+Run from the repository root:
+    python -m benchmarks.bench_scheduler
+    python -m benchmarks.bench_scheduler --workers 1 2 4 8 --options 400
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.vanilla_option import VanillaOption
+from src.models.black_scholes.black_scholes_pricing import BlackScholesEngine
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+from src.models.pde.pde_pricing import PDEPricingEngine
+from src.valuation.scheduler import BookScheduler
+
+
+def build_book(n_options: int, n_paths: int):
+    rng = np.random.default_rng(0)
+    engines = [MonteCarloEngine(0.02, 0.2, 100.0, n_paths=n_paths, n_steps=100),
+               PDEPricingEngine(0.02, 0.2, 100.0, nx=400, nt=200),
+               BlackScholesEngine(0.02, 0.2, 100.0)]
+    instruments, book_engines = [], []
+    for i in range(n_options):
+        K = float(rng.uniform(80.0, 120.0))
+        T = float(rng.choice([0.25, 0.5, 1.0, 2.0]))
+        if i % 2:
+            instruments.append(BarrierOption(K, T, "call", 70.0, "down-and-out"))
+        else:
+            instruments.append(VanillaOption(K, T, "put"))
+        book_engines.append(engines[i % 3])
+    return instruments, book_engines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--options", type=int, default=240)
+    parser.add_argument("--paths", type=int, default=20000)
+    parser.add_argument("--shards", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    instruments, engines = build_book(args.options, args.paths)
+    print(f"{'Workers':>8}{'Time (s)':>12}{'Options/s':>12}{'Speed-up':>10}{'Efficiency':>12}{'Retries':>9}")
+    print("=" * 63)
+    baseline_time, baseline_prices = None, None
+    for n_workers in args.workers:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            # Warm the workers up (imports) before timing
+            list(pool.map(abs, range(n_workers)))
+            scheduler = BookScheduler(executor=pool, seed=1, n_shards=args.shards)
+            start = time.perf_counter()
+            prices = scheduler.run(instruments, engines)
+            elapsed = time.perf_counter() - start
+        if baseline_time is None:
+            baseline_time, baseline_prices = elapsed, prices
+        elif prices != baseline_prices:
+            print("Prices differ from the single-worker run", file=sys.stderr)
+            return 1
+        speedup = baseline_time / elapsed
+        print(f"{n_workers:>8}{elapsed:>12.3f}{len(instruments) / elapsed:>12.1f}{speedup:>10.2f}"
+              f"{speedup / n_workers:>12.1%}{scheduler.stats['retries']:>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
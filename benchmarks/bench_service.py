@@ -0,0 +1,114 @@
+# benchmarks/bench_service.py
+"""
+Local load generator for ValuationService.
+
+Closed-loop clients each submit requests back to back (a mix of BS vanillas
+and barriers and Monte Carlo vanillas over a few maturities) and record the
+end-to-end latency of each. Reports throughput and p50/p95/p99 latency for
+the service and, for comparison, for pricing the same requests one by one
+with ValuationRequest.run_valuation.
+
+Run from the repository root:
+    python -m benchmarks.bench_service
+    python -m benchmarks.bench_service --requests 5000 --clients 200 --workers 4
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+import numpy as np
+
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.vanilla_option import VanillaOption
+from src.market_data.market import Market
+from src.models.black_scholes.black_scholes_pricing import BlackScholesEngine
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+from src.valuation.valuation_request import ValuationRequest
+from src.valuation.valuation_service import ValuationService
+
+MATURITIES = [0.25, 0.5, 1.0, 2.0]
+
+
+def make_requests(n_requests: int, mc_share: float, n_paths: int, seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    market = Market(spot_prices={"STOCK_XYZ": 100.0})
+    bs_engine = BlackScholesEngine(interest_rate=0.02, volatility=0.2, spot_price=100.0)
+    mc_engine = MonteCarloEngine(interest_rate=0.02, volatility=0.2, spot_price=100.0, n_paths=n_paths, n_steps=50)
+
+    requests = []
+    for _ in range(n_requests):
+        K = float(rng.uniform(80.0, 120.0))
+        T = float(rng.choice(MATURITIES))
+        option_type = "call" if rng.random() < 0.5 else "put"
+        if rng.random() < mc_share:
+            requests.append(ValuationRequest(VanillaOption(K, T, option_type), mc_engine, market))
+        elif rng.random() < 0.5:
+            requests.append(ValuationRequest(VanillaOption(K, T, option_type), bs_engine, market))
+        else:
+            requests.append(ValuationRequest(BarrierOption(K, T, "call", 70.0, "down-and-out"), bs_engine, market))
+    return requests
+
+
+def summarize(name: str, latencies: list, elapsed: float):
+    latencies = np.asarray(latencies) * 1e3
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    print(f"{name:<28}{len(latencies) / elapsed:>14,.0f}{p50:>12.2f}{p95:>12.2f}{p99:>12.2f}")
+
+
+def run_sequential(requests: list):
+    latencies = []
+    start = time.perf_counter()
+    for request in requests:
+        t0 = time.perf_counter()
+        request.run_valuation()
+        latencies.append(time.perf_counter() - t0)
+    return latencies, time.perf_counter() - start
+
+
+async def run_service(requests: list, n_clients: int, **service_kwargs):
+    latencies = []
+    queue = list(reversed(requests))
+
+    async with ValuationService(**service_kwargs) as service:
+        # Warm up the worker processes before timing
+        await asyncio.gather(*(service.submit(r) for r in requests[:n_clients]))
+
+        async def client():
+            while queue:
+                request = queue.pop()
+                t0 = time.perf_counter()
+                await service.submit(request)
+                latencies.append(time.perf_counter() - t0)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(n_clients)))
+        elapsed = time.perf_counter() - start
+        stats = dict(service.stats)
+    return latencies, elapsed, stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=100, help="Concurrent closed-loop clients.")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count).")
+    parser.add_argument("--window", type=float, default=0.002, help="Coalescing window in seconds.")
+    parser.add_argument("--mc-share", type=float, default=0.1, help="Fraction of Monte Carlo requests.")
+    parser.add_argument("--paths", type=int, default=5000, help="Monte Carlo paths per request.")
+    args = parser.parse_args(argv)
+
+    requests = make_requests(args.requests, args.mc_share, args.paths)
+
+    print(f"{'Mode':<28}{'Requests/s':>14}{'p50 (ms)':>12}{'p95 (ms)':>12}{'p99 (ms)':>12}")
+    print("=" * 78)
+    summarize("sequential run_valuation", *run_sequential(requests))
+    latencies, elapsed, stats = asyncio.run(run_service(requests, args.clients, batch_window=args.window,
+                                                        max_workers=args.workers))
+    summarize(f"service ({args.clients} clients)", latencies, elapsed)
+    print(f"\nService stats (including warm-up): {stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
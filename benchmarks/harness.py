@@ -0,0 +1,129 @@
+# benchmarks/harness.py
+"""
+Minimal benchmark harness: wall time, throughput, peak memory and accuracy
+against a reference, with JSON baselines that make regressions fail loudly.
+"""
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+
+
+class BenchmarkRegression(AssertionError):
+    pass
+
+
+class BenchmarkResult:
+    def __init__(self, name: str, unit: str, n_items: int, times: list, peak_memory: int, abs_error: float):
+        self.name = name
+        self.unit = unit
+        self.n_items = n_items
+        self.median_time = statistics.median(times)
+        self.best_time = min(times)
+        self.throughput = n_items / self.median_time
+        self.peak_memory = peak_memory
+        self.abs_error = abs_error
+
+    def to_dict(self) -> dict:
+        return {
+            "unit": self.unit,
+            "n_items": self.n_items,
+            "median_time": self.median_time,
+            "best_time": self.best_time,
+            "throughput": self.throughput,
+            "peak_memory": self.peak_memory,
+            "abs_error": self.abs_error,
+        }
+
+
+def run_benchmark(name: str, fn, n_items: int = 1, unit: str = "calls", reference: float = None,
+                  error_fn=None, repeat: int = 5, seed: int = 1234) -> BenchmarkResult:
+    """
+    Time ``fn()`` ``repeat`` times, then run it once more under tracemalloc for
+    the peak memory. The accuracy is |fn() - reference|, or ``error_fn(fn())``
+    when given. The global NumPy seed is reset before every run so that Monte
+    Carlo errors are reproducible.
+    """
+    times = []
+    for _ in range(repeat):
+        np.random.seed(seed)
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    np.random.seed(seed)
+    tracemalloc.start()
+    value = fn()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if error_fn is not None:
+        abs_error = float(error_fn(value))
+    elif reference is not None:
+        abs_error = float(np.max(np.abs(np.asarray(value) - reference)))
+    else:
+        abs_error = float("nan")
+
+    return BenchmarkResult(name, unit, n_items, times, peak_memory, abs_error)
+
+
+def print_results(results: list):
+    print(f"{'Benchmark':<62}{'Median (ms)':>12}{'Throughput':>24}{'Peak mem (MB)':>15}{'Abs error':>12}")
+    print("=" * 125)
+    for result in results:
+        throughput = f"{result.throughput:,.0f} {result.unit}/s"
+        print(f"{result.name:<62}{result.median_time * 1e3:>12.3f}{throughput:>24}"
+              f"{result.peak_memory / 2 ** 20:>15.2f}{result.abs_error:>12.2e}")
+
+
+def save_baseline(results: list, path: str):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    payload = {
+        "_meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+        },
+        "results": {result.name: result.to_dict() for result in results},
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
+def check_against_baseline(results: list, path: str, time_tolerance: float = 0.25,
+                           memory_tolerance: float = 0.10, error_tolerance: float = 0.10) -> list:
+    """
+    Compare results with a saved baseline. Returns the list of regressions and
+    raises BenchmarkRegression if there are any:
+    - median time above baseline * (1 + time_tolerance)
+    - peak memory above baseline * (1 + memory_tolerance)
+    - absolute error above baseline * (1 + error_tolerance) (plus a tiny floor)
+    Benchmarks missing from the baseline are ignored.
+    """
+    with open(path) as f:
+        baseline = json.load(f)["results"]
+
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        if result.median_time > base["median_time"] * (1 + time_tolerance):
+            regressions.append(f"{result.name}: median time {result.median_time * 1e3:.3f} ms "
+                               f"vs baseline {base['median_time'] * 1e3:.3f} ms")
+        if result.peak_memory > base["peak_memory"] * (1 + memory_tolerance) + 4096:
+            regressions.append(f"{result.name}: peak memory {result.peak_memory} B "
+                               f"vs baseline {base['peak_memory']} B")
+        if not np.isnan(base["abs_error"]) and \
+                result.abs_error > base["abs_error"] * (1 + error_tolerance) + 1e-12:
+            regressions.append(f"{result.name}: abs error {result.abs_error:.3e} "
+                               f"vs baseline {base['abs_error']:.3e}")
+
+    if regressions:
+        raise BenchmarkRegression("Benchmark regressions:\n  " + "\n  ".join(regressions))
+    return regressions
@@ -0,0 +1,36 @@
+# src/instruments/asian_option.py
+from .vanilla_option import VanillaOption
+from .option_types import OptionType
+
+AVERAGING_TYPES = ("arithmetic", "geometric")
+
+
+class AsianOption(VanillaOption):
+    """
+    Fixed-strike Asian option on the average of the n_fixings equally spaced
+    fixings t_i = i T / n_fixings, i = 1..n_fixings (the Monte Carlo time
+    steps when n_fixings is None).
+    """
+    def __init__(self,
+                 strike: float,
+                 maturity: float,
+                 option_type: str | OptionType,
+                 averaging: str = "arithmetic",  # or "geometric"
+                 n_fixings: int = None):
+        super().__init__(strike, maturity, option_type)
+        averaging = averaging.lower()
+        if averaging not in AVERAGING_TYPES:
+            raise ValueError(f"averaging must be one of {AVERAGING_TYPES}, got {averaging!r}")
+        self.averaging = averaging
+        self.n_fixings = n_fixings
+
+    def get_pricing_parameters(self):
+        params = super().get_pricing_parameters()
+        params.update({
+            "averaging": self.averaging,
+            "n_fixings": self.n_fixings,
+        })
+        return params
+
+    def accept_pricer(self, pricer):
+        return pricer.price_path_dependent_option(self)
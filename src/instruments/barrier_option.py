@@ -1,17 +1,18 @@
 # src/instruments/barrier_option.py
 from .vanilla_option import VanillaOption
+from .option_types import OptionType, BarrierType
 
 class BarrierOption(VanillaOption):
     def __init__(self,
                  strike: float,
                  maturity: float,
-                 option_type: str,
+                 option_type: str | OptionType,
                  barrier_level: float,
-                 barrier_type: str,     # "up-and-out", "down-and-in", etc.
+                 barrier_type: str | BarrierType,     # "up-and-out", "down_and_in", etc.
                  rebate: float = 0.0):
         super().__init__(strike, maturity, option_type)
         self.barrier_level = barrier_level
-        self.barrier_type = barrier_type
+        self.barrier_type = BarrierType.parse(barrier_type)
         self.rebate = rebate
 
     def get_pricing_parameters(self):
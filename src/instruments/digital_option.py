@@ -0,0 +1,22 @@
+# src/instruments/digital_option.py
+from .vanilla_option import VanillaOption
+from .option_types import OptionType
+
+
+class DigitalOption(VanillaOption):
+    """European cash-or-nothing option paying ``cash`` if S_T ends in the money."""
+    def __init__(self,
+                 strike: float,
+                 maturity: float,
+                 option_type: str | OptionType,
+                 cash: float = 1.0):
+        super().__init__(strike, maturity, option_type)
+        self.cash = cash
+
+    def get_pricing_parameters(self):
+        params = super().get_pricing_parameters()
+        params["cash"] = self.cash
+        return params
+
+    def accept_pricer(self, pricer):
+        return pricer.price_path_dependent_option(self)
@@ -1,21 +1,30 @@
 # src/instruments/fx_option.py
 from .barrier_option import BarrierOption
+from .option_types import OptionType, BarrierType
 
 class FXBarrierOption(BarrierOption):
     def __init__(self,
                  strike: float,
                  maturity: float,
-                 option_type: str,
+                 option_type: str | OptionType,
                  barrier_level: float,
-                 barrier_type: str,
+                 barrier_type: str | BarrierType,
                  domestic_ccy: str,    # e.g., "USD"
                  foreign_ccy: str,     # e.g., "EUR"
-                 notional: float,
-                 rebate: float = 0.0):
+                 notional: float,      # in foreign currency
+                 rebate: float = 0.0,
+                 premium_ccy: str = None):  # defaults to the domestic currency
         super().__init__(strike, maturity, option_type, barrier_level, barrier_type, rebate)
         self.domestic_ccy = domestic_ccy
         self.foreign_ccy = foreign_ccy
         self.notional = notional
+        self.premium_ccy = premium_ccy or domestic_ccy
+        if self.premium_ccy not in (domestic_ccy, foreign_ccy):
+            raise ValueError("Premium currency must be either the domestic or the foreign currency.")
+
+    @property
+    def currency_pair(self) -> str:
+        return self.foreign_ccy + self.domestic_ccy
 
     def get_pricing_parameters(self):
         params = super().get_pricing_parameters()
@@ -23,6 +32,7 @@ class FXBarrierOption(BarrierOption):
             "domestic_ccy": self.domestic_ccy,
             "foreign_ccy": self.foreign_ccy,
             "notional": self.notional,
+            "premium_ccy": self.premium_ccy,
         })
         return params
 
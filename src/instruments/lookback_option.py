@@ -0,0 +1,24 @@
+# src/instruments/lookback_option.py
+from .vanilla_option import VanillaOption
+from .option_types import OptionType
+
+
+class LookbackOption(VanillaOption):
+    """
+    Lookback option on the extremum of the path (S0 included). With a strike,
+    a fixed-strike lookback paying max(S_max - K, 0) for a call and
+    max(K - S_min, 0) for a put; without one, a floating-strike lookback
+    paying S_T - S_min for a call and S_max - S_T for a put.
+    """
+    def __init__(self,
+                 maturity: float,
+                 option_type: str | OptionType,
+                 strike: float = None):
+        super().__init__(strike, maturity, option_type)
+
+    @property
+    def is_floating(self) -> bool:
+        return self.strike is None
+
+    def accept_pricer(self, pricer):
+        return pricer.price_path_dependent_option(self)
@@ -0,0 +1,95 @@
+# src/instruments/option_book.py
+import numpy as np
+
+from .vanilla_option import VanillaOption
+from .barrier_option import BarrierOption
+from .option_types import OptionType, BarrierType
+
+# Barrier code of the rows that are plain vanillas
+NO_BARRIER = -1
+
+
+def _label_codes(labels, parse, blank=None) -> np.ndarray:
+    """
+    int8 codes of an array of labels (strings or integer codes). Strings are
+    parsed once per distinct value, not once per row; empty strings map to
+    ``blank``.
+    """
+    labels = np.asarray(labels)
+    if labels.dtype.kind in "iu":
+        return labels.astype(np.int8)
+    if labels.dtype.kind in "fb":
+        # A label column that is empty throughout (e.g. no barriers in a CSV) is read back as NaN/False
+        if blank is None or (labels.dtype.kind == "f" and not np.all(np.isnan(labels))):
+            raise ValueError(f"Cannot read labels from a {labels.dtype} column")
+        return np.full(labels.shape, blank, dtype=np.int8)
+    uniques, inverse = np.unique(labels.astype(str), return_inverse=True)
+    codes = np.array([blank if (blank is not None and not u.strip()) else parse(u) for u in uniques], dtype=np.int8)
+    return codes[inverse.reshape(-1)]
+
+
+class OptionBook:
+    """
+    A book of European vanilla and barrier options held as columns (one
+    NumPy array per field) rather than as instrument objects, for bulk
+    loading and vectorized pricing (BlackScholesEngine.price_option_book).
+    Rows with barrier code NO_BARRIER are vanillas.
+    """
+    def __init__(self, strike, maturity, option_type, barrier_level=None, barrier_type=None, rebate=None, ids=None):
+        """
+        :param option_type: OptionType codes or labels ("call", "put").
+        :param barrier_type: BarrierType codes or labels; NO_BARRIER / "" for vanilla rows.
+        :param ids: Optional position identifiers, carried through to the results.
+        """
+        self.strike = np.asarray(strike, dtype=float)
+        n = self.strike.shape[0]
+        self.maturity = np.broadcast_to(np.asarray(maturity, dtype=float), (n,))
+        self.option_type = _label_codes(option_type, OptionType.parse)
+        if barrier_type is None:
+            self.barrier_type = np.full(n, NO_BARRIER, dtype=np.int8)
+        else:
+            self.barrier_type = _label_codes(barrier_type, BarrierType.parse, blank=NO_BARRIER)
+        self.barrier_level = np.full(n, np.nan) if barrier_level is None else np.asarray(barrier_level, dtype=float)
+        self.rebate = np.zeros(n) if rebate is None else np.nan_to_num(np.asarray(rebate, dtype=float))
+        self.ids = None if ids is None else np.asarray(ids)
+
+        for name in ("maturity", "option_type", "barrier_type", "barrier_level", "rebate", "ids"):
+            column = getattr(self, name)
+            if column is not None and column.shape != (n,):
+                raise ValueError(f"Column '{name}' has shape {column.shape}, expected ({n},)")
+        if np.any(np.isnan(self.barrier_level[self.is_barrier])):
+            raise ValueError("Barrier rows need a barrier level")
+
+    def __len__(self):
+        return self.strike.shape[0]
+
+    @property
+    def is_barrier(self) -> np.ndarray:
+        return self.barrier_type != NO_BARRIER
+
+    def columns(self) -> dict:
+        columns = {"strike": self.strike, "maturity": np.ascontiguousarray(self.maturity),
+                   "option_type": self.option_type, "barrier_level": self.barrier_level,
+                   "barrier_type": self.barrier_type, "rebate": self.rebate}
+        if self.ids is not None:
+            columns["id"] = self.ids
+        return columns
+
+    def take(self, index) -> "OptionBook":
+        """Sub-book of the given rows (slice, mask or indices)."""
+        return OptionBook(self.strike[index], self.maturity[index], self.option_type[index],
+                          self.barrier_level[index], self.barrier_type[index], self.rebate[index],
+                          None if self.ids is None else self.ids[index])
+
+    def to_instruments(self) -> list:
+        """Materialize the rows as VanillaOption / BarrierOption objects (for engines without a columnar path)."""
+        instruments = []
+        for i in range(len(self)):
+            if self.barrier_type[i] == NO_BARRIER:
+                instruments.append(VanillaOption(float(self.strike[i]), float(self.maturity[i]),
+                                                 OptionType(int(self.option_type[i]))))
+            else:
+                instruments.append(BarrierOption(float(self.strike[i]), float(self.maturity[i]),
+                                                 OptionType(int(self.option_type[i])), float(self.barrier_level[i]),
+                                                 BarrierType(int(self.barrier_type[i])), float(self.rebate[i])))
+        return instruments
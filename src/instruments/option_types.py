@@ -0,0 +1,115 @@
+# src/instruments/option_types.py
+"""
+Validated option and barrier types.
+
+Instruments parse their type strings once, at construction, into these
+integer enums; engines and kernels compare enum members (or, for books,
+arrays of their integer codes) instead of re-parsing strings on every call.
+
+The barrier codes are bit flags: bit 0 is "knock-in" and bit 1 is "down",
+so for an array of codes ``codes & IN_FLAG`` and ``codes & DOWN_FLAG`` give
+the knock-in and down masks.
+"""
+from enum import IntEnum
+
+import numpy as np
+
+IN_FLAG = 1
+DOWN_FLAG = 2
+
+
+class OptionType(IntEnum):
+    CALL = 0
+    PUT = 1
+
+    @classmethod
+    def parse(cls, value) -> "OptionType":
+        """Accept an OptionType, its integer code or "call"/"put" (any case)."""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            member = _OPTION_TYPE_NAMES.get(value.strip().lower())
+            if member is not None:
+                return member
+        elif isinstance(value, (int, np.integer)) and value in (0, 1):
+            return cls(int(value))
+        raise ValueError(f"Option type must be either 'call' or 'put', got '{value}'")
+
+    @property
+    def is_call(self) -> bool:
+        return self is OptionType.CALL
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+    def __str__(self):
+        return self.label
+
+    def __format__(self, format_spec):
+        return format(self.label, format_spec)
+
+
+class BarrierType(IntEnum):
+    UP_AND_OUT = 0
+    UP_AND_IN = 1
+    DOWN_AND_OUT = 2
+    DOWN_AND_IN = 3
+
+    @classmethod
+    def parse(cls, value) -> "BarrierType":
+        """
+        Accept a BarrierType, its integer code or a string such as
+        "down-and-out", "down_and_out", "Down and Out" or "downandout".
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            key = value.strip().lower().replace("-", "").replace("_", "").replace(" ", "")
+            member = _BARRIER_TYPE_NAMES.get(key)
+            if member is not None:
+                return member
+        elif isinstance(value, (int, np.integer)) and 0 <= value <= 3:
+            return cls(int(value))
+        raise ValueError(f"Cannot recognise barrier type '{value}'")
+
+    @property
+    def is_down(self) -> bool:
+        return bool(self & DOWN_FLAG)
+
+    @property
+    def is_up(self) -> bool:
+        return not self & DOWN_FLAG
+
+    @property
+    def is_in(self) -> bool:
+        return bool(self & IN_FLAG)
+
+    @property
+    def is_out(self) -> bool:
+        return not self & IN_FLAG
+
+    @property
+    def label(self) -> str:
+        return self.name.lower().replace("_", "-")
+
+    def __str__(self):
+        return self.label
+
+    def __format__(self, format_spec):
+        return format(self.label, format_spec)
+
+
+_OPTION_TYPE_NAMES = {"call": OptionType.CALL, "put": OptionType.PUT}
+_BARRIER_TYPE_NAMES = {"upandout": BarrierType.UP_AND_OUT, "upandin": BarrierType.UP_AND_IN,
+                       "downandout": BarrierType.DOWN_AND_OUT, "downandin": BarrierType.DOWN_AND_IN}
+
+
+def option_type_codes(options) -> np.ndarray:
+    """Integer OptionType codes of a sequence of options."""
+    return np.fromiter((option.option_type for option in options), dtype=np.int8, count=len(options))
+
+
+def barrier_type_codes(options) -> np.ndarray:
+    """Integer BarrierType codes of a sequence of barrier options."""
+    return np.fromiter((option.barrier_type for option in options), dtype=np.int8, count=len(options))
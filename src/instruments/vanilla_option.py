@@ -1,16 +1,18 @@
 # src/instruments/vanilla_option.py
 from .instrument_base import Instrument
+from .option_types import OptionType
 
 
 class VanillaOption(Instrument):
     def __init__(self,
                  strike: float,
                  maturity: float,
-                 option_type: str,  # "call" or "put"
+                 option_type: str | OptionType,  # "call" or "put"
                  exercise_style: str = "european"):  # or "american"
         self.strike = strike
         self.maturity = maturity
-        self.option_type = option_type
+        # Parsed once here; engines dispatch on the enum
+        self.option_type = OptionType.parse(option_type)
         self.exercise_style = exercise_style
 
     def get_pricing_parameters(self):
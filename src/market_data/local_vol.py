@@ -0,0 +1,106 @@
+# src/market_data/local_vol.py
+import numpy as np
+
+from .yield_curve import YieldCurve
+from .vol_surface import VolSurface
+
+
+class LocalVolSurface:
+    """
+    Dupire local volatility sigma_loc(S, t) precomputed on a (time, spot) grid.
+
+    Lookups interpolate linearly in time and in log-spot, with flat
+    extrapolation outside the grid. Build it once with ``from_implied_vol``
+    (or ``Market.get_local_vol_surface``, which caches it) and reuse it
+    across repricings.
+    """
+    def __init__(self, times, spots, local_vols):
+        """
+        :param times: Time nodes in years, strictly increasing, shape (n_t,).
+        :param spots: Spot nodes, strictly increasing and positive, shape (n_s,).
+        :param local_vols: Local vols, shape (n_t, n_s).
+        """
+        self.times = np.asarray(times, dtype=float)
+        self.spots = np.asarray(spots, dtype=float)
+        self.local_vols = np.asarray(local_vols, dtype=float)
+        if self.local_vols.shape != (self.times.shape[0], self.spots.shape[0]):
+            raise ValueError("local_vols must have shape (len(times), len(spots)).")
+        self._log_spots = np.log(self.spots)
+
+    @classmethod
+    def from_implied_vol(cls,
+                         vol_surface: VolSurface,
+                         spot_price: float,
+                         interest_rate: float | YieldCurve,
+                         dividend_yield: float = 0.0,
+                         times=None,
+                         spots=None,
+                         vol_floor: float = 0.01,
+                         vol_cap: float = 3.0):
+        """
+        Build the local-vol grid from an implied-vol surface with Dupire's
+        formula written in total implied variance w(y, T), y = log(K / F(T)):
+
+            sigma_loc^2 = (dw/dT) / (1 - y/w dw/dy + 1/4 (-1/4 - 1/w + y^2/w^2) (dw/dy)^2 + 1/2 d2w/dy2)
+
+        Derivatives are taken by central differences on the (vectorized)
+        surface lookups. Non-positive numerators/denominators (calendar or
+        butterfly arbitrage in the input) are floored, and the result is
+        clipped to [vol_floor, vol_cap].
+        """
+        if times is None:
+            times = np.linspace(0.0, vol_surface.expiries[-1], 51)
+        if spots is None:
+            spots = spot_price * np.exp(np.linspace(np.log(0.2), np.log(5.0), 201))
+        times = np.asarray(times, dtype=float)
+        spots = np.asarray(spots, dtype=float)
+
+        # Dupire needs T > 0; the t=0 row takes the first positive time's values
+        t_eval = np.maximum(times, 1e-4)
+        T, S = np.meshgrid(t_eval, spots, indexing="ij")
+
+        def forward(t):
+            if isinstance(interest_rate, YieldCurve):
+                r = interest_rate.zero_rate(t)
+            else:
+                r = interest_rate
+            return spot_price * np.exp((r - dividend_yield) * t)
+
+        def w(y, t):
+            return vol_surface.total_variance(forward(t) * np.exp(y), t)
+
+        y = np.log(S / forward(T))
+        dy = 1e-3
+        dt = np.minimum(1e-3, 0.5 * T)
+
+        w0 = w(y, T)
+        w_up, w_dn = w(y + dy, T), w(y - dy, T)
+        dw_dy = (w_up - w_dn) / (2 * dy)
+        d2w_dy2 = (w_up - 2 * w0 + w_dn) / dy ** 2
+        dw_dT = (w(y, T + dt) - w(y, T - dt)) / (2 * dt)
+
+        w0 = np.maximum(w0, 1e-12)
+        denom = (1.0 - y / w0 * dw_dy
+                 + 0.25 * (-0.25 - 1.0 / w0 + y ** 2 / w0 ** 2) * dw_dy ** 2
+                 + 0.5 * d2w_dy2)
+        local_var = np.maximum(dw_dT, 0.0) / np.maximum(denom, 1e-8)
+        local_vols = np.clip(np.sqrt(local_var), vol_floor, vol_cap)
+
+        return cls(times, spots, local_vols)
+
+    def _row(self, t: float) -> np.ndarray:
+        times = self.times
+        if t <= times[0]:
+            return self.local_vols[0]
+        if t >= times[-1]:
+            return self.local_vols[-1]
+        j = np.searchsorted(times, t, side="right") - 1
+        weight = (t - times[j]) / (times[j + 1] - times[j])
+        return self.local_vols[j] + weight * (self.local_vols[j + 1] - self.local_vols[j])
+
+    def local_vol(self, S, t: float):
+        """
+        Local volatility at spots S (scalar or array) and a single time t.
+        """
+        log_S = np.log(np.maximum(S, 1e-12))
+        return np.interp(log_S, self._log_spots, self._row(t))
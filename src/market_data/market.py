@@ -1,28 +1,153 @@
 # src/market_data/market.py
+import numpy as np
+
+from .yield_curve import YieldCurve
+from .vol_surface import VolSurface
+from .local_vol import LocalVolSurface
+
+# Market fields, as used in MarketChange.field and in dependency indices
+SPOT = "spot"
+VOL_SURFACE = "vol_surface"
+YIELD_CURVE = "yield_curve"
+FX_RATE = "fx_rate"
+DISCOUNT_CURVE = "discount_curve"
+
+
+class MarketChange:
+    """One market data update: ``field`` and ``key`` (symbol, pair or currency) moved from ``old`` to ``new``."""
+    __slots__ = ("field", "key", "old", "new", "version")
+
+    def __init__(self, field: str, key, old, new, version: int):
+        self.field = field
+        self.key = key
+        self.old = old
+        self.new = new
+        self.version = version
+
+    @property
+    def address(self) -> tuple:
+        return self.field, self.key
+
+
 class Market:
     """
     Encapsulates all market information needed to price instruments:
     - Spot prices
-    - Discount curves
-    - Vol surfaces
+    - Discount curves (YieldCurve)
+    - Vol surfaces (VolSurface, keyed by symbol)
     - FX rates
     etc.
+
+    Updates made through the ``set_*`` methods bump ``version`` and are sent
+    as a MarketChange to every listener registered with ``subscribe``. Call
+    ``notify`` after mutating a curve or surface in place.
     """
     def __init__(self,
-                 yield_curve: object,
-                 vol_surface_dict: object = None,
-                 spot_prices: object = None,
-                 params: object = None) -> object:
+                 yield_curve: YieldCurve = None,
+                 vol_surface_dict: dict = None,
+                 spot_prices: dict = None,
+                 params: dict = None,
+                 fx_rates: dict = None,          # e.g. {"EURUSD": 1.08}, units of domestic per foreign
+                 discount_curves: dict = None):  # e.g. {"USD": YieldCurve(...), "EUR": 0.03}
         self.yield_curve = yield_curve
         self.vol_surface_dict = vol_surface_dict or {}
         self.spot_prices = spot_prices or {}
         self.params = params
+        self.fx_rates = fx_rates or {}
+        self.discount_curves = discount_curves or {}
+        self._local_vol_cache = {}
+        self.version = 0
+        self._listeners = []
+
+    def subscribe(self, listener):
+        """Register ``listener(change: MarketChange)``, called after every update."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def notify(self, field: str, key=None, old=None, new=None):
+        self.version += 1
+        change = MarketChange(field, key, old, new, self.version)
+        for listener in list(self._listeners):
+            listener(change)
+        return change
+
+    def set_spot_price(self, symbol: str, spot: float):
+        old = self.spot_prices.get(symbol)
+        self.spot_prices[symbol] = spot
+        return self.notify(SPOT, symbol, old, spot)
+
+    def set_vol_surface(self, symbol: str, vol_surface: VolSurface):
+        old = self.vol_surface_dict.get(symbol)
+        self.vol_surface_dict[symbol] = vol_surface
+        return self.notify(VOL_SURFACE, symbol, old, vol_surface)
+
+    def set_yield_curve(self, yield_curve: YieldCurve):
+        old = self.yield_curve
+        self.yield_curve = yield_curve
+        return self.notify(YIELD_CURVE, None, old, yield_curve)
+
+    def set_fx_rate(self, pair: str, rate: float):
+        old = self.fx_rates.get(pair)
+        self.fx_rates[pair] = rate
+        return self.notify(FX_RATE, pair, old, rate)
+
+    def set_discount_curve(self, ccy: str, curve):
+        old = self.discount_curves.get(ccy)
+        self.discount_curves[ccy] = curve
+        return self.notify(DISCOUNT_CURVE, ccy, old, curve)
 
     def get_spot_price(self, symbol: str):
         return self.spot_prices.get(symbol, None)
 
-    def get_yield_curve(self):
+    def get_yield_curve(self) -> YieldCurve:
         return self.yield_curve
 
-    def get_vol_surface(self, symbol: str):
+    def get_vol_surface(self, symbol: str) -> VolSurface:
         return self.vol_surface_dict.get(symbol, None)
+
+    def get_fx_rate(self, foreign_ccy: str, domestic_ccy: str):
+        """Spot FX rate in units of domestic currency per unit of foreign currency."""
+        rate = self.fx_rates.get(foreign_ccy + domestic_ccy)
+        if rate is not None:
+            return rate
+        inverse = self.fx_rates.get(domestic_ccy + foreign_ccy)
+        if inverse is not None:
+            return 1.0 / inverse
+        return None
+
+    def get_discount_curve(self, ccy: str):
+        """Discount curve (YieldCurve or flat rate) of a currency, or None."""
+        return self.discount_curves.get(ccy, None)
+
+    def get_local_vol_surface(self, symbol: str, interest_rate, dividend_yield: float = 0.0,
+                              **grid_kwargs) -> LocalVolSurface:
+        """
+        Dupire local-vol surface for ``symbol`` built from its implied-vol surface.
+
+        The grid is built once and cached; it is only rebuilt when the spot,
+        rates, grid arguments or the implied surface (via its version) change.
+        """
+        vol_surface = self.get_vol_surface(symbol)
+        if vol_surface is None:
+            raise ValueError(f"No vol surface available for '{symbol}'.")
+        spot = self.get_spot_price(symbol)
+
+        if isinstance(interest_rate, YieldCurve):
+            rate_key = (id(interest_rate), interest_rate.version)
+        else:
+            rate_key = interest_rate
+        grid_key = tuple((k, np.asarray(v).tobytes() if v is not None else None)
+                         for k, v in sorted(grid_kwargs.items()))
+        key = (id(vol_surface), vol_surface.version, spot, rate_key, dividend_yield, grid_key)
+
+        cached = self._local_vol_cache.get(symbol)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        surface = LocalVolSurface.from_implied_vol(vol_surface, spot, interest_rate, dividend_yield, **grid_kwargs)
+        self._local_vol_cache[symbol] = (key, surface)
+        return surface
@@ -0,0 +1,117 @@
+# src/market_data/vol_surface.py
+import numpy as np
+
+from src.utils.interpolation import natural_cubic_coefficients
+
+
+class VolSurface:
+    """
+    Implied volatility surface on a (expiry, strike) grid.
+
+    Each expiry slice is a natural cubic spline in strike whose coefficients
+    are precomputed; between expiries the total variance sigma^2 * T is
+    interpolated linearly. Vols are extrapolated flat in both directions.
+    The coefficients are rebuilt lazily, only after a node changes.
+    """
+    def __init__(self, strikes, expiries, vols):
+        """
+        :param strikes: Strike nodes, strictly increasing, shape (n_strikes,).
+        :param expiries: Expiry nodes in years, strictly increasing, shape (n_expiries,).
+        :param vols: Implied vols, shape (n_expiries, n_strikes).
+        """
+        # Bumped on every node change so dependants can detect stale caches
+        self.version = 0
+        self.set_nodes(strikes, expiries, vols)
+
+    @classmethod
+    def flat(cls, volatility: float):
+        return cls([1.0], [1.0], [[volatility]])
+
+    def set_nodes(self, strikes, expiries, vols):
+        # Copies, so that update_vol never writes into the caller's array
+        strikes = np.atleast_1d(np.array(strikes, dtype=float))
+        expiries = np.atleast_1d(np.array(expiries, dtype=float))
+        vols = np.array(vols, dtype=float).reshape(expiries.shape[0], strikes.shape[0])
+        if np.any(np.diff(strikes) <= 0) or np.any(np.diff(expiries) <= 0):
+            raise ValueError("Strike and expiry nodes must be strictly increasing.")
+        if np.any(expiries <= 0):
+            raise ValueError("Expiry nodes must be positive.")
+        self._strikes = strikes
+        self._expiries = expiries
+        self._vols = vols
+        self._coeffs = None
+        self.version += 1
+
+    def update_vol(self, expiry_index: int, strike_index: int, vol: float):
+        self._vols[expiry_index, strike_index] = vol
+        self._coeffs = None
+        self.version += 1
+
+    @property
+    def strikes(self) -> np.ndarray:
+        return self._strikes
+
+    @property
+    def expiries(self) -> np.ndarray:
+        return self._expiries
+
+    @property
+    def vols(self) -> np.ndarray:
+        return self._vols
+
+    def _build(self):
+        if self._strikes.shape[0] == 1:
+            # Single strike: constant in strike on a dummy two-knot grid
+            self._knots = np.array([self._strikes[0], self._strikes[0] + 1.0])
+            self._coeffs = np.zeros((self._expiries.shape[0], 1, 4))
+            self._coeffs[:, 0, 0] = self._vols[:, 0]
+        else:
+            self._knots = self._strikes
+            self._coeffs = natural_cubic_coefficients(self._strikes, self._vols)
+
+    def _slice_vols(self, K: np.ndarray) -> np.ndarray:
+        """Spline vols of every expiry slice at strikes K: shape (n_expiries,) + K.shape."""
+        x = self._knots
+        K = np.clip(K, x[0], x[-1])
+        idx = np.clip(np.searchsorted(x, K, side="right") - 1, 0, x.shape[0] - 2)
+        c = self._coeffs[:, idx]
+        h = K - x[idx]
+        return c[..., 0] + h * (c[..., 1] + h * (c[..., 2] + h * c[..., 3]))
+
+    def _interpolated_variance(self, K, T):
+        """Total variance at the expiry-clipped times, and those clipped times."""
+        if self._coeffs is None:
+            self._build()
+
+        K, T = np.broadcast_arrays(np.asarray(K, dtype=float), np.asarray(T, dtype=float))
+        expiries = self._expiries
+        n_exp = expiries.shape[0]
+
+        slice_vols = self._slice_vols(K)
+        T_clipped = np.clip(T, expiries[0], expiries[-1])
+        if n_exp == 1:
+            return slice_vols[0] ** 2 * T_clipped, T_clipped
+
+        j = np.clip(np.searchsorted(expiries, T_clipped, side="right") - 1, 0, n_exp - 2)
+        w_lo = np.take_along_axis(slice_vols, j[None], axis=0)[0] ** 2 * expiries[j]
+        w_hi = np.take_along_axis(slice_vols, j[None] + 1, axis=0)[0] ** 2 * expiries[j + 1]
+        weight = (T_clipped - expiries[j]) / (expiries[j + 1] - expiries[j])
+        return w_lo + weight * (w_hi - w_lo), T_clipped
+
+    def total_variance(self, K, T):
+        """
+        Total implied variance sigma^2 * T at (K, T). K and T broadcast together.
+        """
+        w, T_clipped = self._interpolated_variance(K, T)
+        # Flat vol extrapolation outside the expiry range
+        return w / T_clipped * np.asarray(T, dtype=float)
+
+    def vol(self, K, T):
+        """
+        Implied volatility at (K, T). Scalars return a float, arrays broadcast.
+        """
+        w, T_clipped = self._interpolated_variance(K, T)
+        sigma = np.sqrt(w / T_clipped)
+        if sigma.ndim == 0:
+            return float(sigma)
+        return sigma
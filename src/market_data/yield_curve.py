@@ -0,0 +1,116 @@
+# src/market_data/yield_curve.py
+from bisect import bisect_right
+from math import exp
+
+import numpy as np
+
+from src.utils.interpolation import natural_cubic_coefficients, linear_coefficients, evaluate_piecewise
+
+
+class YieldCurve:
+    """
+    Continuously-compounded zero curve defined on (time, zero rate) nodes.
+
+    The interpolant is precomputed once and only rebuilt when a node changes,
+    so lookups are a binary search plus a Horner evaluation. Zero rates are
+    extrapolated flat outside the node range.
+    """
+    def __init__(self,
+                 times,
+                 zero_rates,
+                 interpolation: str = "cubic"):   # "cubic" or "linear"
+        """
+        :param times: Node times in years, strictly increasing.
+        :param zero_rates: Continuously-compounded zero rates at the nodes.
+        :param interpolation: "cubic" (natural spline on zero rates) or "linear".
+        """
+        if interpolation not in ("cubic", "linear"):
+            raise ValueError("Interpolation must be either 'cubic' or 'linear'")
+        self.interpolation = interpolation
+        # Bumped on every node change so dependants can detect stale caches
+        self.version = 0
+        self.set_nodes(times, zero_rates)
+
+    @classmethod
+    def flat(cls, rate: float):
+        return cls([1.0], [rate])
+
+    def set_nodes(self, times, zero_rates):
+        # Copies, so that update_node never writes into the caller's array
+        times = np.atleast_1d(np.array(times, dtype=float))
+        zero_rates = np.atleast_1d(np.array(zero_rates, dtype=float))
+        if times.shape != zero_rates.shape or times.ndim != 1:
+            raise ValueError("times and zero_rates must be 1-D arrays of the same length.")
+        if np.any(np.diff(times) <= 0):
+            raise ValueError("Curve node times must be strictly increasing.")
+        self._times = times
+        self._rates = zero_rates
+        self._coeffs = None
+        self.version += 1
+
+    def update_node(self, index: int, zero_rate: float):
+        self._rates[index] = zero_rate
+        self._coeffs = None
+        self.version += 1
+
+    def shift(self, amount: float):
+        """Parallel shift of every node by ``amount`` (in rate units)."""
+        self._rates = self._rates + amount
+        self._coeffs = None
+        self.version += 1
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._times
+
+    @property
+    def zero_rates(self) -> np.ndarray:
+        return self._rates
+
+    def _build(self):
+        if self._times.shape[0] == 1:
+            self._coeffs = np.array([[self._rates[0], 0.0, 0.0, 0.0]])
+            self._knots = np.array([self._times[0], self._times[0] + 1.0])
+        else:
+            if self.interpolation == "cubic":
+                self._coeffs = natural_cubic_coefficients(self._times, self._rates)
+            else:
+                self._coeffs = linear_coefficients(self._times, self._rates)
+            self._knots = self._times
+
+        # Plain-Python copies for the scalar fast path
+        self._knots_list = self._knots.tolist()
+        self._coeffs_list = [tuple(c) for c in self._coeffs.tolist()]
+
+    def zero_rate(self, t):
+        """
+        Zero rate to time t. Accepts a scalar (returns float) or an array.
+        """
+        if self._coeffs is None:
+            self._build()
+
+        if np.ndim(t) == 0:
+            knots = self._knots_list
+            t = min(max(float(t), knots[0]), knots[-1])
+            i = min(max(bisect_right(knots, t) - 1, 0), len(knots) - 2)
+            c0, c1, c2, c3 = self._coeffs_list[i]
+            h = t - knots[i]
+            return c0 + h * (c1 + h * (c2 + h * c3))
+
+        return evaluate_piecewise(self._knots, self._coeffs, np.asarray(t, dtype=float))
+
+    def discount(self, t):
+        """
+        Discount factor exp(-r(t) * t). Accepts a scalar or an array.
+        """
+        if np.ndim(t) == 0:
+            return exp(-self.zero_rate(t) * t)
+
+        t = np.asarray(t, dtype=float)
+        return np.exp(-self.zero_rate(t) * t)
+
+    def forward_rate(self, t1, t2):
+        """
+        Continuously-compounded forward rate between t1 and t2 (t2 > t1).
+        """
+        return (self.zero_rate(t2) * t2 - self.zero_rate(t1) * t1) / (np.asarray(t2) - np.asarray(t1))
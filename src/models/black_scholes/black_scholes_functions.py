@@ -1,25 +1,27 @@
 # src/utils/black_scholes_functions.py
 import math
 from math import exp, sqrt, log
-from scipy.stats import norm
 import numpy as np
 
+from src.utils.stats import norm
+from src.instruments.option_types import OptionType, BarrierType, IN_FLAG, DOWN_FLAG
+
 def d1(S, K, T, r, q, sigma):
     return (log(S/K) + (r - q + 0.5*sigma**2)*T) / (sigma*sqrt(T))
 
 def d2(S, K, T, r, q, sigma):
     return d1(S, K, T, r, q, sigma) - sigma*sqrt(T)
 
-def vanilla_option_price_bs(S: float, K: float, T: float, r: float, q: float, sigma: float, option_type: str) -> float:
+def vanilla_option_price_bs(S: float, K: float, T: float, r: float, q: float, sigma: float,
+                            option_type: str | OptionType) -> float:
+    option_type = OptionType.parse(option_type)
     _d1 = d1(S, K, T, r, q, sigma)
     _d2 = _d1 - sigma*sqrt(T)
 
-    if option_type.lower() == "call":
+    if option_type is OptionType.CALL:
         return S * exp(-q * T) * norm.cdf(_d1) - K * exp(-r * T) * norm.cdf(_d2)
-    elif option_type.lower() == "put":
-        return K*exp(-r*T)*norm.cdf(-_d2) - S*exp(-q*T)*norm.cdf(-_d1)
     else:
-        raise ValueError("Option type must be either 'call' or 'put'")
+        return K*exp(-r*T)*norm.cdf(-_d2) - S*exp(-q*T)*norm.cdf(-_d1)
 
 def alpha(r, q, sigma):
     return (1 - (r - q) / (sigma**2 / 2)) / 2
@@ -27,21 +29,23 @@ def alpha(r, q, sigma):
 def S_tilde(S, B):
     return B**2 / S
 
-def barrier_option_price_bs(S: float, K: float, T: float, r: float, q: float, sigma: float, B: float, option_type: str,
-                            barrier_type: str) -> float:
+def barrier_option_price_bs(S: float, K: float, T: float, r: float, q: float, sigma: float, B: float,
+                            option_type: str | OptionType, barrier_type: str | BarrierType) -> float:
+    option_type = OptionType.parse(option_type)
+    barrier_type = BarrierType.parse(barrier_type)
     a = alpha(r, q, sigma)
 
-    if option_type.lower() == "call":
-        if barrier_type.lower().startswith("down"):
+    if option_type is OptionType.CALL:
+        if barrier_type.is_down:
             if B <= K:
                 call_1 = vanilla_option_price_bs(S, K, T, r, q, sigma, option_type)
                 call_2 = vanilla_option_price_bs(S_tilde(S, B), K, T, r, q, sigma, option_type)
 
                 out_option = call_1 - (S / B)**(2 * a) * call_2
 
-                if barrier_type.lower().endswith("in"):
+                if barrier_type.is_in:
                     return call_1 - out_option
-                elif barrier_type.lower().endswith("out"):
+                elif barrier_type.is_out:
                     return out_option
             elif B > K:
                 vanilla_call = vanilla_option_price_bs(S, K, T, r, q, sigma, option_type)
@@ -54,23 +58,23 @@ def barrier_option_price_bs(S: float, K: float, T: float, r: float, q: float, si
 
                 out_option = call_1 + (B - K) * digital_call_1 - (S / B) ** (2 * a) * (call_2 + (B - K) * digital_call_2)
 
-                if barrier_type.lower().endswith("in"):
+                if barrier_type.is_in:
                     return vanilla_call - out_option
-                elif barrier_type.lower().endswith("out"):
+                elif barrier_type.is_out:
                     return out_option
-        elif barrier_type.lower().startswith("up"):
+        elif barrier_type.is_up:
             if B <= K:
                 raise ValueError("The price of the up-and-out barrier call option vanishes when B <= K.")
             elif B > K:
                 # line 1
                 vanilla_call = vanilla_option_price_bs(S, K, T, r, q, sigma, option_type)
                 d1_1 = d1(S, B, T, r, q, sigma)
-                line1 = vanilla_call - S * norm.cdf(d1_1)
+                line1 = vanilla_call - S * exp(-q * T) * norm.cdf(d1_1)
 
                 # line 2
                 d1_2 = d1(B**2, K * S, T, r, q, sigma)
                 d1_3 = d1(B, S, T, r, q, sigma)
-                line2 = -B * (B / S)**(2 * r / sigma**2) * (norm.cdf(d1_2) - norm.cdf(d1_3))
+                line2 = -B * exp(-q * T) * (B / S)**(2 * (r - q) / sigma**2) * (norm.cdf(d1_2) - norm.cdf(d1_3))
 
                 # line 3
                 d2_1 = d2(S, B, T, r, q, sigma)
@@ -79,27 +83,27 @@ def barrier_option_price_bs(S: float, K: float, T: float, r: float, q: float, si
                 # line 4
                 d2_2 = d2(B**2, K * S, T, r, q, sigma)
                 d2_3 = d2(B, S, T, r, q, sigma)
-                line4 = np.exp(-r * T) * K * (S / B)**(1 - 2 * r / sigma**2) * (norm.cdf(d2_2) - norm.cdf(d2_3))
+                line4 = np.exp(-r * T) * K * (S / B)**(1 - 2 * (r - q) / sigma**2) * (norm.cdf(d2_2) - norm.cdf(d2_3))
 
                 out_option = line1 + line2 + line3 + line4
 
 
-                if barrier_type.lower().endswith("in"):
+                if barrier_type.is_in:
                     return vanilla_call - out_option
-                elif barrier_type.lower().endswith("out"):
+                elif barrier_type.is_out:
                     return out_option
-    elif option_type.lower() == "put":
-        if barrier_type.lower().startswith("down"):
+    elif option_type is OptionType.PUT:
+        if barrier_type.is_down:
             if B <= K:
                 # line 1
                 vanilla_put = vanilla_option_price_bs(S, K, T, r, q, sigma, option_type)
                 d1_1 = d1(S, B, T, r, q, sigma)
-                line1 = vanilla_put + S * norm.cdf(-d1_1)
+                line1 = vanilla_put + S * exp(-q * T) * norm.cdf(-d1_1)
 
                 # line 2
                 d1_2 = d1(B**2, K * S, T, r, q, sigma)
                 d1_3 = d1(B, S, T, r, q, sigma)
-                line2 = -B * (B / S)**(2 * r / sigma**2) * (norm.cdf(d1_2) - norm.cdf(d1_3))
+                line2 = -B * exp(-q * T) * (B / S)**(2 * (r - q) / sigma**2) * (norm.cdf(d1_2) - norm.cdf(d1_3))
 
                 # line 3
                 d2_1 = d2(S, B, T, r, q, sigma)
@@ -108,21 +112,21 @@ def barrier_option_price_bs(S: float, K: float, T: float, r: float, q: float, si
                 # line 4
                 d2_2 = d2(B**2, K * S, T, r, q, sigma)
                 d2_3 = d2(B, S, T, r, q, sigma)
-                line4 = np.exp(-r * T) * K * (S / B)**(1 - 2 * r / sigma**2) * (norm.cdf(d2_2) - norm.cdf(d2_3))
+                line4 = np.exp(-r * T) * K * (S / B)**(1 - 2 * (r - q) / sigma**2) * (norm.cdf(d2_2) - norm.cdf(d2_3))
 
                 out_option = line1 + line2 + line3 + line4
 
-                if barrier_type.lower().endswith("in"):
+                if barrier_type.is_in:
                     return vanilla_put - out_option
-                elif barrier_type.lower().endswith("out"):
+                elif barrier_type.is_out:
                     return out_option
             elif B > K:
                 raise ValueError("B cannot be larger than K for down-and-in/out barrier put option.")
-        elif barrier_type.lower().startswith("up"):
+        elif barrier_type.is_up:
             if B <= K:
                 vanilla_put = vanilla_option_price_bs(S, K, T, r, q, sigma, option_type)
                 put_1 = vanilla_option_price_bs(S, B, T, r, q, sigma, option_type)
-                put_2 = vanilla_option_price_bs(S_tilde(S, B), K, T, r, q, sigma, option_type)
+                put_2 = vanilla_option_price_bs(S_tilde(S, B), B, T, r, q, sigma, option_type)
                 d2_1 = d2(S, B, T, r, q, sigma)
                 digital_put_1 = np.exp(-r * T) * norm.cdf(-d2_1)
                 d2_2 = d2(S_tilde(S, B), B, T, r, q, sigma)
@@ -130,9 +134,9 @@ def barrier_option_price_bs(S: float, K: float, T: float, r: float, q: float, si
 
                 out_option = put_1 + (K - B) * digital_put_1 - (S / B) ** (2 * a) * (put_2 + (K - B) * digital_put_2)
 
-                if barrier_type.lower().endswith("in"):
+                if barrier_type.is_in:
                     return vanilla_put - out_option
-                elif barrier_type.lower().endswith("out"):
+                elif barrier_type.is_out:
                     return out_option
             elif B > K:
                 put_1 = vanilla_option_price_bs(S, K, T, r, q, sigma, option_type)
@@ -140,11 +144,119 @@ def barrier_option_price_bs(S: float, K: float, T: float, r: float, q: float, si
 
                 out_option = put_1 - (S / B)**(2 * a) * put_2
 
-                if barrier_type.lower().endswith("in"):
+                if barrier_type.is_in:
                     return put_1 - out_option
-                elif barrier_type.lower().endswith("out"):
+                elif barrier_type.is_out:
                     return out_option
 
 
+def geometric_asian_option_price_bs(S: float, K: float, T: float, r: float, q: float, sigma: float,
+                                    n_fixings: int, option_type: str | OptionType) -> float:
+    """
+    Fixed-strike geometric Asian option with n_fixings equally spaced fixings
+    t_i = i T / n, i = 1..n. Under GBM, log G is normal with
+    mean log S + (r - q - sigma^2 / 2) T (n + 1) / (2n) and
+    variance sigma^2 T (n + 1)(2n + 1) / (6 n^2).
+    """
+    option_type = OptionType.parse(option_type)
+    n = n_fixings
+    mean = log(S) + (r - q - 0.5 * sigma ** 2) * T * (n + 1) / (2 * n)
+    std = sigma * sqrt(T * (n + 1) * (2 * n + 1) / (6 * n ** 2))
+    forward = exp(mean + 0.5 * std ** 2)
+    _d2 = (mean - log(K)) / std
+    _d1 = _d2 + std
+
+    if option_type is OptionType.CALL:
+        return exp(-r * T) * (forward * norm.cdf(_d1) - K * norm.cdf(_d2))
+    else:
+        return exp(-r * T) * (K * norm.cdf(-_d2) - forward * norm.cdf(-_d1))
+
+
+def vanilla_option_price_bs_vec(S, K, T, r, q, sigma, is_call) -> np.ndarray:
+    """
+    Vectorized Black-Scholes (Garman-Kohlhagen with q = foreign rate) price.
+    All arguments broadcast; ``is_call`` is a boolean array.
+    """
+    sigma_sqrt_T = sigma * np.sqrt(T)
+    _d1 = (np.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / sigma_sqrt_T
+    _d2 = _d1 - sigma_sqrt_T
+    sign = np.where(is_call, 1.0, -1.0)
+    return sign * (S * np.exp(-q * T) * norm.cdf(sign * _d1) - K * np.exp(-r * T) * norm.cdf(sign * _d2))
+
+
+def barrier_option_price_bs_vec(S, K, T, r, q, sigma, B, is_call, is_down, is_in) -> np.ndarray:
+    """
+    Vectorized counterpart of barrier_option_price_bs for arrays of mixed
+    option/barrier types, given as boolean arrays ``is_call``, ``is_down`` and
+    ``is_in``. All arguments broadcast together.
+
+    Down calls and up puts use the reflection principle; up calls and down
+    puts use the closed forms of Hull (Options, Futures and Other Derivatives).
+    """
+    S, K, T, r, q, sigma, B, is_call, is_down, is_in = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (S, K, T, r, q, sigma, B)),
+        *(np.asarray(x, dtype=bool) for x in (is_call, is_down, is_in)))
+
+    if np.any(is_call & ~is_down & (B <= K)):
+        raise ValueError("The price of the up-and-out barrier call option vanishes when B <= K.")
+    if np.any(~is_call & is_down & (B > K)):
+        raise ValueError("B cannot be larger than K for down-and-in/out barrier put option.")
+
+    sign = np.where(is_call, 1.0, -1.0)
+    df_r, df_q = np.exp(-r * T), np.exp(-q * T)
+    sigma_sqrt_T = sigma * np.sqrt(T)
+    vanilla = vanilla_option_price_bs_vec(S, K, T, r, q, sigma, is_call)
+    out_option = np.empty_like(vanilla)
+
+    # Down calls and up puts: reflect the payoff restricted to the far side of the barrier
+    reflect = is_call == is_down
+    if np.any(reflect):
+        s, k, t, rr, qq, v, b, c = (x[reflect] for x in (S, K, T, r, q, sigma, B, is_call))
+        sg = sign[reflect]
+        s_tilde = S_tilde(s, b)
+        # If the strike lies beyond the barrier, split the payoff at B into a
+        # vanilla struck at B plus a digital paying |B - K|
+        far = np.where(c, b > k, b < k)
+        k_eff = np.where(far, b, k)
+        gap = np.where(far, np.abs(b - k), 0.0)
+
+        def digital(x):
+            _d2 = (np.log(x / b) + (rr - qq - 0.5 * v ** 2) * t) / (v * np.sqrt(t))
+            return np.exp(-rr * t) * norm.cdf(sg * _d2)
+
+        near_leg = vanilla_option_price_bs_vec(s, k_eff, t, rr, qq, v, c) + gap * digital(s)
+        far_leg = vanilla_option_price_bs_vec(s_tilde, k_eff, t, rr, qq, v, c) + gap * digital(s_tilde)
+        out_option[reflect] = near_leg - (s / b) ** (2 * alpha(rr, qq, v)) * far_leg
+
+    # Up calls (B > K) and down puts (B <= K)
+    closed = ~reflect
+    if np.any(closed):
+        s, k, t, rr, qq, v, b = (x[closed] for x in (S, K, T, r, q, sigma, B))
+        sg, dr, dq, vst = sign[closed], df_r[closed], df_q[closed], sigma_sqrt_T[closed]
+        lam = (rr - qq + 0.5 * v ** 2) / v ** 2
+
+        x1 = (np.log(s / b) + lam * v ** 2 * t) / vst
+        y = (np.log(b ** 2 / (k * s)) + lam * v ** 2 * t) / vst
+        y1 = (np.log(b / s) + lam * v ** 2 * t) / vst
+
+        out_option[closed] = (vanilla[closed]
+                              - sg * s * dq * norm.cdf(sg * x1)
+                              + sg * k * dr * norm.cdf(sg * (x1 - vst))
+                              - s * dq * (b / s) ** (2 * lam) * (norm.cdf(y) - norm.cdf(y1))
+                              + k * dr * (b / s) ** (2 * lam - 2) * (norm.cdf(y - vst) - norm.cdf(y1 - vst)))
+
+    return np.where(is_in, vanilla - out_option, out_option)
+
+
+def barrier_option_price_bs_codes(S, K, T, r, q, sigma, B, option_codes, barrier_codes) -> np.ndarray:
+    """
+    barrier_option_price_bs_vec for a book given as integer OptionType and
+    BarrierType code arrays (see src.instruments.option_types).
+    """
+    barrier_codes = np.asarray(barrier_codes)
+    return barrier_option_price_bs_vec(S, K, T, r, q, sigma, B, np.asarray(option_codes) == OptionType.CALL,
+                                       (barrier_codes & DOWN_FLAG) != 0, (barrier_codes & IN_FLAG) != 0)
+
+
 if __name__ == "__main__":
     option_price = barrier_option_price_bs(100, 90, 1, 0.02, 0.0, 0.2, 120, "call", "up-and-out")
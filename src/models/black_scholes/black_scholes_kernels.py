@@ -0,0 +1,73 @@
+# src/models/black_scholes/black_scholes_kernels.py
+"""
+Scalar Black-Scholes kernels for low-latency single-option pricing.
+
+Same formulas as barrier_option_price_bs_vec, on floats and booleans only
+(no option-type strings, no NumPy dispatch), so they can be compiled with
+Numba. Use them through ``get_kernels(build, backend)`` from src.utils.jit.
+"""
+import math
+
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
+
+def build(jit):
+    """Return (vanilla, barrier) kernels decorated with ``jit``."""
+
+    @jit
+    def norm_cdf(x):
+        return 0.5 * math.erfc(-x * _INV_SQRT2)
+
+    @jit
+    def vanilla(S, K, T, r, q, sigma, is_call):
+        sigma_sqrt_T = sigma * math.sqrt(T)
+        d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sigma_sqrt_T
+        d2 = d1 - sigma_sqrt_T
+        sign = 1.0 if is_call else -1.0
+        return sign * (S * math.exp(-q * T) * norm_cdf(sign * d1) - K * math.exp(-r * T) * norm_cdf(sign * d2))
+
+    @jit
+    def digital(S, B, T, r, q, sigma, sign):
+        # Cash-or-nothing paying 1 when sign * (S_T - B) > 0
+        d2 = (math.log(S / B) + (r - q - 0.5 * sigma * sigma) * T) / (sigma * math.sqrt(T))
+        return math.exp(-r * T) * norm_cdf(sign * d2)
+
+    @jit
+    def barrier(S, K, T, r, q, sigma, B, is_call, is_down, is_in):
+        if is_call and not is_down and B <= K:
+            raise ValueError("The price of the up-and-out barrier call option vanishes when B <= K.")
+        if not is_call and is_down and B > K:
+            raise ValueError("B cannot be larger than K for down-and-in/out barrier put option.")
+
+        sign = 1.0 if is_call else -1.0
+        vanilla_price = vanilla(S, K, T, r, q, sigma, is_call)
+
+        if is_call == is_down:
+            # Down calls and up puts: reflection, splitting the payoff at B
+            # into a vanilla struck at B plus a digital when K lies beyond B
+            far = B > K if is_call else B < K
+            k_eff = B if far else K
+            gap = abs(B - K) if far else 0.0
+            s_tilde = B * B / S
+            near_leg = vanilla(S, k_eff, T, r, q, sigma, is_call) + gap * digital(S, B, T, r, q, sigma, sign)
+            far_leg = (vanilla(s_tilde, k_eff, T, r, q, sigma, is_call)
+                       + gap * digital(s_tilde, B, T, r, q, sigma, sign))
+            a = (1.0 - (r - q) / (0.5 * sigma * sigma)) / 2.0
+            out_option = near_leg - (S / B) ** (2.0 * a) * far_leg
+        else:
+            # Up calls (B > K) and down puts (B <= K), Hull's closed forms
+            df_r, df_q = math.exp(-r * T), math.exp(-q * T)
+            vst = sigma * math.sqrt(T)
+            lam = (r - q + 0.5 * sigma * sigma) / (sigma * sigma)
+            x1 = (math.log(S / B) + lam * sigma * sigma * T) / vst
+            y = (math.log(B * B / (K * S)) + lam * sigma * sigma * T) / vst
+            y1 = (math.log(B / S) + lam * sigma * sigma * T) / vst
+            out_option = (vanilla_price
+                          - sign * S * df_q * norm_cdf(sign * x1)
+                          + sign * K * df_r * norm_cdf(sign * (x1 - vst))
+                          - S * df_q * (B / S) ** (2.0 * lam) * (norm_cdf(y) - norm_cdf(y1))
+                          + K * df_r * (B / S) ** (2.0 * lam - 2.0) * (norm_cdf(y - vst) - norm_cdf(y1 - vst)))
+
+        return vanilla_price - out_option if is_in else out_option
+
+    return vanilla, barrier
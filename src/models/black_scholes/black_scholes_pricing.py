@@ -1,23 +1,51 @@
 # src/models/black_scholes_pricing.py
+import numpy as np
+
 from src.models.pricing_engine_base import PricingEngine
-from src.models.black_scholes.black_scholes_functions import *
+from src.models.black_scholes.black_scholes_functions import (vanilla_option_price_bs, barrier_option_price_bs,
+                                                              vanilla_option_price_bs_vec, barrier_option_price_bs_codes)
+from src.instruments.option_types import OptionType, option_type_codes, barrier_type_codes
+from src.instruments.vanilla_option import VanillaOption
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.fx_option import FXBarrierOption
+from src.market_data.yield_curve import YieldCurve
+from src.market_data.vol_surface import VolSurface
+from src.market_data.local_vol import LocalVolSurface
+from src.market_data.market import Market
+from src.utils.instrumentation import phase, CLOSED_FORM
+from src.utils.jit import get_kernels, validate_backend
+from src.models.black_scholes import black_scholes_kernels
 
 
 # Hypothetical helper modules with standard BS formula components
 
 class BlackScholesEngine(PricingEngine):
     def __init__(self,
-                 interest_rate: float,
-                 volatility: float,
+                 interest_rate: float | YieldCurve,
+                 volatility: float | VolSurface,
                  spot_price: float,
-                 dividend_yield: float = 0.0):
+                 dividend_yield: float = 0.0,
+                 market: Market = None,
+                 backend: str = "python"):
         """
-        A simple Black-Scholes engine, ignoring term structures for brevity.
+        A simple Black-Scholes engine. Term structures are supported by reading
+        the zero rate and implied vol for each option's strike and maturity.
+        ``market`` supplies FX rates, currency curves and pair vol surfaces for
+        FX options (see PricingEngine._fx_inputs).
+
+        ``backend="numba"`` prices single options with the scalar kernels of
+        black_scholes_kernels compiled by Numba (interpreted if Numba is not
+        installed) instead of the reference formulas.
         """
+        if isinstance(volatility, LocalVolSurface):
+            raise ValueError("Black-ScholesEngine needs implied volatilities; use the PDE or Monte Carlo engine with a local-vol surface.")
         self.r = interest_rate
         self.sigma = volatility
         self.S0 = spot_price
         self.q = dividend_yield
+        self.market = market
+        self.backend = validate_backend(backend)
+        self._kernels = None if self.backend == "python" else get_kernels(black_scholes_kernels.build, self.backend)
 
     def price_vanilla_option(self, vanilla_option):
         # Use the standard European BS formula
@@ -27,19 +55,147 @@ class BlackScholesEngine(PricingEngine):
         T = vanilla_option.maturity
         K = vanilla_option.strike
 
-        return vanilla_option_price_bs(self.S0, K, T, self.r, self.q, self.sigma, vanilla_option.option_type)
+        r = self._zero_rate(T)
+        sigma = self._implied_vol(K, T)
+
+        with phase(CLOSED_FORM):
+            if self._kernels is not None:
+                return self._kernels[0](self.S0, K, T, r, self.q, sigma, vanilla_option.option_type.is_call)
+            return vanilla_option_price_bs(self.S0, K, T, r, self.q, sigma, vanilla_option.option_type)
 
     def price_barrier_option(self, barrier_option):
         T = barrier_option.maturity
         K = barrier_option.strike
         B = barrier_option.barrier_level
 
-        return barrier_option_price_bs(self.S0, K, T, self.r, self.q, self.sigma, B, barrier_option.option_type, barrier_option.barrier_type)
+        r = self._zero_rate(T)
+        sigma = self._implied_vol(K, T)
+
+        with phase(CLOSED_FORM):
+            if self._kernels is not None:
+                return self._barrier_kernel(self.S0, K, T, r, self.q, sigma, B, barrier_option.option_type,
+                                            barrier_option.barrier_type)
+            return barrier_option_price_bs(self.S0, K, T, r, self.q, sigma, B, barrier_option.option_type,
+                                           barrier_option.barrier_type)
 
     def price_fx_barrier_option(self, fx_barrier_option):
-        # Possibly adapt the Domestic/Foreign currency logic
-        raise NotImplementedError("FX barrier option pricing not yet implemented in Black-ScholesEngine.")
+        """
+        Garman-Kohlhagen price of an FX barrier option: the premium for the
+        option's notional, in its premium currency.
+        """
+        T = fx_barrier_option.maturity
+        K = fx_barrier_option.strike
+        B = fx_barrier_option.barrier_level
+        spot, r_d, r_f, sigma = self._fx_inputs(fx_barrier_option.foreign_ccy, fx_barrier_option.domestic_ccy, K, T)
+
+        with phase(CLOSED_FORM):
+            if self._kernels is not None:
+                price = self._barrier_kernel(spot, K, T, r_d, r_f, sigma, B, fx_barrier_option.option_type,
+                                             fx_barrier_option.barrier_type)
+            else:
+                price = barrier_option_price_bs(spot, K, T, r_d, r_f, sigma, B, fx_barrier_option.option_type,
+                                                fx_barrier_option.barrier_type)
+        premium_in_foreign = fx_barrier_option.premium_ccy == fx_barrier_option.foreign_ccy
+        return float(self._fx_premium(price, spot, fx_barrier_option.notional, premium_in_foreign))
+
+    def _barrier_kernel(self, S, K, T, r, q, sigma, B, option_type, barrier_type):
+        return self._kernels[1](S, K, T, r, q, sigma, B, option_type.is_call, barrier_type.is_down, barrier_type.is_in)
+
+    def price_fx_barrier_options(self, fx_barrier_options) -> np.ndarray:
+        """
+        Vectorized Garman-Kohlhagen pricing of an FX barrier book. Options are
+        grouped by currency pair, so the FX rate, both currency curves and the
+        pair's vol surface are resolved once per pair; pricing, notional
+        scaling and premium-currency conversion are one array pass per pair.
+        """
+        premiums = np.empty(len(fx_barrier_options))
+
+        groups = {}
+        for i, option in enumerate(fx_barrier_options):
+            groups.setdefault((option.foreign_ccy, option.domestic_ccy), []).append(i)
+
+        for (foreign_ccy, domestic_ccy), idx in groups.items():
+            options = [fx_barrier_options[i] for i in idx]
+            K = np.array([o.strike for o in options], dtype=float)
+            T = np.array([o.maturity for o in options], dtype=float)
+            B = np.array([o.barrier_level for o in options], dtype=float)
+            notional = np.array([o.notional for o in options], dtype=float)
+            option_codes = option_type_codes(options)
+            barrier_codes = barrier_type_codes(options)
+            premium_in_foreign = np.array([o.premium_ccy == foreign_ccy for o in options])
+
+            spot, r_d, r_f, sigma = self._fx_inputs(foreign_ccy, domestic_ccy, K, T)
+            with phase(CLOSED_FORM):
+                prices = barrier_option_price_bs_codes(spot, K, T, r_d, r_f, sigma, B, option_codes, barrier_codes)
+            premiums[idx] = self._fx_premium(prices, spot, notional, premium_in_foreign)
+
+        return premiums
+
+    def price_batch(self, instruments) -> list:
+        """
+        Price a list of instruments with one vectorized formula call per
+        instrument kind (European vanillas, barriers, FX barriers); anything
+        else is priced one by one.
+        """
+        prices = [None] * len(instruments)
+        vanillas, barriers, fx_barriers = [], [], []
+        for i, instrument in enumerate(instruments):
+            if type(instrument) is VanillaOption and instrument.exercise_style.lower() == "european":
+                vanillas.append(i)
+            elif type(instrument) is BarrierOption:
+                barriers.append(i)
+            elif type(instrument) is FXBarrierOption:
+                fx_barriers.append(i)
+            else:
+                prices[i] = instrument.accept_pricer(self)
+
+        for idx in (vanillas, barriers):
+            if not idx:
+                continue
+            options = [instruments[i] for i in idx]
+            K = np.array([o.strike for o in options], dtype=float)
+            T = np.array([o.maturity for o in options], dtype=float)
+            r = self._zero_rate(T)
+            sigma = self._implied_vol(K, T)
+            option_codes = option_type_codes(options)
+            with phase(CLOSED_FORM):
+                if idx is vanillas:
+                    values = vanilla_option_price_bs_vec(self.S0, K, T, r, self.q, sigma, option_codes == OptionType.CALL)
+                else:
+                    B = np.array([o.barrier_level for o in options], dtype=float)
+                    values = barrier_option_price_bs_codes(self.S0, K, T, r, self.q, sigma, B, option_codes,
+                                                           barrier_type_codes(options))
+            for i, value in zip(idx, values):
+                prices[i] = float(value)
+
+        if fx_barriers:
+            values = self.price_fx_barrier_options([instruments[i] for i in fx_barriers])
+            for i, value in zip(fx_barriers, values):
+                prices[i] = float(value)
+        return prices
+
+    def price_option_book(self, book) -> np.ndarray:
+        """
+        Price a columnar OptionBook (see src.instruments.option_book) in one
+        vectorized pass per kind, without building instrument objects.
+        """
+        prices = np.empty(len(book))
+        r = self._zero_rate(book.maturity)
+        sigma = np.broadcast_to(self._implied_vol(book.strike, book.maturity), (len(book),))
+        r = np.broadcast_to(r, (len(book),))
+        barrier = book.is_barrier
+        vanilla = ~barrier
+        with phase(CLOSED_FORM):
+            prices[vanilla] = vanilla_option_price_bs_vec(self.S0, book.strike[vanilla], book.maturity[vanilla],
+                                                          r[vanilla], self.q, sigma[vanilla],
+                                                          book.option_type[vanilla] == OptionType.CALL)
+            prices[barrier] = barrier_option_price_bs_codes(self.S0, book.strike[barrier], book.maturity[barrier],
+                                                            r[barrier], self.q, sigma[barrier],
+                                                            book.barrier_level[barrier], book.option_type[barrier],
+                                                            book.barrier_type[barrier])
+        return prices
 
     def price_variance_swap_swaption(self, variance_swaption):
         # Possibly adapt the Domestic/Foreign currency logic
         raise NotImplementedError("FX barrier option pricing not yet implemented in Black-ScholesEngine.")
+
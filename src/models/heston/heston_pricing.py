@@ -0,0 +1,128 @@
+# src/models/heston/heston_pricing.py
+import numpy as np
+
+from src.models.pricing_engine_base import PricingEngine
+from src.models.heston.heston_functions import (heston_char_func, heston_cumulants, cos_series_weights,
+                                                vanilla_option_strip_price_cos, simulate_paths_heston_qe)
+from src.models.monte_carlo.monte_carlo_functions import barrier_option_price_mc
+from src.market_data.yield_curve import YieldCurve
+from src.instruments.option_types import OptionType
+from src.utils.instrumentation import phase, record, PATH_GENERATION, PAYOFF_REDUCTION, MATRIX_BUILD
+
+
+class HestonEngine(PricingEngine):
+    def __init__(self,
+                 interest_rate: float | YieldCurve,
+                 spot_price: float,
+                 v0: float,
+                 kappa: float,
+                 theta: float,
+                 vol_of_vol: float,
+                 rho: float,
+                 dividend_yield: float = 0.0,
+                 n_cos_terms: int = 256,
+                 truncation_width: float = 20.0,
+                 n_paths: int = 10000,
+                 n_steps: int = 252):
+        """
+        Heston stochastic-volatility engine.
+
+        European vanillas are priced with the COS method: the characteristic
+        function is evaluated once per maturity (and set of inputs) and cached, and a whole strike
+        strip is then priced with one matrix-vector product. Barrier options
+        are priced by Monte Carlo with Andersen's QE scheme.
+
+        Parameters
+        ----------
+        interest_rate : float or YieldCurve
+            The risk-free interest rate (r).
+        spot_price : float
+            Current spot price (S0).
+        v0, kappa, theta, vol_of_vol, rho : float
+            Initial variance, mean-reversion speed, long-run variance,
+            volatility of variance and spot/variance correlation.
+        dividend_yield : float, optional
+            Continuous dividend yield (q). Defaults to 0.0.
+        n_cos_terms : int, optional
+            Number of cosine terms in the expansion.
+        truncation_width : float, optional
+            Width of the truncation range in standard deviations of log(S_T/S_0).
+        """
+        self.r = interest_rate
+        self.S0 = spot_price
+        self.q = dividend_yield
+        self.v0 = v0
+        self.kappa = kappa
+        self.theta = theta
+        self.vol_of_vol = vol_of_vol
+        self.rho = rho
+        self.n_cos_terms = n_cos_terms
+        self.truncation_width = truncation_width
+        self.n_paths = n_paths
+        self.n_steps = n_steps
+        self._cos_cache = {}
+
+    def _model_params(self):
+        return self.v0, self.kappa, self.theta, self.vol_of_vol, self.rho
+
+    def _cos_weights(self, T: float):
+        """
+        COS weights, frequencies and truncation range for maturity T, cached on
+        everything they depend on, so that curve updates and parameter changes
+        are picked up.
+        """
+        r = self._zero_rate(T)
+        key = (T, float(r), self.q, self._model_params(), self.n_cos_terms, self.truncation_width)
+        cached = self._cos_cache.get(key)
+        if cached is not None:
+            return cached
+
+        c1, c2 = heston_cumulants(T, r, self.q, *self._model_params())
+        half_width = self.truncation_width * np.sqrt(c2)
+        a, b = c1 - half_width, c1 + half_width
+
+        with phase(MATRIX_BUILD):
+            u = np.arange(self.n_cos_terms) * np.pi / (b - a)
+            phi = heston_char_func(u, T, r, self.q, *self._model_params())
+            cached = (cos_series_weights(phi, u, a), u, a, b)
+        self._cos_cache[key] = cached
+        return cached
+
+    def price_vanilla_strip(self, strikes, maturity: float, option_type: str | OptionType) -> np.ndarray:
+        """
+        Price European options on a whole strike strip for one maturity.
+        """
+        weights, u, a, b = self._cos_weights(maturity)
+        r = self._zero_rate(maturity)
+        strikes = np.atleast_1d(strikes)
+        record(n_cos_terms=self.n_cos_terms, n_strikes=strikes.shape[0])
+        with phase(PAYOFF_REDUCTION):
+            return vanilla_option_strip_price_cos(self.S0, strikes, maturity, r, self.q,
+                                                  option_type, weights, u, a, b)
+
+    def price_vanilla_option(self, vanilla_option) -> float:
+        if vanilla_option.exercise_style.lower() != "european":
+            raise NotImplementedError("HestonEngine only supports European style in this example.")
+
+        return float(self.price_vanilla_strip([vanilla_option.strike], vanilla_option.maturity,
+                                              vanilla_option.option_type)[0])
+
+    def price_barrier_option(self, barrier_option) -> float:
+        T = barrier_option.maturity
+        r = self._zero_rate(T)
+
+        record(n_paths=self.n_paths, n_steps=self.n_steps)
+        with phase(PATH_GENERATION):
+            paths = simulate_paths_heston_qe(self.n_paths, self.n_steps, T, r, self.q, self.S0,
+                                             *self._model_params())
+
+        with phase(PAYOFF_REDUCTION):
+            return barrier_option_price_mc(paths, barrier_option.strike, T, r, barrier_option.barrier_level,
+                                           barrier_option.rebate, barrier_option.option_type,
+                                           barrier_option.barrier_type)
+
+    def price_fx_barrier_option(self, fx_barrier_option):
+        raise NotImplementedError("FX Barrier pricing not yet implemented in HestonEngine.")
+
+    def price_variance_swap_swaption(self, variance_swaption):
+        raise NotImplementedError("Variance swaption pricing not yet implemented in HestonEngine.")
@@ -1,10 +1,14 @@
 # src/utils/monte_carlo_functions.py
+import time
+
 import numpy as np
-from tqdm import tqdm
-from scipy.integrate import trapezoid
-from scipy.stats import norm
 
-def simulate_paths_gbm(n_paths: int, n_steps: int, T: float, r: float, q: float, sigma: float, S0: float) -> np.ndarray:
+from src.market_data.local_vol import LocalVolSurface
+from src.instruments.option_types import OptionType, BarrierType
+from src.utils.instrumentation import phase, record, PATH_GENERATION, PAYOFF_REDUCTION
+
+def simulate_paths_gbm(n_paths: int, n_steps: int, T: float, r: float, q: float, sigma: float, S0: float,
+                       z: np.ndarray = None, dtype=np.float64) -> np.ndarray:
     """
     Simulate paths for a Geometric Brownian Motion under the risk-neutral measure,
     using a log-Euler scheme for efficiency.
@@ -17,6 +21,15 @@ def simulate_paths_gbm(n_paths: int, n_steps: int, T: float, r: float, q: float,
         Number of discrete time steps per path.
     T : float
         Time to maturity (in years).
+    z : np.ndarray, optional
+        Standard normal draws of shape (n_paths, n_steps), e.g. a cached
+        memmap. Drawn from the global NumPy generator if not given.
+    dtype : np.float64 or np.float32, optional
+        Precision of the normals and of the paths. float32 halves the memory
+        traffic of large simulations; the log-paths of a few hundred steps
+        keep about 1e-6 relative accuracy, well below the Monte Carlo error.
+        float32 normals are drawn from a Generator seeded from the global
+        NumPy state, so np.random.seed still makes runs reproducible.
 
     Returns
     -------
@@ -24,107 +37,447 @@ def simulate_paths_gbm(n_paths: int, n_steps: int, T: float, r: float, q: float,
         A 2D array of shape (n_paths, n_steps+1). Each row is one simulated path
         from t=0 to t=T. paths[:,0] = S0.
     """
+    dtype = np.dtype(dtype)
     dt = T / n_steps
     # Random draws for the increments: shape (n_paths, n_steps)
-    z = np.random.normal(size=(n_paths, n_steps))
+    if z is None:
+        if dtype == np.float64:
+            z = np.random.normal(size=(n_paths, n_steps))
+        else:
+            rng = np.random.default_rng(np.random.randint(2 ** 63, dtype=np.int64))
+            z = rng.standard_normal((n_paths, n_steps), dtype=dtype)
 
     # (r - q - 0.5*sigma^2)*dt + sigma*sqrt(dt)*z
     drift = (r - q - 0.5 * sigma ** 2) * dt
     diffusion = sigma * np.sqrt(dt)
 
-    # Cumulative sum of log-increments
-    log_increments = drift + diffusion * z
-    log_paths = np.cumsum(log_increments, axis=1)
-
-    # Prepend a column of zeros for the initial log(S0)
-    # so that at t=0, log(S) = log(S0)
-    log_paths = np.hstack((np.zeros((n_paths, 1)), log_paths))
+    # Everything below works in place in the output array: column 0 holds
+    # log(S0/S0) = 0 and columns 1.. the cumulative sum of log-increments.
+    paths = np.empty((n_paths, n_steps + 1), dtype=dtype)
+    paths[:, 0] = 0.0
+    log_paths = paths[:, 1:]
+    np.multiply(z, diffusion, out=log_paths, casting="same_kind")
+    log_paths += drift
+    np.cumsum(log_paths, axis=1, out=log_paths)
 
     # Exponentiate and multiply by S0 to get price paths
-    paths = S0 * np.exp(log_paths)
+    np.exp(paths, out=paths)
+    paths *= S0
     return paths
 
 
-def vanilla_option_price_mc(paths: np.ndarray, strike: float, maturity: float, interest_rate: float, option_type: str) -> float:
-    S_T = paths[:, -1] # terminal prices
+def simulate_paths_local_vol(n_paths: int, n_steps: int, T: float, r: float, q: float,
+                             local_vol: LocalVolSurface, S0: float) -> np.ndarray:
+    """
+    Simulate risk-neutral paths under a local volatility sigma_loc(S, t) with a
+    log-Euler scheme. At every step the local vol of all paths is looked up in
+    one vectorized interpolation on the cached grid.
 
-    if option_type.lower() == "call":
-        return np.mean(np.maximum(S_T - strike, 0.0)) * np.exp(-interest_rate * maturity)
-    elif option_type.lower() == "put":
-        return np.mean(np.maximum(strike - S_T, 0.0)) * np.exp(-interest_rate * maturity)
-    else:
-        raise "Cannot recognise option type '{}'".format(option_type)
+    Returns
+    -------
+    paths : np.ndarray
+        A 2D array of shape (n_paths, n_steps+1), paths[:,0] = S0.
+    """
+    dt = T / n_steps
+    sqrt_dt = np.sqrt(dt)
 
-def barrier_option_price_mc(paths: np.ndarray, strike: float, maturity: float, interest_rate: float, barrier_level: float,
-                            rebate: float, option_type: str, barrier_type: str) -> float:
+    paths = np.empty((n_paths, n_steps + 1))
+    paths[:, 0] = S0
+    log_S = np.full(n_paths, np.log(S0))
+
+    for i in range(n_steps):
+        sigma = local_vol.local_vol(paths[:, i], i * dt)
+        z = np.random.normal(size=n_paths)
+        log_S += (r - q - 0.5 * sigma ** 2) * dt + sigma * sqrt_dt * z
+        np.exp(log_S, out=paths[:, i + 1])
+
+    return paths
+
+
+class MultiAssetPaths:
+    """
+    Output of simulate_paths_gbm_multi_asset: per-path, per-asset terminal
+    prices and running extrema (each of shape (n_paths, n_assets)), plus the
+    full paths of shape (n_paths, n_steps+1, n_assets) if they were kept.
+    """
+    def __init__(self, terminal: np.ndarray, running_max: np.ndarray, running_min: np.ndarray,
+                 paths: np.ndarray = None):
+        self.terminal = terminal
+        self.running_max = running_max
+        self.running_min = running_min
+        self.paths = paths
+
+
+def simulate_paths_gbm_multi_asset(n_paths: int, n_steps: int, T: float, r: float, S0, sigma, q,
+                                   correlation: np.ndarray, chunk_steps: int = 32, keep_paths: bool = False,
+                                   seed=None, dtype=np.float64) -> MultiAssetPaths:
+    """
+    Simulate correlated Geometric Brownian Motions under the risk-neutral
+    measure with a log-Euler scheme, streaming over time.
+
+    The correlation matrix is Cholesky-factorized once. Time is processed in
+    chunks of ``chunk_steps`` steps: the normals of a chunk, shape
+    (n_paths, chunk_steps, n_assets), are correlated with one batched matmul
+    and accumulated onto the current log-prices, and the running max/min of
+    every asset is updated. Unless ``keep_paths`` is set, only O(n_paths *
+    n_assets * chunk_steps) memory is used, whatever n_steps.
+
+    Parameters
+    ----------
+    n_paths : int
+        Number of Monte Carlo paths to simulate.
+    n_steps : int
+        Number of discrete time steps per path.
+    T : float
+        Time to maturity (in years).
+    r : float
+        Risk-free rate.
+    S0, sigma, q : array_like
+        Per-asset spot, volatility and continuous dividend yield (or the
+        foreign rate for quanto/FX legs), shape (n_assets,).
+    correlation : np.ndarray
+        (n_assets, n_assets) correlation matrix of the Brownian motions.
+    chunk_steps : int, optional
+        Time steps generated per chunk.
+    keep_paths : bool, optional
+        Also return the full paths (n_paths, n_steps+1, n_assets).
+    seed : int or np.random.Generator, optional
+        Source of the normals; drawn from a Generator seeded from the global
+        NumPy state if not given, so np.random.seed makes runs reproducible.
+    dtype : np.float64 or np.float32, optional
+        Precision of the normals and log-prices.
+
+    Returns
+    -------
+    MultiAssetPaths
+        Terminal prices and running extrema, shape (n_paths, n_assets).
+        The extrema include S0.
+    """
+    dtype = np.dtype(dtype)
+    S0 = np.atleast_1d(np.asarray(S0, dtype=float))
+    n_assets = S0.shape[0]
+    sigma = np.broadcast_to(np.asarray(sigma, dtype=float), (n_assets,))
+    q = np.broadcast_to(np.asarray(q, dtype=float), (n_assets,))
+    correlation = np.asarray(correlation, dtype=float)
+    if correlation.shape != (n_assets, n_assets) or not np.allclose(correlation, correlation.T):
+        raise ValueError(f"correlation must be a symmetric {n_assets}x{n_assets} matrix")
+    try:
+        cholesky = np.linalg.cholesky(correlation)
+    except np.linalg.LinAlgError:
+        raise ValueError("correlation matrix must be positive definite") from None
+
+    if seed is None:
+        seed = np.random.randint(2 ** 63, dtype=np.int64)
+    rng = np.random.default_rng(seed)
+
+    dt = T / n_steps
+    drift = ((r - q - 0.5 * sigma ** 2) * dt).astype(dtype)
+    # Cholesky factor scaled column-wise so that z @ loading gives sigma_j sqrt(dt) dW_j
+    loading = (cholesky.T * (sigma * np.sqrt(dt))).astype(dtype)
+
+    record(n_paths=n_paths, n_steps=n_steps, n_assets=n_assets)
+    with phase(PATH_GENERATION):
+        log_S = np.zeros((n_paths, n_assets), dtype=dtype)
+        log_max = np.zeros((n_paths, n_assets), dtype=dtype)
+        log_min = np.zeros((n_paths, n_assets), dtype=dtype)
+        paths = None
+        if keep_paths:
+            paths = np.empty((n_paths, n_steps + 1, n_assets), dtype=dtype)
+            paths[:, 0, :] = 0.0
+
+        for start in range(0, n_steps, chunk_steps):
+            k = min(chunk_steps, n_steps - start)
+            z = rng.standard_normal((n_paths, k, n_assets), dtype=dtype)
+            increments = z @ loading
+            increments += drift
+            np.cumsum(increments, axis=1, out=increments)
+            increments += log_S[:, None, :]
+
+            np.maximum(log_max, increments.max(axis=1), out=log_max)
+            np.minimum(log_min, increments.min(axis=1), out=log_min)
+            log_S[...] = increments[:, -1, :]
+            if keep_paths:
+                paths[:, start + 1:start + 1 + k, :] = increments
+
+        # Back to prices, in place
+        for log_array in (log_S, log_max, log_min):
+            np.exp(log_array, out=log_array)
+            log_array *= S0.astype(dtype)
+        if keep_paths:
+            np.exp(paths, out=paths)
+            paths *= S0.astype(dtype)
+
+    return MultiAssetPaths(log_S, log_max, log_min, paths)
+
+
+def vanilla_option_payoffs_mc(paths: np.ndarray, strike: float, maturity: float, interest_rate: float,
+                              option_type: str | OptionType) -> np.ndarray:
+    """Discounted payoff of every path."""
     S_T = paths[:, -1] # terminal prices
 
-    if option_type.lower() == "call":
-        vanilla_prices = np.maximum(S_T - strike, 0.0) * np.exp(-interest_rate * maturity)
-    elif option_type.lower() == "put":
-        vanilla_prices = np.maximum(strike - S_T, 0.0) * np.exp(-interest_rate * maturity)
+    if OptionType.parse(option_type) is OptionType.CALL:
+        return np.maximum(S_T - strike, 0.0) * np.exp(-interest_rate * maturity)
     else:
-        raise "Cannot recognise option type '{}'".format(option_type)
+        return np.maximum(strike - S_T, 0.0) * np.exp(-interest_rate * maturity)
 
-    if barrier_type.lower().startswith("up"):
+
+def vanilla_option_price_mc(paths: np.ndarray, strike: float, maturity: float, interest_rate: float,
+                            option_type: str | OptionType) -> float:
+    # Means are accumulated in float64 even for float32 paths
+    return np.mean(vanilla_option_payoffs_mc(paths, strike, maturity, interest_rate, option_type), dtype=np.float64)
+
+
+def barrier_option_payoffs_mc(paths: np.ndarray, strike: float, maturity: float, interest_rate: float,
+                              barrier_level: float, rebate: float, option_type: str | OptionType,
+                              barrier_type: str | BarrierType) -> np.ndarray:
+    """Discounted payoff of every path; the rebate is not discounted."""
+    barrier_type = BarrierType.parse(barrier_type)
+    vanilla_prices = vanilla_option_payoffs_mc(paths, strike, maturity, interest_rate, option_type)
+
+    if barrier_type.is_up:
         barrier_hit = np.any(paths >= barrier_level, axis=1)
-    elif barrier_type.lower().startswith("down"):
-        barrier_hit = np.any(paths <= barrier_level, axis=1)
     else:
-        raise "Cannot recognise barrier type '{}'".format(option_type)
+        barrier_hit = np.any(paths <= barrier_level, axis=1)
 
-    if barrier_type.lower().endswith("in"):
-        payoff = np.where(barrier_hit, vanilla_prices, rebate)
-    elif barrier_type.lower().endswith("out"):
-        payoff = np.where(~barrier_hit, vanilla_prices, rebate)
+    if barrier_type.is_in:
+        return np.where(barrier_hit, vanilla_prices, rebate)
     else:
-        raise "Cannot recognise barrier type '{}'".format(barrier_type)
+        return np.where(~barrier_hit, vanilla_prices, rebate)
+
+
+def barrier_option_price_mc(paths: np.ndarray, strike: float, maturity: float, interest_rate: float, barrier_level: float,
+                            rebate: float, option_type: str | OptionType, barrier_type: str | BarrierType) -> float:
+    payoff = barrier_option_payoffs_mc(paths, strike, maturity, interest_rate, barrier_level, rebate,
+                                       option_type, barrier_type)
+    return float(np.mean(payoff, dtype=np.float64))
+
+
+def barrier_option_payoffs_mc_streaming(n_paths: int, n_steps: int, T: float, r: float, q: float,
+                                        sigma: float | LocalVolSurface, S0: float, strike: float,
+                                        barrier_level: float, rebate: float, option_type: str | OptionType,
+                                        barrier_type: str | BarrierType, seed=None, dtype=np.float64) -> np.ndarray:
+    """
+    Discounted barrier payoff of every path (the rebate is not discounted), as
+    barrier_option_payoffs_mc, without storing the paths.
+
+    Only the current log-spot of every path is kept: it is advanced one
+    log-Euler step at a time and compared with the barrier, and a hit flag
+    per path records whether the barrier was touched (at S0 or any step).
+    Memory is O(n_paths) whatever n_steps, instead of the (n_paths, n_steps+1)
+    path matrix.
+
+    Parameters
+    ----------
+    sigma : float or LocalVolSurface
+        Flat volatility, or a local-vol surface looked up at every step.
+    seed : int or np.random.Generator, optional
+        Source of the normals, drawn one step (n_paths draws) at a time; from
+        a Generator seeded from the global NumPy state if not given, so
+        np.random.seed makes runs reproducible. The draws differ from those
+        of simulate_paths_gbm for the same seed.
+    dtype : np.float64 or np.float32, optional
+        Precision of the normals and log-spots (GBM only; local vol runs in
+        float64).
+
+    Returns
+    -------
+    np.ndarray
+        Payoffs of shape (n_paths,).
+    """
+    barrier_type = BarrierType.parse(barrier_type)
+    local_vol = sigma if isinstance(sigma, LocalVolSurface) else None
+    dtype = np.dtype(np.float64 if local_vol is not None else dtype)
+    if seed is None:
+        seed = np.random.randint(2 ** 63, dtype=np.int64)
+    rng = np.random.default_rng(seed)
+
+    dt = T / n_steps
+    sqrt_dt = np.sqrt(dt)
+    log_barrier = np.log(barrier_level / S0)
+    crossing = np.greater_equal if barrier_type.is_up else np.less_equal
+
+    record(n_paths=n_paths, n_steps=n_steps)
+    with phase(PATH_GENERATION):
+        log_S = np.zeros(n_paths, dtype=dtype)
+        hit = np.full(n_paths, crossing(0.0, log_barrier))
+        # Buffers reused at every step
+        z = np.empty(n_paths, dtype=dtype)
+        crossed = np.empty(n_paths, dtype=bool)
+        for i in range(n_steps):
+            rng.standard_normal(dtype=dtype, out=z)
+            if local_vol is None:
+                z *= sigma * sqrt_dt
+                z += (r - q - 0.5 * sigma ** 2) * dt
+            else:
+                vol = local_vol.local_vol(S0 * np.exp(log_S), i * dt)
+                z *= vol * sqrt_dt
+                z += (r - q - 0.5 * vol ** 2) * dt
+            log_S += z
+            crossing(log_S, log_barrier, out=crossed)
+            hit |= crossed
+
+        # Terminal prices, in place
+        np.exp(log_S, out=log_S)
+        log_S *= S0
+
+    with phase(PAYOFF_REDUCTION):
+        vanilla_prices = vanilla_option_payoffs_mc(log_S[:, None], strike, T, r, option_type)
+        return np.where(hit if barrier_type.is_in else ~hit, vanilla_prices, rebate)
+
+
+class RunningStats:
+    """
+    Running mean and variance of a stream of samples (Welford), updated one
+    batch at a time with the pairwise combination of Chan et al.
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, samples: np.ndarray):
+        n = samples.shape[0]
+        if n == 0:
+            return
+        batch_mean = float(np.mean(samples, dtype=np.float64))
+        batch_m2 = float(np.sum(np.square(samples - batch_mean, dtype=np.float64)))
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += batch_m2 + delta ** 2 * self.count * n / total
+        self.count = total
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else float("inf")
+
+    @property
+    def std_error(self) -> float:
+        return float(np.sqrt(self.variance / self.count)) if self.count > 1 else float("inf")
+
+
+class MCEstimate(float):
+    """
+    A Monte Carlo price that also carries how it was obtained. It behaves as
+    the price everywhere a float is expected; ValuationResult copies
+    ``estimate_info()`` into its additional_info.
+    """
+    def __new__(cls, value: float, std_error: float, n_paths: int, stop_reason: str, elapsed: float):
+        estimate = super().__new__(cls, value)
+        estimate.std_error = std_error
+        estimate.n_paths = n_paths
+        estimate.stop_reason = stop_reason
+        estimate.elapsed = elapsed
+        return estimate
+
+    def __reduce__(self):
+        return MCEstimate, (float(self), self.std_error, self.n_paths, self.stop_reason, self.elapsed)
 
-    return float(np.mean(payoff))
+    def estimate_info(self) -> dict:
+        return {"std_error": self.std_error, "n_paths": self.n_paths, "stop_reason": self.stop_reason,
+                "mc_time": self.elapsed}
+
+
+def adaptive_mc_estimate(sample_batch, batch_size: int, target_abs_error: float = None,
+                         target_rel_error: float = None, time_budget: float = None,
+                         max_paths: int = 10 ** 7) -> MCEstimate:
+    """
+    Mean of ``sample_batch(n)`` (n discounted payoffs per call), drawn in
+    batches until one of the stopping rules holds.
+
+    Parameters
+    ----------
+    sample_batch : callable
+        Returns a 1D array of n independent payoff samples.
+    batch_size : int
+        Samples per batch; the error is checked after every batch.
+    target_abs_error : float, optional
+        Stop once the standard error is at most this.
+    target_rel_error : float, optional
+        Stop once the standard error relative to |mean| is at most this.
+    time_budget : float, optional
+        Stop once this many seconds have been spent (checked between batches).
+    max_paths : int
+        Hard cap on the number of samples.
+
+    Returns
+    -------
+    MCEstimate
+        The mean, with its standard error, sample count, the rule that
+        stopped the run ("abs_error", "rel_error", "time_budget" or
+        "max_paths") and the time spent.
+    """
+    stats = RunningStats()
+    start = time.perf_counter()
+    while True:
+        stats.update(sample_batch(min(batch_size, max_paths - stats.count)))
+        std_error = stats.std_error
+        if target_abs_error is not None and std_error <= target_abs_error:
+            stop_reason = "abs_error"
+        elif target_rel_error is not None and std_error <= target_rel_error * abs(stats.mean):
+            stop_reason = "rel_error"
+        elif time_budget is not None and time.perf_counter() - start >= time_budget:
+            stop_reason = "time_budget"
+        elif stats.count >= max_paths:
+            stop_reason = "max_paths"
+        else:
+            continue
+        break
+
+    elapsed = time.perf_counter() - start
+    record(n_paths=stats.count, std_error=std_error)
+    return MCEstimate(stats.mean, std_error, stats.count, stop_reason, elapsed)
 
 
 def variance_swap_swaption_price_mc(var_swap_spot, K, r, T1, T2, params, n_paths, n_steps):
+    # Imported here so that importing the engines does not pay for tqdm and scipy.integrate
+    from tqdm import tqdm
+    from scipy.integrate import trapezoid
+
     nu, theta, k1, k2, rho = params['nu'], params['theta'], params['k1'], params['k2'], params['rho']
 
     dt = T1 / n_steps
+    record(n_paths=n_paths, n_steps=n_steps)
 
-    dW_t_1 = np.random.normal(loc=0, scale=np.sqrt(dt), size=(n_paths, n_steps))
-    dB_t   = np.random.normal(loc=0, scale=np.sqrt(dt), size=(n_paths, n_steps))
-    dW_t_2 = rho * dW_t_1 + np.sqrt(1 - rho**2) * dB_t
+    with phase(PATH_GENERATION):
+        dW_t_1 = np.random.normal(loc=0, scale=np.sqrt(dt), size=(n_paths, n_steps))
+        dB_t   = np.random.normal(loc=0, scale=np.sqrt(dt), size=(n_paths, n_steps))
+        dW_t_2 = rho * dW_t_1 + np.sqrt(1 - rho**2) * dB_t
 
-    def xi_t_u_func(u):
-        # Instantaneous VS Forward variances
-        xi_t_u = np.zeros((n_paths, n_steps + 1)) # t: 0 ~ T1 and u: T1 ~ T2
-        xi_t_u[:, 0] = var_swap_spot # xi_0_u = 0.2 by the given condition for any u
+        def xi_t_u_func(u):
+            # Instantaneous VS Forward variances
+            xi_t_u = np.zeros((n_paths, n_steps + 1)) # t: 0 ~ T1 and u: T1 ~ T2
+            xi_t_u[:, 0] = var_swap_spot # xi_0_u = 0.2 by the given condition for any u
 
-        alpha_theta = 1 / np.sqrt((1 - theta)**2 + theta**2 + 2 * rho * theta * (1-theta))
+            alpha_theta = 1 / np.sqrt((1 - theta)**2 + theta**2 + 2 * rho * theta * (1-theta))
 
-        for i in range(1, xi_t_u.shape[1]):
-            xi_t_u[:, i] = xi_t_u[:, i-1] + (2 * nu) * xi_t_u[:, i-1] * alpha_theta *\
-                         ((1 - theta) * np.exp(-k1 * (u - dt * (i-1))) * dW_t_1[:, i-1]\
-                             + theta  * np.exp(-k2 * (u - dt * (i-1))) * dW_t_2[:, i-1])
+            for i in range(1, xi_t_u.shape[1]):
+                xi_t_u[:, i] = xi_t_u[:, i-1] + (2 * nu) * xi_t_u[:, i-1] * alpha_theta *\
+                             ((1 - theta) * np.exp(-k1 * (u - dt * (i-1))) * dW_t_1[:, i-1]\
+                                 + theta  * np.exp(-k2 * (u - dt * (i-1))) * dW_t_2[:, i-1])
 
-        return xi_t_u[:, -1]
+            return xi_t_u[:, -1]
 
-    # Calculate the integral
-    integral_steps = 1000
-    u_val = np.linspace(T1, T2, integral_steps)
-    xi_val = np.zeros((n_paths, integral_steps))
+        # Calculate the integral
+        integral_steps = 1000
+        u_val = np.linspace(T1, T2, integral_steps)
+        xi_val = np.zeros((n_paths, integral_steps))
 
-    for i in tqdm(range(integral_steps)):
-        xi_val[:, i] = xi_t_u_func(u_val[i])
+        for i in tqdm(range(integral_steps)):
+            xi_val[:, i] = xi_t_u_func(u_val[i])
 
-    integral_val = np.zeros(n_paths)
+    with phase(PAYOFF_REDUCTION):
+        integral_val = np.zeros(n_paths)
 
-    for i in tqdm(range(n_paths)):
-        integral_val[i] = trapezoid(xi_val[i], x=u_val)
+        for i in tqdm(range(n_paths)):
+            integral_val[i] = trapezoid(xi_val[i], x=u_val)
 
-    # Payoff
-    payoff = np.maximum(integral_val / (T2 - T1) - K, 0)
+        # Payoff
+        payoff = np.maximum(integral_val / (T2 - T1) - K, 0)
 
-    # Price
-    discount_factor = np.exp(-r * T1)
-    price = np.mean(payoff * discount_factor)
+        # Price
+        discount_factor = np.exp(-r * T1)
+        price = np.mean(payoff * discount_factor)
 
     return price
 
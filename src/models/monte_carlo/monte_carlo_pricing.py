@@ -1,34 +1,101 @@
 # src/models/monte_carlo_pricing.py
 
 import numpy as np
+
 from src.models.pricing_engine_base import PricingEngine
-from .monte_carlo_functions import *
-from ..black_scholes.black_scholes_functions import barrier_option_price_bs
+from .monte_carlo_functions import (simulate_paths_gbm, simulate_paths_local_vol, vanilla_option_price_mc,
+                                    barrier_option_price_mc, variance_swap_swaption_price_mc,
+                                    vanilla_option_payoffs_mc, barrier_option_payoffs_mc,
+                                    barrier_option_payoffs_mc_streaming, adaptive_mc_estimate, MCEstimate)
+from src.market_data.yield_curve import YieldCurve
+from src.market_data.vol_surface import VolSurface
+from src.market_data.local_vol import LocalVolSurface
+from src.market_data.market import Market
+from src.utils.artifact_store import ArtifactStore
+from src.utils.instrumentation import phase, record, PATH_GENERATION, PAYOFF_REDUCTION
+from src.instruments.vanilla_option import VanillaOption
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.asian_option import AsianOption
+from src.instruments.lookback_option import LookbackOption
+from src.instruments.digital_option import DigitalOption
+from .adjoint import option_greeks_mc_adjoint
+from .payoffs import PathStatistics, payoff_from_instrument, price_payoffs
+
+# Instruments priced off a shared path set by price_batch (exact types, so that
+# e.g. FX barriers, which need their own spot and rates, are left out)
+_SHARED_PATH_TYPES = (BarrierOption, AsianOption, LookbackOption, DigitalOption)
 
 
 class MonteCarloEngine(PricingEngine):
     def __init__(self,
-                 interest_rate: float,
-                 volatility: float,
+                 interest_rate: float | YieldCurve,
+                 volatility: float | VolSurface | LocalVolSurface,
                  spot_price: float,
                  dividend_yield: float = 0.0,
                  n_paths: int = 10000,
                  n_steps: int = 252,
-                 params: object = None):
+                 params: object = None,
+                 market: Market = None,
+                 seed: int = None,
+                 artifact_store: ArtifactStore = None,
+                 store_paths: bool = False,
+                 dtype: str | np.dtype = "float64",
+                 target_abs_error: float = None,
+                 target_rel_error: float = None,
+                 time_budget: float = None,
+                 batch_size: int = 10000,
+                 max_paths: int = 10 ** 7,
+                 stream_barriers: bool = False):
         """
         Monte Carlo pricing engine using a Black-Scholes setup.
 
         Parameters
         ----------
-        interest_rate : float
-            The constant risk-free interest rate (r).
-        volatility : float
-            The constant volatility (sigma).
+        interest_rate : float or YieldCurve
+            The risk-free interest rate (r). A curve is read at each option's maturity.
+        volatility : float, VolSurface or LocalVolSurface
+            The volatility (sigma). An implied surface is read at each option's strike
+            and maturity; a local-vol surface is interpolated per path at every step.
         spot_price : float
             Current spot price (S0).
         dividend_yield : float, optional
             Continuous dividend yield (q). Defaults to 0.0.
+        market : Market, optional
+            FX rates, currency curves and pair vol surfaces for FX options.
+        seed : int, optional
+            Seed of the normal draws for GBM paths (np.random.default_rng). If
+            None, the global NumPy generator is used as before.
+        artifact_store : ArtifactStore, optional
+            With a seed, GBM normals are loaded from (or saved to) the store as
+            read-only memmaps shared across processes, keyed by
+            (seed, n_paths, n_steps). With ``store_paths`` the simulated paths
+            themselves are stored, keyed additionally by (T, r, q, sigma, S0).
+            Local-vol paths are never stored.
+        dtype : "float64" or "float32", optional
+            Precision of GBM path generation. float32 roughly halves memory and
+            bandwidth for large path counts; payoff means are still accumulated
+            in float64. Local-vol paths are always float64.
+        target_abs_error, target_rel_error, time_budget : float, optional
+            Setting any of these switches vanilla and barrier pricing to
+            adaptive mode: paths are simulated ``batch_size`` at a time, with
+            running mean and variance, until the standard error reaches the
+            absolute or relative target, ``time_budget`` seconds have passed or
+            ``max_paths`` paths were used; ``n_paths`` is then ignored. Prices
+            are returned as MCEstimate (a float carrying the standard error,
+            path count and stopping rule, which ValuationResult reports in
+            additional_info). Adaptive runs do not use the artifact store.
+        stream_barriers : bool, optional
+            Price barrier options (and FX barriers) without storing paths: only
+            the current log-spot and a barrier hit flag per path are kept while
+            stepping through time (barrier_option_payoffs_mc_streaming), so
+            memory is O(n_paths) instead of O(n_paths * n_steps). The normals
+            are drawn step by step, so prices differ from the stored-path
+            ones by Monte Carlo noise for the same seed; the artifact store is
+            not used. Adaptive mode takes precedence.
         """
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float64, np.float32):
+            raise ValueError(f"dtype must be float64 or float32, got {dtype}")
         self.r = interest_rate
         self.sigma = volatility
         self.S0 = spot_price
@@ -36,9 +103,82 @@ class MonteCarloEngine(PricingEngine):
         self.n_paths = n_paths
         self.n_steps = n_steps
         self.params = params
+        self.market = market
+        self.seed = seed
+        self.artifact_store = artifact_store
+        self.store_paths = store_paths
+        self.dtype = dtype
+        self.target_abs_error = target_abs_error
+        self.target_rel_error = target_rel_error
+        self.time_budget = time_budget
+        self.batch_size = batch_size
+        self.max_paths = max_paths
+        self.stream_barriers = stream_barriers
+
+    def _simulate_paths_gbm(self, T, r, sigma, q=None, S0=None):
+        q = self.q if q is None else q
+        S0 = self.S0 if S0 is None else S0
+        record(n_paths=self.n_paths, n_steps=self.n_steps)
+        with phase(PATH_GENERATION):
+            if isinstance(self.sigma, LocalVolSurface):
+                return simulate_paths_local_vol(self.n_paths, self.n_steps, T, r, q, self.sigma, S0)
+            if self.seed is None:
+                return simulate_paths_gbm(self.n_paths, self.n_steps, T, r, q, sigma, S0, dtype=self.dtype)
+            if self.artifact_store is not None and self.store_paths:
+                inputs = {"seed": self.seed, "n_paths": self.n_paths, "n_steps": self.n_steps, "dtype": self.dtype.name,
+                          "T": T, "r": r, "q": q, "sigma": sigma, "S0": S0}
+                return self.artifact_store.get_or_create(
+                    "gbm_paths", inputs,
+                    lambda: simulate_paths_gbm(self.n_paths, self.n_steps, T, r, q, sigma, S0,
+                                               z=self._draw_normals(), dtype=self.dtype))
+            return simulate_paths_gbm(self.n_paths, self.n_steps, T, r, q, sigma, S0, z=self._normals(), dtype=self.dtype)
+
+    def _draw_normals(self):
+        return np.random.default_rng(self.seed).standard_normal((self.n_paths, self.n_steps), dtype=self.dtype)
+
+    def _normals(self):
+        """Standard normal draws for the engine's seed, from the artifact store when there is one."""
+        if self.artifact_store is None:
+            return self._draw_normals()
+        inputs = {"seed": self.seed, "n_paths": self.n_paths, "n_steps": self.n_steps, "dtype": self.dtype.name}
+        return self.artifact_store.get_or_create("gbm_normals", inputs, self._draw_normals)
+
+    @property
+    def adaptive(self) -> bool:
+        return (self.target_abs_error is not None or self.target_rel_error is not None
+                or self.time_budget is not None)
+
+    def _adaptive_price(self, T, r, sigma, payoffs, q=None, S0=None):
+        """Adaptive estimate of the mean of ``payoffs(paths)`` (see the adaptive parameters)."""
+        q = self.q if q is None else q
+        S0 = self.S0 if S0 is None else S0
+        rng = None if self.seed is None else np.random.default_rng(self.seed)
 
-    def _simulate_paths_gbm(self, T):
-        return simulate_paths_gbm(self.n_paths, self.n_steps, T, self.r, self.q, self.sigma, self.S0)
+        def sample_batch(n):
+            with phase(PATH_GENERATION):
+                if isinstance(self.sigma, LocalVolSurface):
+                    paths = simulate_paths_local_vol(n, self.n_steps, T, r, q, self.sigma, S0)
+                else:
+                    z = None if rng is None else rng.standard_normal((n, self.n_steps), dtype=self.dtype)
+                    paths = simulate_paths_gbm(n, self.n_steps, T, r, q, sigma, S0, z=z, dtype=self.dtype)
+            with phase(PAYOFF_REDUCTION):
+                return payoffs(paths)
+
+        record(n_steps=self.n_steps)
+        return adaptive_mc_estimate(sample_batch, self.batch_size, self.target_abs_error, self.target_rel_error,
+                                    self.time_budget, self.max_paths)
+
+    def _streaming_barrier_price(self, T, r, sigma, barrier_option, q=None, S0=None) -> float:
+        """Barrier price from barrier_option_payoffs_mc_streaming (see ``stream_barriers``)."""
+        q = self.q if q is None else q
+        S0 = self.S0 if S0 is None else S0
+        if isinstance(self.sigma, LocalVolSurface):
+            sigma = self.sigma
+        payoffs = barrier_option_payoffs_mc_streaming(self.n_paths, self.n_steps, T, r, q, sigma, S0,
+                                                      barrier_option.strike, barrier_option.barrier_level,
+                                                      barrier_option.rebate, barrier_option.option_type,
+                                                      barrier_option.barrier_type, seed=self.seed, dtype=self.dtype)
+        return float(np.mean(payoffs, dtype=np.float64))
 
     def price_vanilla_option(self, vanilla_option) -> float:
         # Use the standard European BS formula
@@ -48,33 +188,158 @@ class MonteCarloEngine(PricingEngine):
         T = vanilla_option.maturity
         K = vanilla_option.strike
         option_type = vanilla_option.option_type
+        r = self._zero_rate(T)
+        sigma = self._implied_vol(K, T)
+
+        if self.adaptive:
+            return self._adaptive_price(T, r, sigma,
+                                        lambda paths: vanilla_option_payoffs_mc(paths, K, T, r, option_type))
 
         # Simulate paths
-        paths = self._simulate_paths_gbm(T)
+        paths = self._simulate_paths_gbm(T, r, sigma)
 
-        return vanilla_option_price_mc(paths, K, T, self.r, option_type)
+        with phase(PAYOFF_REDUCTION):
+            return vanilla_option_price_mc(paths, K, T, r, option_type)
 
     def price_barrier_option(self, barrier_option) -> float:
         T = barrier_option.maturity
         K = barrier_option.strike
         B = barrier_option.barrier_level
         rebate = barrier_option.rebate
+        r = self._zero_rate(T)
+        sigma = self._implied_vol(K, T)
+
+        if self.adaptive:
+            return self._adaptive_price(T, r, sigma, lambda paths: barrier_option_payoffs_mc(
+                paths, K, T, r, B, rebate, barrier_option.option_type, barrier_option.barrier_type))
+        if self.stream_barriers:
+            return self._streaming_barrier_price(T, r, sigma, barrier_option)
 
         # Simulate paths
-        paths = self._simulate_paths_gbm(T)
+        paths = self._simulate_paths_gbm(T, r, sigma)
 
-        return barrier_option_price_mc(paths, K, T, self.r, B, rebate, barrier_option.option_type,
-                                       barrier_option.barrier_type)
+        with phase(PAYOFF_REDUCTION):
+            return barrier_option_price_mc(paths, K, T, r, B, rebate, barrier_option.option_type,
+                                           barrier_option.barrier_type)
 
     def price_fx_barrier_option(self, fx_barrier_option):
         """
-        TODO: Implement a specialized FX barrier Monte Carlo if needed.
+        Garman-Kohlhagen Monte Carlo (foreign rate as dividend yield): the
+        premium for the option's notional, in its premium currency.
+        """
+        T = fx_barrier_option.maturity
+        K = fx_barrier_option.strike
+        B = fx_barrier_option.barrier_level
+        spot, r_d, r_f, sigma = self._fx_inputs(fx_barrier_option.foreign_ccy, fx_barrier_option.domestic_ccy, K, T)
+
+        if self.adaptive:
+            price = self._adaptive_price(T, r_d, sigma, lambda paths: barrier_option_payoffs_mc(
+                paths, K, T, r_d, B, fx_barrier_option.rebate, fx_barrier_option.option_type,
+                fx_barrier_option.barrier_type), q=r_f, S0=spot)
+        elif self.stream_barriers:
+            price = self._streaming_barrier_price(T, r_d, sigma, fx_barrier_option, q=r_f, S0=spot)
+        else:
+            paths = self._simulate_paths_gbm(T, r_d, sigma, q=r_f, S0=spot)
+            with phase(PAYOFF_REDUCTION):
+                price = barrier_option_price_mc(paths, K, T, r_d, B, fx_barrier_option.rebate,
+                                                fx_barrier_option.option_type, fx_barrier_option.barrier_type)
+        premium_in_foreign = fx_barrier_option.premium_ccy == fx_barrier_option.foreign_ccy
+        if self.adaptive:
+            scale = float(self._fx_premium(1.0, spot, fx_barrier_option.notional, premium_in_foreign))
+            return MCEstimate(price * scale, price.std_error * scale, price.n_paths, price.stop_reason, price.elapsed)
+        return float(self._fx_premium(price, spot, fx_barrier_option.notional, premium_in_foreign))
+
+    def price_batch(self, instruments) -> list:
         """
-        raise NotImplementedError("FX Barrier pricing not yet implemented.")
+        Price European vanilla, barrier, Asian, lookback and digital options
+        that share a maturity off one path set, computing the path statistics
+        they need (running extrema, averages) once. With an implied-vol surface the paths depend on the strike, so
+        every option gets its own paths as in the single-option methods, and
+        in adaptive mode every option runs to its own error target. With
+        ``stream_barriers``, barrier options are priced one by one without
+        paths.
+        """
+        if isinstance(self.sigma, VolSurface) or self.adaptive:
+            return super().price_batch(instruments)
+
+        prices = [None] * len(instruments)
+        by_maturity = {}
+        for i, instrument in enumerate(instruments):
+            if self.stream_barriers and type(instrument) is BarrierOption:
+                prices[i] = instrument.accept_pricer(self)
+            elif ((type(instrument) is VanillaOption and instrument.exercise_style.lower() == "european")
+                    or type(instrument) in _SHARED_PATH_TYPES):
+                by_maturity.setdefault(instrument.maturity, []).append(i)
+            else:
+                prices[i] = instrument.accept_pricer(self)
+
+        for T, idx in by_maturity.items():
+            r = self._zero_rate(T)
+            sigma = self._implied_vol(None, T)
+            paths = self._simulate_paths_gbm(T, r, sigma)
+            with phase(PAYOFF_REDUCTION):
+                batch_prices = price_payoffs(paths, [payoff_from_instrument(instruments[i]) for i in idx], T, r,
+                                             gbm=self._gbm_params(sigma))
+            for i, price in zip(idx, batch_prices):
+                prices[i] = price
+        return prices
+
+    def price_with_greeks(self, instrument):
+        """
+        Price and adjoint Greeks (see adjoint.option_greeks_mc_adjoint) of a
+        European vanilla or barrier option, from the engine's normals. First-
+        order Greeks take one forward and one backward pass over the paths;
+        gamma, vanna and volga four more.
+        """
+        is_vanilla = type(instrument) is VanillaOption and instrument.exercise_style.lower() == "european"
+        if not (is_vanilla or type(instrument) is BarrierOption):
+            raise NotImplementedError(f"MonteCarloEngine has no adjoint Greeks for {type(instrument).__name__}")
+        if isinstance(self.sigma, LocalVolSurface):
+            raise NotImplementedError("Adjoint Greeks are only available for GBM paths.")
+
+        T = instrument.maturity
+        K = instrument.strike
+        r = self._zero_rate(T)
+        sigma = self._implied_vol(K, T)
+        barrier = {} if is_vanilla else {"barrier_level": instrument.barrier_level,
+                                         "barrier_type": instrument.barrier_type, "rebate": instrument.rebate}
+        record(n_paths=self.n_paths, n_steps=self.n_steps)
+        with phase(PATH_GENERATION):
+            if self.seed is None:
+                z = np.random.normal(size=(self.n_paths, self.n_steps))
+            else:
+                z = self._normals()
+        with phase(PAYOFF_REDUCTION):
+            return option_greeks_mc_adjoint(z, self.S0, K, T, r, self.q, sigma, instrument.option_type, **barrier)
+
+    def _gbm_params(self, sigma):
+        """(S0, q, sigma) for the geometric-Asian control variate, or None for local-vol paths."""
+        if isinstance(self.sigma, LocalVolSurface):
+            return None
+        return self.S0, self.q, sigma
+
+    def price_path_dependent_option(self, option):
+        """
+        Asian (arithmetic or geometric), lookback and digital options. Arithmetic
+        Asians use the closed-form geometric Asian as a control variate, except
+        on local-vol paths and in adaptive mode.
+        """
+        T = option.maturity
+        r = self._zero_rate(T)
+        sigma = self._implied_vol(self.S0 if option.strike is None else option.strike, T)
+        payoff = payoff_from_instrument(option)
+
+        if self.adaptive:
+            discount = np.exp(-r * T)
+            return self._adaptive_price(T, r, sigma, lambda paths: payoff.discounted(PathStatistics(paths), discount))
+
+        paths = self._simulate_paths_gbm(T, r, sigma)
+        with phase(PAYOFF_REDUCTION):
+            return price_payoffs(paths, [payoff], T, r, gbm=self._gbm_params(sigma))[0]
 
     def price_variance_swap_swaption(self, variance_swap_swaption):
         K = variance_swap_swaption.K
         T1 = variance_swap_swaption.T1
         T2 = variance_swap_swaption.T2
 
-        return variance_swap_swaption_price_mc(self.S0, K, self.r, T1, T2, self.params, self.n_paths, self.n_steps)
+        return variance_swap_swaption_price_mc(self.S0, K, self._zero_rate(T1), T1, T2, self.params, self.n_paths, self.n_steps)
@@ -0,0 +1,211 @@
+# src/models/monte_carlo/payoffs.py
+"""
+Payoff descriptions evaluated over one shared path set.
+
+Each payoff declares the path statistics it needs (terminal price, running
+max/min, arithmetic or geometric average); PathStatistics computes each of
+them at most once per path set, so pricing many path-dependent options off
+the same paths costs one pass over the path matrix per statistic, not per
+option:
+
+    paths = simulate_paths_gbm(n_paths, n_steps, T, r, q, sigma, S0)
+    prices = price_payoffs(paths, [payoff_from_instrument(o) for o in options], T, r,
+                           gbm=(S0, q, sigma))
+
+Fixed-strike arithmetic Asians use the matching geometric Asian, whose price
+is known in closed form under GBM, as a control variate when ``gbm`` is given.
+"""
+import numpy as np
+
+from src.instruments.option_types import OptionType, BarrierType
+from src.instruments.vanilla_option import VanillaOption
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.asian_option import AsianOption
+from src.instruments.lookback_option import LookbackOption
+from src.instruments.digital_option import DigitalOption
+from src.models.black_scholes.black_scholes_functions import geometric_asian_option_price_bs
+
+
+class PathStatistics:
+    """
+    Per-path statistics of a (n_paths, n_steps+1) path matrix, computed on
+    first use and cached. Averages are over the fixings t_i = i T / n_fixings,
+    i = 1..n_fixings, which must divide the number of steps; extrema include S0.
+    All statistics are float64 whatever the precision of the paths.
+    """
+    def __init__(self, paths: np.ndarray):
+        self.paths = paths
+        self.n_steps = paths.shape[1] - 1
+        self._cache = {}
+
+    def _get(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _fixings(self, n_fixings: int = None) -> np.ndarray:
+        n_fixings = self.n_steps if n_fixings is None else n_fixings
+        if self.n_steps % n_fixings:
+            raise ValueError(f"{n_fixings} fixings do not divide the {self.n_steps} simulation steps")
+        stride = self.n_steps // n_fixings
+        return self.paths[:, stride::stride]
+
+    @property
+    def terminal(self) -> np.ndarray:
+        return self._get("terminal", lambda: self.paths[:, -1].astype(np.float64))
+
+    @property
+    def running_max(self) -> np.ndarray:
+        return self._get("running_max", lambda: self.paths.max(axis=1).astype(np.float64))
+
+    @property
+    def running_min(self) -> np.ndarray:
+        return self._get("running_min", lambda: self.paths.min(axis=1).astype(np.float64))
+
+    def arithmetic_mean(self, n_fixings: int = None) -> np.ndarray:
+        return self._get(("arithmetic_mean", n_fixings),
+                         lambda: self._fixings(n_fixings).mean(axis=1, dtype=np.float64))
+
+    def geometric_mean(self, n_fixings: int = None) -> np.ndarray:
+        return self._get(("geometric_mean", n_fixings),
+                         lambda: np.exp(np.log(self._fixings(n_fixings)).mean(axis=1, dtype=np.float64)))
+
+
+def _intrinsic(underlying, strike, option_type: OptionType):
+    if option_type is OptionType.CALL:
+        return np.maximum(underlying - strike, 0.0)
+    return np.maximum(strike - underlying, 0.0)
+
+
+class Payoff:
+    """
+    Base class: ``discounted(stats, discount)`` returns the discounted payoff
+    of every path from a PathStatistics.
+    """
+    def discounted(self, stats: PathStatistics, discount: float) -> np.ndarray:
+        raise NotImplementedError
+
+
+class VanillaPayoff(Payoff):
+    def __init__(self, strike: float, option_type: str | OptionType):
+        self.strike = strike
+        self.option_type = OptionType.parse(option_type)
+
+    def discounted(self, stats, discount):
+        return _intrinsic(stats.terminal, self.strike, self.option_type) * discount
+
+
+class DigitalPayoff(Payoff):
+    def __init__(self, strike: float, option_type: str | OptionType, cash: float = 1.0):
+        self.strike = strike
+        self.option_type = OptionType.parse(option_type)
+        self.cash = cash
+
+    def discounted(self, stats, discount):
+        if self.option_type is OptionType.CALL:
+            in_the_money = stats.terminal > self.strike
+        else:
+            in_the_money = stats.terminal < self.strike
+        return np.where(in_the_money, self.cash * discount, 0.0)
+
+
+class AsianPayoff(Payoff):
+    def __init__(self, strike: float, option_type: str | OptionType, averaging: str = "arithmetic",
+                 n_fixings: int = None):
+        self.strike = strike
+        self.option_type = OptionType.parse(option_type)
+        self.averaging = averaging
+        self.n_fixings = n_fixings
+
+    def discounted(self, stats, discount):
+        if self.averaging == "geometric":
+            average = stats.geometric_mean(self.n_fixings)
+        else:
+            average = stats.arithmetic_mean(self.n_fixings)
+        return _intrinsic(average, self.strike, self.option_type) * discount
+
+
+class LookbackPayoff(Payoff):
+    def __init__(self, option_type: str | OptionType, strike: float = None):
+        self.option_type = OptionType.parse(option_type)
+        self.strike = strike
+
+    def discounted(self, stats, discount):
+        if self.strike is None:
+            if self.option_type is OptionType.CALL:
+                return (stats.terminal - stats.running_min) * discount
+            return (stats.running_max - stats.terminal) * discount
+        extremum = stats.running_max if self.option_type is OptionType.CALL else stats.running_min
+        return _intrinsic(extremum, self.strike, self.option_type) * discount
+
+
+class BarrierPayoff(Payoff):
+    """Same convention as barrier_option_payoffs_mc: the rebate is not discounted."""
+    def __init__(self, strike: float, option_type: str | OptionType, barrier_level: float,
+                 barrier_type: str | BarrierType, rebate: float = 0.0):
+        self.strike = strike
+        self.option_type = OptionType.parse(option_type)
+        self.barrier_level = barrier_level
+        self.barrier_type = BarrierType.parse(barrier_type)
+        self.rebate = rebate
+
+    def discounted(self, stats, discount):
+        if self.barrier_type.is_up:
+            barrier_hit = stats.running_max >= self.barrier_level
+        else:
+            barrier_hit = stats.running_min <= self.barrier_level
+        alive = barrier_hit if self.barrier_type.is_in else ~barrier_hit
+        return np.where(alive, _intrinsic(stats.terminal, self.strike, self.option_type) * discount, self.rebate)
+
+
+def payoff_from_instrument(instrument) -> Payoff:
+    """Payoff description of a European vanilla, barrier, Asian, lookback or digital option."""
+    if isinstance(instrument, BarrierOption):
+        return BarrierPayoff(instrument.strike, instrument.option_type, instrument.barrier_level,
+                             instrument.barrier_type, instrument.rebate)
+    if isinstance(instrument, AsianOption):
+        return AsianPayoff(instrument.strike, instrument.option_type, instrument.averaging, instrument.n_fixings)
+    if isinstance(instrument, LookbackOption):
+        return LookbackPayoff(instrument.option_type, instrument.strike)
+    if isinstance(instrument, DigitalOption):
+        return DigitalPayoff(instrument.strike, instrument.option_type, instrument.cash)
+    if isinstance(instrument, VanillaOption) and instrument.exercise_style.lower() == "european":
+        return VanillaPayoff(instrument.strike, instrument.option_type)
+    raise NotImplementedError(f"No Monte Carlo payoff for {type(instrument).__name__}")
+
+
+def _control_variate(payoff: Payoff, stats: PathStatistics, T: float, r: float, gbm):
+    """(samples, expectation) of the control variate for ``payoff``, or None."""
+    if gbm is None or not isinstance(payoff, AsianPayoff) or payoff.averaging != "arithmetic":
+        return None
+    S0, q, sigma = gbm
+    n_fixings = stats.n_steps if payoff.n_fixings is None else payoff.n_fixings
+    geometric = AsianPayoff(payoff.strike, payoff.option_type, "geometric", payoff.n_fixings)
+    expectation = geometric_asian_option_price_bs(S0, payoff.strike, T, r, q, sigma, n_fixings, payoff.option_type)
+    return geometric.discounted(stats, np.exp(-r * T)), expectation
+
+
+def price_payoffs(paths: np.ndarray, payoffs: list, T: float, r: float, gbm: tuple = None) -> list:
+    """
+    Price every payoff off the same paths, sharing the path statistics.
+
+    :param paths: (n_paths, n_steps+1) simulated paths to maturity T.
+    :param payoffs: Payoff descriptions (see payoff_from_instrument).
+    :param gbm: (S0, q, sigma) if the paths are flat-vol GBM; enables the
+                geometric-Asian control variate for arithmetic Asians.
+    :return: Prices, in the order of ``payoffs``.
+    """
+    stats = PathStatistics(paths)
+    discount = np.exp(-r * T)
+    prices = []
+    for payoff in payoffs:
+        samples = payoff.discounted(stats, discount)
+        control = _control_variate(payoff, stats, T, r, gbm)
+        if control is None:
+            prices.append(float(np.mean(samples, dtype=np.float64)))
+            continue
+        control_samples, expectation = control
+        covariance = np.cov(samples, control_samples)
+        beta = covariance[0, 1] / covariance[1, 1] if covariance[1, 1] > 0 else 0.0
+        prices.append(float(np.mean(samples) - beta * (np.mean(control_samples) - expectation)))
+    return prices
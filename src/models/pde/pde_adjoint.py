@@ -0,0 +1,185 @@
+# src/models/pde/pde_adjoint.py
+"""
+Adjoint Greeks of the implicit finite-difference scheme of option_price_pde.
+
+The forward sweep is the scheme itself (constant coefficients), keeping the
+solution after every implicit solve. The backward sweep runs the transposed
+steps from the readout, so that one pass gives the exact derivative of the
+discrete price with respect to every coefficient: sigma, r, q and the grid
+bounds, through the tridiagonal operator, the call's boundary values and the
+payoff on the grid. The readout is seeded with three functionals at once
+(the price, and the central-difference delta and gamma on the grid), so the
+same sweep also gives d(delta)/d(sigma), i.e. vanna. Volga is a central
+difference of the adjoint vega in sigma.
+
+Delta and gamma come from the final grid around the spot. A barrier that
+is a grid bound (down-and-out calls, up-and-out puts) is differentiated
+through the bound; barriers applied by zeroing interior nodes only move in
+whole grid steps, so the discrete price has no sensitivity to them.
+"""
+import numpy as np
+
+from src.instruments.option_types import OptionType, BarrierType
+from .pde_functions import _implicit_diagonals
+
+
+def option_greeks_pde_adjoint(S0: float, K: float, T: float, r: float, sigma: float,
+                              option_type: str | OptionType, nx: int, nt: int, x_min: float, x_max: float,
+                              barrier: float = None, q: float = 0.0) -> dict:
+    """
+    Price and adjoint sensitivities of option_price_pde (same arguments, no local vol).
+
+    :return: dict with "price", "delta", "gamma" (from the grid), "vega", "rho", "dividend_rho",
+             "vanna" (adjoint) and "x_min", "x_max": sensitivities to the grid bounds of the
+             solution at S0 (the readout node's shift with the grid is taken out).
+    """
+    option_type = OptionType.parse(option_type)
+    is_call = option_type is OptionType.CALL
+
+    # scipy.linalg is imported on first use to keep engine imports light
+    from scipy.linalg import solve_banded
+
+    dx = (x_max - x_min) / nx
+    dt = T / nt
+    x = np.linspace(x_min, x_max, nx + 1)
+    nodes = np.arange(nx + 1)
+
+    # Payoff and knocked-out nodes, as in option_price_pde
+    payoff = np.maximum(x - K, 0) if is_call else np.maximum(K - x, 0)
+    alive = np.ones(nx + 1)
+    if barrier is not None:
+        barrier_idx = np.argmin(np.abs(x - barrier))
+        alive[nodes >= barrier_idx if is_call else nodes < barrier_idx] = 0.0
+
+    # The calls' upper boundary follows x_max * exp(-q * tau) - K * exp(-r * tau)
+    tau = dt * np.arange(nt + 1)
+    boundary = np.vstack([x_max * np.exp(-q * tau) - K * np.exp(-r * tau),        # value
+                          K * tau * np.exp(-r * tau),                             # d/dr
+                          -x_max * tau * np.exp(-q * tau),                        # d/dq
+                          np.exp(-q * tau)])                                      # d/dx_max
+    if not is_call:
+        boundary[:] = 0.0
+    increments = np.diff(boundary, axis=1)
+
+    # Forward sweep, keeping the implicit solutions
+    ab = _implicit_diagonals(x, dx, dt, r, sigma, q)
+    solutions = np.empty((nt, nx + 1))
+    V = payoff * alive
+    for step in range(nt):
+        solutions[step] = solve_banded((1, 1), ab, V)
+        V = solutions[step].copy()
+        V[-1] += increments[0, step]
+        V *= alive
+
+    # Readout functionals at the node nearest to S0: price, grid delta and grid gamma
+    idx = min(max(int(np.argmin(np.abs(x - S0))), 1), nx - 1)
+    seeds = np.zeros((nx + 1, 3))
+    seeds[idx, 0] = 1.0
+    seeds[[idx - 1, idx + 1], 1] = -1.0 / (2 * dx), 1.0 / (2 * dx)
+    seeds[[idx - 1, idx, idx + 1], 2] = 1.0 / dx ** 2, -2.0 / dx ** 2, 1.0 / dx ** 2
+    price, delta, gamma = V @ seeds
+
+    # Backward sweep with the transposed operator
+    ab_t = np.zeros_like(ab)
+    ab_t[0, 1:] = ab[2, :-1]
+    ab_t[1] = ab[1]
+    ab_t[2, :-1] = ab[0, 1:]
+    adjoints = np.empty((nt, nx + 1, 3))
+    increment_bar = np.empty((nt, 3))
+    adjoint = seeds
+    for step in range(nt - 1, -1, -1):
+        adjoint = adjoint * alive[:, None]
+        increment_bar[step] = adjoint[-1]
+        adjoint = solve_banded((1, 1), ab_t, adjoint)
+        adjoints[step] = adjoint
+    payoff_bar = adjoint * alive[:, None]
+
+    # sum over steps of mu' (dA/dtheta) U, contracted per diagonal over the interior rows
+    interior = adjoints[:, 1:-1]
+    by_lower = np.einsum('si,sik->ik', solutions[:, :-2], interior)
+    by_diag = np.einsum('si,sik->ik', solutions[:, 1:-1], interior)
+    by_upper = np.einsum('si,sik->ik', solutions[:, 2:], interior)
+
+    def operator_bar(d_drift, d_diffusion, d_diag_extra=0.0):
+        """-mu' dA U for a parameter moving the drift and diffusion terms (interior rows)."""
+        d_lower = -dt * (d_diffusion - d_drift)
+        d_diag = 2 * dt * d_diffusion + d_diag_extra
+        d_upper = -dt * (d_drift + d_diffusion)
+        return -(np.broadcast_to(d_lower, (nx - 1,)) @ by_lower + np.broadcast_to(d_diag, (nx - 1,)) @ by_diag
+                 + np.broadcast_to(d_upper, (nx - 1,)) @ by_upper)
+
+    xi = x[1:-1]
+    ratio = xi / dx
+    sensitivities = {
+        "sigma": operator_bar(0.0, sigma * ratio ** 2),
+        "r": operator_bar(ratio / 2, 0.0, dt) + increments[1] @ increment_bar,
+        "q": operator_bar(-ratio / 2, 0.0) + increments[2] @ increment_bar,
+    }
+    # Grid bounds move every node: x_i = x_min + i dx, dx = (x_max - x_min) / nx
+    # Slope of the payoff in x (one half at a node on the strike)
+    payoff_slope = 0.5 * (np.sign(x - K) + (1.0 if is_call else -1.0))
+    for name, d_x, d_dx in (("x_min", 1 - nodes / nx, -1.0 / nx), ("x_max", nodes / nx, 1.0 / nx)):
+        d_ratio = (d_x[1:-1] - ratio * d_dx) / dx
+        bar = operator_bar((r - q) * d_ratio / 2, sigma ** 2 * ratio * d_ratio) + (payoff_slope * d_x) @ payoff_bar
+        if name == "x_max":
+            bar = bar + increments[3] @ increment_bar
+        # The readout node moves with the grid; keep the spot fixed instead
+        sensitivities[name] = bar - delta * d_x[idx] * np.array([1.0, 0.0, 0.0])
+
+    return {"price": price, "delta": delta, "gamma": gamma,
+            "vega": sensitivities["sigma"][0], "vanna": sensitivities["sigma"][1],
+            "rho": sensitivities["r"][0], "dividend_rho": sensitivities["q"][0],
+            "x_min": sensitivities["x_min"][0], "x_max": sensitivities["x_max"][0]}
+
+
+def barrier_option_greeks_pde(S0: float, K: float, T: float, r: float, sigma: float, B: float,
+                              option_type: str | OptionType, barrier_type: str | BarrierType,
+                              nx: int = 300, nt: int = 300, q: float = 0.0, second_order: bool = True,
+                              bump: float = 1e-3) -> dict:
+    """
+    Price and Greeks of barrier_option_price_pde (B = None for a vanilla on [0, 3 S0]).
+
+    :return: dict with "price", "delta", "gamma", "vega", "rho", "dividend_rho", "barrier_sensitivity"
+             (where the barrier is a grid bound) and, with ``second_order``, "vanna" and "volga".
+    """
+    option_type = OptionType.parse(option_type)
+    grids = []
+    barrier_bound = None
+    if B is None:
+        grids.append((1.0, 0, S0 * 3, None))
+    else:
+        barrier_type = BarrierType.parse(barrier_type)
+        # Grid layout of barrier_option_price_pde; knock-ins by in-out parity
+        sign = -1.0 if barrier_type.is_in else 1.0
+        if option_type is OptionType.CALL and barrier_type.is_down:
+            grids.append((sign, B, S0 * 3, None))
+            barrier_bound = "x_min"
+        elif option_type is OptionType.PUT and barrier_type.is_up:
+            grids.append((sign, 0, B, None))
+            barrier_bound = "x_max"
+        else:
+            grids.append((sign, 0, S0 * 3, B))
+        if barrier_type.is_in:
+            grids.append((1.0, 0, S0 * 3, None))
+
+    def combined(vol):
+        """Greeks of the grids combined, and the barrier sensitivity of the first (knock-out) grid."""
+        greeks = {}
+        barrier_sensitivity = None
+        for weight, x_min, x_max, grid_barrier in grids:
+            grid = option_greeks_pde_adjoint(S0, K, T, r, vol, option_type, nx, nt, x_min, x_max, grid_barrier, q)
+            if barrier_bound is not None and barrier_sensitivity is None:
+                barrier_sensitivity = weight * grid[barrier_bound]
+            for name in ("price", "delta", "gamma", "vega", "vanna", "rho", "dividend_rho"):
+                greeks[name] = greeks.get(name, 0.0) + weight * grid[name]
+        return greeks, barrier_sensitivity
+
+    greeks, barrier_sensitivity = combined(sigma)
+    result = {name: float(greeks[name]) for name in ("price", "delta", "gamma", "vega", "rho", "dividend_rho")}
+    if barrier_sensitivity is not None:
+        result["barrier_sensitivity"] = float(barrier_sensitivity)
+    if second_order:
+        h = bump * sigma
+        result["vanna"] = float(greeks["vanna"])
+        result["volga"] = (combined(sigma + h)[0]["vega"] - combined(sigma - h)[0]["vega"]) / (2 * h)
+    return result
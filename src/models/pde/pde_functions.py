@@ -1,21 +1,66 @@
 # src/utils/pde_functions.py
 import numpy as np
 
-import numpy as np
+from src.market_data.local_vol import LocalVolSurface
+from src.utils.instrumentation import phase, record, MATRIX_BUILD, TIME_STEPPING
+from src.utils.jit import get_kernels
+from src.utils.artifact_store import ArtifactStore
+from src.instruments.option_types import OptionType, BarrierType
+from . import pde_kernels
 
-import numpy as np
+
+def _implicit_diagonals(x: np.ndarray, dx: float, dt: float, r: float, sigma, q: float = 0.0):
+    """
+    Sub-, main- and super-diagonal of the implicit Black-Scholes step on the
+    grid x, in scipy.linalg.solve_banded layout (shape (3, len(x))). ``sigma``
+    is either a scalar or an array of (local) vols on the grid. The first and
+    last rows are identity (Dirichlet boundaries).
+    """
+    sigma2_x2 = (sigma ** 2) * (x ** 2)
+    alpha = -dt * ((r - q) * x / (2 * dx) + sigma2_x2 / (2 * (dx ** 2)))
+    beta = 1 + r * dt + dt / (dx ** 2) * sigma2_x2
+    gamma = -dt * (-(r - q) * x / (2 * dx) + sigma2_x2 / (2 * (dx ** 2)))
+
+    ab = np.zeros((3, x.shape[0]))
+    ab[0, 2:] = alpha[1:-1]     # super-diagonal: M[i, i+1]
+    ab[1, 1:-1] = beta[1:-1]    # main diagonal
+    ab[1, 0] = ab[1, -1] = 1
+    ab[2, :-2] = gamma[1:-1]    # sub-diagonal: M[i, i-1]
+    return ab
 
 
 def option_price_pde(
         S0: float, K: float, T: float, r: float,
-        sigma: float, option_type: str,
+        sigma: float, option_type: str | OptionType,
         nx: int, nt: int,
         x_min: float, x_max: float, barrier: object = None,
+        local_vol: LocalVolSurface = None,
+        q: float = 0.0,
+        backend: str = "python",
+        artifact_store: ArtifactStore = None,
         ):
     """
     Price a European call or put option using implicit finite difference method
-    for the Black–Scholes PDE on [x_min, x_max].
+    for the Black–Scholes PDE on [x_min, x_max]. ``q`` is a continuous dividend
+    yield, or the foreign rate for an FX (Garman-Kohlhagen) option.
+
+    If ``local_vol`` is given, the diffusion coefficient is sigma_loc(x, t) and
+    only the three diagonals are rebuilt at each time step; ``sigma`` is then
+    ignored. Otherwise the (constant) diagonals are built once.
+
+    ``backend="numba"`` runs the constant-coefficient time stepping in the
+    compiled Thomas-algorithm kernel of pde_kernels (pure Python if Numba is
+    not installed); local-vol grids always use scipy's banded solver.
+
+    With an ``artifact_store``, the constant-coefficient operator (the banded
+    matrix, or its Thomas factorization for the numba backend) is loaded from
+    the store, keyed by the grid and model inputs, instead of being rebuilt.
     """
+    option_type = OptionType.parse(option_type)
+
+    # scipy.linalg is imported on first use to keep engine imports light
+    from scipy.linalg import solve_banded
+
     # Create spatial and time steps
     dx = (x_max - x_min) / nx
     dt = T / nt
@@ -25,55 +70,86 @@ def option_price_pde(
 
     # Terminal payoff for call/put
     V = np.zeros_like(x)
-    if option_type == 'call':
+    if option_type is OptionType.CALL:
         V = np.maximum(x - K, 0)
-    elif option_type == 'put':
+    elif option_type is OptionType.PUT:
         V = np.maximum(K - x, 0)
 
     if barrier is not None:
         barrier_idx = np.argmin(np.abs(x - barrier))
-        if option_type == 'call':
+        if option_type is OptionType.CALL:
             V[barrier_idx:] = 0
-        elif option_type == 'put':
+        elif option_type is OptionType.PUT:
             V[:barrier_idx] = 0
 
+    record(nx=nx, nt=nt)
 
-    # Initialize tridiagonal matrix for implicit scheme
-    M = np.zeros((nx + 1, nx + 1))
-    M[0, 0] = 1
-    M[-1, -1] = 1
+    operator_inputs = {"nx": nx, "x_min": x_min, "x_max": x_max, "dt": dt, "r": r, "q": q, "sigma": sigma}
 
-    # Coefficients for the PDE discretization
-    alpha = -dt * (r * x / (2 * dx) + (sigma ** 2) * (x ** 2) / (2 * (dx ** 2)))
-    beta = 1 + r * dt + (sigma ** 2) * dt / (dx ** 2) * (x ** 2)
-    gamma = -dt * (-r * x / (2 * dx) + (sigma ** 2) * (x ** 2) / (2 * (dx ** 2)))
+    if backend != "python" and local_vol is None:
+        factorize, time_stepping = get_kernels(pde_kernels.build, backend)
 
-    # Fill sub-, main-, super-diagonal
-    np.fill_diagonal(M[1:-1, 2:], alpha[1:])
-    np.fill_diagonal(M[1:-1, 1:], beta[1:])
-    np.fill_diagonal(M[1:-1, 0:], gamma[1:])
+        def build_factors():
+            ab = _implicit_diagonals(x, dx, dt, r, sigma, q)
+            return factorize(np.append(0.0, ab[2, :-1]), np.ascontiguousarray(ab[1]), np.append(ab[0, 1:], 0.0))
 
-    # Backward time stepping
-    t = T
-    for i in range(nt, 0, -1):
-        #Boundary condition vector for each step
-        C = np.append(
-            np.zeros(nx),
-            np.exp(-r * (T - t + dt)) * K - np.exp(-r * (T - t)) * K
-        )
-        t -= dt
-
-        # Solve for the new option values
-        if option_type == 'call':
-            V = np.linalg.inv(M) @ V + C
-        elif option_type == 'put':
-            V = np.linalg.inv(M) @ V
+        with phase(MATRIX_BUILD):
+            if artifact_store is None:
+                factors = build_factors()
+            else:
+                factors = artifact_store.get_or_create("pde_factorized", operator_inputs, build_factors)
 
+        is_call = option_type is OptionType.CALL
+        tau = dt * np.arange(nt)
+        if is_call:
+            increments = (x_max * (np.exp(-q * (tau + dt)) - np.exp(-q * tau))
+                          - K * (np.exp(-r * (tau + dt)) - np.exp(-r * tau)))
+        else:
+            increments = np.zeros(nt)
+        barrier_lo, barrier_hi = 0, 0
         if barrier is not None:
-            if option_type == 'call':
-                V[barrier_idx:] = 0
-            elif option_type == 'put':
-                V[:barrier_idx] = 0
+            barrier_lo, barrier_hi = (barrier_idx, nx + 1) if is_call else (0, barrier_idx)
+        with phase(TIME_STEPPING):
+            V = time_stepping(np.array(V, dtype=float), factors, increments, barrier_lo, barrier_hi)
+        return V[np.argmin(np.abs(x - S0))]
+
+    # Tridiagonal matrix of the implicit scheme, in banded form
+    if local_vol is None:
+        with phase(MATRIX_BUILD):
+            if artifact_store is None:
+                ab = _implicit_diagonals(x, dx, dt, r, sigma, q)
+            else:
+                ab = artifact_store.get_or_create("pde_banded", operator_inputs,
+                                                  lambda: _implicit_diagonals(x, dx, dt, r, sigma, q))
+
+    # Backward time stepping
+    with phase(TIME_STEPPING):
+        t = T
+        for i in range(nt, 0, -1):
+            #Boundary condition vector for each step: the call's upper boundary
+            # follows x_max * exp(-q * tau) - K * exp(-r * tau)
+            tau = T - t
+            C = np.append(
+                np.zeros(nx),
+                x_max * (np.exp(-q * (tau + dt)) - np.exp(-q * tau)) - K * (np.exp(-r * (tau + dt)) - np.exp(-r * tau))
+            )
+            t -= dt
+
+            if local_vol is not None:
+                with phase(MATRIX_BUILD):
+                    ab = _implicit_diagonals(x, dx, dt, r, local_vol.local_vol(x, t), q)
+
+            # Solve for the new option values
+            if option_type is OptionType.CALL:
+                V = solve_banded((1, 1), ab, V) + C
+            elif option_type is OptionType.PUT:
+                V = solve_banded((1, 1), ab, V)
+
+            if barrier is not None:
+                if option_type is OptionType.CALL:
+                    V[barrier_idx:] = 0
+                elif option_type is OptionType.PUT:
+                    V[:barrier_idx] = 0
 
     # Find the grid index closest to S0
     x_idx = np.argmin(np.abs(x - S0))
@@ -82,78 +158,176 @@ def option_price_pde(
 
 def vanilla_option_price_pde(
         S0: float, K: float, T: float, r: float,
-        sigma: float, option_type: str,
+        sigma: float, option_type: str | OptionType,
         x_max: float,
         nx: int = 300, nt: int = 300,
+        local_vol: LocalVolSurface = None,
+        q: float = 0.0,
+        backend: str = "python",
+        artifact_store: ArtifactStore = None,
         ):
     return option_price_pde(
         S0=S0, K=K, T=T, r=r,
         sigma=sigma, option_type=option_type,
-        x_max=x_max, x_min=0, nx=nx, nt=nt)
+        x_max=x_max, x_min=0, nx=nx, nt=nt, local_vol=local_vol, q=q, backend=backend,
+        artifact_store=artifact_store)
 
 def barrier_option_price_pde(
         S0: float, K: float, T: float, r: float,
         sigma: float, B: float,
-        option_type: str, barrier_type: str,
+        option_type: str | OptionType, barrier_type: str | BarrierType,
         nx: int = 300, nt: int = 300,
+        local_vol: LocalVolSurface = None,
+        q: float = 0.0,
+        backend: str = "python",
+        artifact_store: ArtifactStore = None,
         ):
+    option_type = OptionType.parse(option_type)
+    barrier_type = BarrierType.parse(barrier_type)
 
-    if option_type == 'call':
-        # Discretize asset prices
-        if barrier_type.lower().startswith('up'):
-            if barrier_type.lower().endswith(('in', 'out')):
-                # Calculate 'up-and-out' option
-                x_max = S0 * 3
-                x_min = 0
+    # Down calls and up puts place the barrier on the grid boundary; up calls
+    # and down puts zero the knocked-out nodes after every step.
+    if option_type is OptionType.CALL and barrier_type.is_down:
+        x_min, x_max, grid_barrier = B, S0 * 3, None
+    elif option_type is OptionType.PUT and barrier_type.is_up:
+        x_min, x_max, grid_barrier = 0, B, None
+    else:
+        x_min, x_max, grid_barrier = 0, S0 * 3, B
 
-                out_option_price = option_price_pde(S0, K, T, r, sigma, option_type, nx, nt, x_min, x_max, B)
-            else:
-                raise ValueError('Invalid barrier type')
-        elif barrier_type.lower().startswith('down'):
-            if barrier_type.lower().endswith(('in', 'out')):
-                # Calculate 'down-and-out' option
-                x_max = S0 * 3
-                x_min = B
-
-                out_option_price = option_price_pde(S0, K, T, r, sigma, option_type, nx, nt, x_min, x_max)
-            else:
-                raise ValueError('Invalid barrier type')
-        else:
-            raise ValueError('Invalid barrier type')
-
-        if barrier_type.lower().endswith('out'):
-            return out_option_price
-        elif barrier_type.lower().endswith('in'):
-            vanilla_option_price = vanilla_option_price_pde(S0, K, T, r, sigma, option_type, S0 * 3, nx, nt,)
-            return vanilla_option_price - out_option_price
-    elif option_type == 'put':
-        # Discretize asset prices
-        if barrier_type.lower().startswith('up'):
-            if barrier_type.lower().endswith(('in', 'out')):
-                # Calculate 'up-and-out' option
-                x_max = B
-                x_min = 0
-
-                out_option_price = option_price_pde(S0, K, T, r, sigma, option_type, nx, nt, x_min, x_max, )
-            else:
-                raise ValueError('Invalid barrier type')
-        elif barrier_type.lower().startswith('down'):
-            if barrier_type.lower().endswith(('in', 'out')):
-                # Calculate 'down-and-out' option
-                x_max = S0 * 3
-                x_min = 0
-
-                out_option_price = option_price_pde(S0, K, T, r, sigma, option_type, nx, nt, x_min, x_max, B)
-            else:
-                raise ValueError('Invalid barrier type')
-        else:
-            raise ValueError('Invalid barrier type')
+    # Calculate the knock-out option
+    out_option_price = option_price_pde(S0, K, T, r, sigma, option_type, nx, nt, x_min, x_max, grid_barrier,
+                                        local_vol, q, backend, artifact_store)
+
+    if barrier_type.is_out:
+        return out_option_price
+    # In-out parity
+    vanilla_option_price = vanilla_option_price_pde(S0, K, T, r, sigma, option_type, S0 * 3, nx, nt, local_vol, q,
+                                                    backend, artifact_store)
+    return vanilla_option_price - out_option_price
+
+def _implicit_diagonals_batch(x: np.ndarray, dx, dt, r, sigma, q):
+    """
+    Lower, main and upper diagonals of the implicit Black-Scholes step for a
+    stack of grids, each of shape (n, M): column m is the grid x[:, m] of
+    option m with its own dx, dt, r, sigma and q (arrays of shape (M,)). The
+    first and last rows are identity (Dirichlet boundaries).
+    """
+    sigma2_x2 = (sigma ** 2) * (x ** 2)
+    drift = (r - q) * x / (2 * dx)
+    diffusion = sigma2_x2 / (2 * (dx ** 2))
+
+    lower = -dt * (diffusion - drift)
+    diag = 1 + r * dt + 2 * dt * diffusion
+    upper = -dt * (drift + diffusion)
+    lower[[0, -1]] = upper[[0, -1]] = 0.0
+    diag[[0, -1]] = 1.0
+    return lower, diag, upper
+
+
+def option_price_pde_batch(S0, K, T, r, sigma, is_call, nx: int, nt: int, x_min, x_max, barrier=None, q=0.0
+                           ) -> np.ndarray:
+    """
+    Price M European calls/puts with the implicit scheme of option_price_pde
+    (constant coefficients), advancing all M grids together.
+
+    Every argument except nx and nt may be an array of shape (M,): each option
+    has its own grid [x_min, x_max] with nx + 1 nodes, its own time step T / nt
+    and its own coefficients. ``barrier`` knocks out the nodes at and above
+    (calls) or below (puts) the node nearest to it, as in option_price_pde;
+    NaN means no barrier.
+
+    The first and last rows of every grid's matrix are identity, so the M
+    grids stacked end to end form one tridiagonal system of M * (nx + 1)
+    independent blocks. It is factored once with LAPACK's dgttrf and each time
+    step is a single dgttrs call, so the Python loop runs once per time step
+    whatever M is. Results agree with option_price_pde to rounding.
+
+    :return: Prices at the grid node nearest to S0, shape (M,).
+    """
+    S0, K, T, r, sigma, is_call, x_min, x_max, barrier, q = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (S0, K, T, r, sigma, is_call, x_min, x_max,
+                                               np.nan if barrier is None else barrier, q)))
+    S0, K, T, r, sigma, x_min, x_max, barrier, q = (np.atleast_1d(a) for a in (S0, K, T, r, sigma, x_min, x_max,
+                                                                                barrier, q))
+    is_call = np.atleast_1d(is_call).astype(bool)
+    n_options = S0.shape[0]
+
+    dx = (x_max - x_min) / nx
+    dt = T / nt
+    # One column per option
+    x = x_min + np.arange(nx + 1)[:, None] * dx
+
+    V = np.where(is_call, np.maximum(x - K, 0), np.maximum(K - x, 0))
+
+    # Knocked-out nodes; the barrier node itself is knocked out for calls (as in option_price_pde)
+    alive = np.ones_like(V)
+    has_barrier = ~np.isnan(barrier)
+    if np.any(has_barrier):
+        barrier_idx = np.argmin(np.abs(x - np.where(has_barrier, barrier, np.inf)), axis=0)
+        nodes = np.arange(nx + 1)[:, None]
+        knocked = np.where(is_call, nodes >= barrier_idx, nodes < barrier_idx) & has_barrier
+        alive[knocked] = 0.0
+    V *= alive
+
+    record(nx=nx, nt=nt, n_options=n_options)
+
+    from scipy.linalg.lapack import dgttrf, dgttrs
+
+    with phase(MATRIX_BUILD):
+        # Option-major stacking: each grid's nodes are contiguous, and the
+        # identity boundary rows leave zeros between consecutive grids
+        lower, diag, upper = (a.T.ravel() for a in _implicit_diagonals_batch(x, dx, dt, r, sigma, q))
+        *factors, _ = dgttrf(lower[1:], diag, upper[:-1])
+
+    # The calls' upper boundary follows x_max * exp(-q * tau) - K * exp(-r * tau)
+    tau = dt * np.arange(nt + 1)[:, None]
+    boundary = np.where(is_call, x_max * np.exp(-q * tau) - K * np.exp(-r * tau), 0.0)
+    increments = np.diff(boundary, axis=0)
+
+    with phase(TIME_STEPPING):
+        V = np.ascontiguousarray(V.T).reshape(-1, 1)
+        alive = alive.T.reshape(-1, 1)
+        for step in range(nt):
+            V, _ = dgttrs(*factors, V, overwrite_b=1)
+            V[nx::nx + 1, 0] += increments[step]
+            V *= alive
+
+    x_idx = np.argmin(np.abs(x - S0), axis=0)
+    return V.reshape(n_options, nx + 1)[np.arange(n_options), x_idx]
+
+
+def barrier_option_price_pde_batch(S0, K, T, r, sigma, B, is_call, is_down, is_in, nx: int = 300, nt: int = 300,
+                                   q=0.0) -> np.ndarray:
+    """
+    Vanilla and barrier options in one option_price_pde_batch call, with the
+    grids of barrier_option_price_pde. Rows with B = NaN are vanillas (is_down
+    and is_in are then ignored); knock-ins add a vanilla grid for in-out
+    parity.
+    """
+    S0, K, T, r, sigma, B, is_call, is_down, is_in, q = (
+        np.atleast_1d(a) for a in np.broadcast_arrays(S0, K, T, r, sigma, B, is_call, is_down, is_in, q))
+    is_call, is_down, is_in = (a.astype(bool) for a in (is_call, is_down, is_in))
+    has_barrier = ~np.isnan(B)
+
+    # Down calls and up puts place the barrier on the grid boundary; up calls
+    # and down puts zero the knocked-out nodes after every step.
+    on_boundary = has_barrier & (is_call == is_down)
+    x_min = np.where(on_boundary & is_call, B, 0.0)
+    x_max = np.where(on_boundary & ~is_call, B, S0 * 3)
+    grid_barrier = np.where(on_boundary, np.nan, B)
+
+    # Knock-ins: a vanilla grid per option, appended after the knock-out grids
+    parity = np.flatnonzero(has_barrier & is_in)
+    rows = np.concatenate([np.arange(S0.shape[0]), parity])
+    grid_prices = option_price_pde_batch(S0[rows], K[rows], T[rows], r[rows], sigma[rows], is_call[rows], nx, nt,
+                                         np.append(x_min, np.zeros(parity.shape[0])),
+                                         np.append(x_max, S0[parity] * 3),
+                                         np.append(grid_barrier, np.full(parity.shape[0], np.nan)), q[rows])
+
+    prices = grid_prices[:S0.shape[0]].copy()
+    prices[parity] = grid_prices[S0.shape[0]:] - prices[parity]
+    return prices
 
-        if barrier_type.lower().endswith('out'):
-            return out_option_price
-        elif barrier_type.lower().endswith('in'):
-            vanilla_option_price = vanilla_option_price_pde(S0, K, T, r, sigma, option_type, S0 * 3, nx, nt, )
-            return vanilla_option_price - out_option_price
 
 if __name__ == "__main__":
     S0 = 100.
@@ -0,0 +1,64 @@
+# src/models/pde/pde_kernels.py
+"""
+Time-stepping kernels for the implicit scheme with constant coefficients,
+written as explicit loops so that they can be compiled with Numba. The
+tridiagonal matrix is LU-factorized once (Thomas algorithm), and every step
+is then one forward and one backward sweep. The factorization is a plain
+(3, n) array, so it can also be stored and shared (see
+src.utils.artifact_store). Use the kernels through
+``get_kernels(build, backend)`` from src.utils.jit.
+"""
+import numpy as np
+
+
+def build(jit):
+    """Return the (factorize, time_stepping) kernels decorated with ``jit``."""
+
+    @jit
+    def factorize(lower, diag, upper):
+        """
+        Thomas factorization of the tridiagonal matrix with rows M[i, i-1] = lower[i],
+        M[i, i] = diag[i], M[i, i+1] = upper[i] (lower[0] and upper[-1] are unused).
+        Returns a (3, n) array of lower, the modified super-diagonal c' and the
+        inverse pivots.
+        """
+        n = diag.shape[0]
+        factors = np.empty((3, n))
+        factors[0, :] = lower
+        factors[2, 0] = 1.0 / diag[0]
+        factors[1, 0] = upper[0] * factors[2, 0]
+        for i in range(1, n):
+            factors[2, i] = 1.0 / (diag[i] - lower[i] * factors[1, i - 1])
+            factors[1, i] = upper[i] * factors[2, i]
+        return factors
+
+    @jit
+    def time_stepping(V, factors, boundary_increments, barrier_lo, barrier_hi):
+        """
+        Run len(boundary_increments) implicit steps on V in place.
+
+        :param factors: Output of factorize.
+        :param boundary_increments: Added to the last node after each step.
+        :param barrier_lo, barrier_hi: Nodes [barrier_lo, barrier_hi) are knocked out
+                                       after each step (empty range for no barrier).
+        """
+        n = V.shape[0]
+        lower = factors[0]
+        c_prime = factors[1]
+        inv_pivot = factors[2]
+        d = np.empty(n)
+
+        for step in range(boundary_increments.shape[0]):
+            d[0] = V[0] * inv_pivot[0]
+            for i in range(1, n):
+                d[i] = (V[i] - lower[i] * d[i - 1]) * inv_pivot[i]
+            V[n - 1] = d[n - 1]
+            for i in range(n - 2, -1, -1):
+                V[i] = d[i] - c_prime[i] * V[i + 1]
+
+            V[n - 1] += boundary_increments[step]
+            for i in range(barrier_lo, barrier_hi):
+                V[i] = 0.0
+        return V
+
+    return factorize, time_stepping
@@ -1,26 +1,44 @@
 # src/models/pde_pricing.py
 
-import numpy as np
 from src.models.pricing_engine_base import PricingEngine
-from .pde_functions import *
-from ..black_scholes.black_scholes_functions import barrier_option_price_bs
+import numpy as np
+
+from .pde_functions import vanilla_option_price_pde, barrier_option_price_pde, barrier_option_price_pde_batch
+from .pde_adjoint import barrier_option_greeks_pde
+from src.market_data.yield_curve import YieldCurve
+from src.market_data.vol_surface import VolSurface
+from src.market_data.local_vol import LocalVolSurface
+from src.market_data.market import Market
+from src.utils.jit import validate_backend
+from src.utils.artifact_store import ArtifactStore
+from src.instruments.vanilla_option import VanillaOption
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.option_types import OptionType
 
 class PDEPricingEngine(PricingEngine):
     def __init__(self,
-                 interest_rate: float,
-                 volatility: float,
+                 interest_rate: float | YieldCurve,
+                 volatility: float | VolSurface | LocalVolSurface,
                  spot_price: float,
                  dividend_yield: float = 0.0,
                  nx: int = 200,
-                 nt: int = 252,):
+                 nt: int = 252,
+                 market: Market = None,
+                 backend: str = "python",
+                 artifact_store: ArtifactStore = None):
         """
         PDE Pricing Engine using a Black-Scholes setup
-        :param interest_rate:
-        :param volatility:
+        :param interest_rate: flat rate or YieldCurve (read at each option's maturity)
+        :param volatility: flat vol, VolSurface (read at each option's strike and maturity)
+                           or LocalVolSurface (state- and time-dependent coefficients)
         :param spot_price:
         :param dividend_yield:
         :param nx:
         :param nt:
+        :param market: FX rates, currency curves and pair vol surfaces for FX options
+        :param backend: "python" (scipy banded solver) or "numba" (compiled Thomas-algorithm
+                        time stepping, interpreted if Numba is not installed)
+        :param artifact_store: shares the constant-coefficient PDE operators across runs and processes
         """
         self.r = interest_rate
         self.sigma = volatility
@@ -28,14 +46,23 @@ class PDEPricingEngine(PricingEngine):
         self.q = dividend_yield
         self.nx = nx
         self.nt = nt
+        self.market = market
+        self.backend = validate_backend(backend)
+        self.artifact_store = artifact_store
+
+    def _local_vol(self):
+        return self.sigma if isinstance(self.sigma, LocalVolSurface) else None
 
     def price_vanilla_option(self, vanilla_option) -> float:
         T = vanilla_option.maturity
         K = vanilla_option.strike
         option_type = vanilla_option.option_type
         x_max = self.S0 * 3
+        r = self._zero_rate(T)
+        sigma = self._implied_vol(K, T)
 
-        return vanilla_option_price_pde(self.S0, K, T, self.r, self.sigma, option_type, x_max, self.nx, self.nt)
+        return vanilla_option_price_pde(self.S0, K, T, r, sigma, option_type, x_max, self.nx, self.nt,
+                                        self._local_vol(), self.q, self.backend, self.artifact_store)
 
     def price_barrier_option(self, barrier_option):
         T = barrier_option.maturity
@@ -43,15 +70,82 @@ class PDEPricingEngine(PricingEngine):
         B = barrier_option.barrier_level
         barrier_type = barrier_option.barrier_type
         option_type = barrier_option.option_type
+        r = self._zero_rate(T)
+        sigma = self._implied_vol(K, T)
+
+        return barrier_option_price_pde(self.S0, K, T, r, sigma, B, option_type, barrier_type, self.nx, self.nt,
+                                        self._local_vol(), self.q, self.backend, self.artifact_store)
+
+    def price_batch(self, instruments) -> list:
+        """
+        Vanilla and barrier options are priced together on one stack of grids
+        (barrier_option_price_pde_batch), each with its own rate, vol, maturity
+        and barrier. Other instruments, and local-vol engines, are priced one
+        by one.
+        """
+        if self._local_vol() is not None:
+            return super().price_batch(instruments)
+
+        prices = [None] * len(instruments)
+        batch = []
+        for i, instrument in enumerate(instruments):
+            # Exact types, so that e.g. FX barriers (own spot and rates) are priced one by one
+            if type(instrument) in (VanillaOption, BarrierOption):
+                batch.append(i)
+            else:
+                prices[i] = instrument.accept_pricer(self)
+        if not batch:
+            return prices
 
-        return barrier_option_price_pde(self.S0, K, T, self.r, self.sigma, B, option_type, barrier_type, self.nx, self.nt)
+        options = [instruments[i] for i in batch]
+        K = np.array([option.strike for option in options], dtype=float)
+        T = np.array([option.maturity for option in options], dtype=float)
+        is_call = np.array([option.option_type is OptionType.CALL for option in options])
+        barriers = [option if isinstance(option, BarrierOption) else None for option in options]
+        B = np.array([np.nan if option is None else option.barrier_level for option in barriers], dtype=float)
+        is_down = np.array([option is not None and option.barrier_type.is_down for option in barriers])
+        is_in = np.array([option is not None and option.barrier_type.is_in for option in barriers])
 
+        batch_prices = barrier_option_price_pde_batch(self.S0, K, T, self._zero_rate(T), self._implied_vol(K, T), B,
+                                                      is_call, is_down, is_in, self.nx, self.nt, self.q)
+        for i, price in zip(batch, batch_prices):
+            prices[i] = float(price)
+        return prices
+
+    def price_with_greeks(self, instrument):
+        """
+        Price and Greeks of a vanilla or barrier option from an adjoint sweep
+        of the implicit scheme (see pde_adjoint); delta and gamma are read off
+        the grid. Constant coefficients only.
+        """
+        if type(instrument) not in (VanillaOption, BarrierOption):
+            raise NotImplementedError(f"PDEPricingEngine has no adjoint Greeks for {type(instrument).__name__}")
+        if self._local_vol() is not None:
+            raise NotImplementedError("Adjoint Greeks are not implemented for local volatility.")
+
+        T = instrument.maturity
+        K = instrument.strike
+        is_barrier = isinstance(instrument, BarrierOption)
+        greeks = barrier_option_greeks_pde(self.S0, K, T, self._zero_rate(T), self._implied_vol(K, T),
+                                           instrument.barrier_level if is_barrier else None, instrument.option_type,
+                                           instrument.barrier_type if is_barrier else None, self.nx, self.nt, self.q)
+        return greeks.pop("price"), greeks
 
     def price_fx_barrier_option(self, fx_barrier_option):
         """
-        TODO: Implement a specialized FX barrier PDE if needed.
+        Garman-Kohlhagen PDE (foreign rate as dividend yield): the premium for
+        the option's notional, in its premium currency.
         """
-        raise NotImplementedError("FX Barrier pricing not yet implemented.")
+        T = fx_barrier_option.maturity
+        K = fx_barrier_option.strike
+        B = fx_barrier_option.barrier_level
+        spot, r_d, r_f, sigma = self._fx_inputs(fx_barrier_option.foreign_ccy, fx_barrier_option.domestic_ccy, K, T)
+
+        price = barrier_option_price_pde(spot, K, T, r_d, sigma, B, fx_barrier_option.option_type,
+                                         fx_barrier_option.barrier_type, self.nx, self.nt, self._local_vol(), r_f,
+                                         self.backend, self.artifact_store)
+        premium_in_foreign = fx_barrier_option.premium_ccy == fx_barrier_option.foreign_ccy
+        return float(self._fx_premium(price, spot, fx_barrier_option.notional, premium_in_foreign))
 
     def price_variance_swap_swaption(self, swaption):
         """
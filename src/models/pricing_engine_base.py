@@ -1,11 +1,105 @@
 # src/models/pricing_engine_base.py
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+from src.market_data.yield_curve import YieldCurve
+from src.market_data.vol_surface import VolSurface
+from src.market_data.local_vol import LocalVolSurface
+
+
 class PricingEngine(ABC):
     """
     Abstract class that defines the methods to price different instruments.
+
+    Engines take ``interest_rate`` either as a flat float or as a YieldCurve,
+    and ``volatility`` either as a flat float or as a VolSurface. The helpers
+    below resolve them to the flat equivalents for a given strike/maturity.
     """
 
+    def _zero_rate(self, T):
+        """Zero rate to maturity T (flat rate or YieldCurve lookup)."""
+        if isinstance(self.r, YieldCurve):
+            return self.r.zero_rate(T)
+        return self.r
+
+    def _implied_vol(self, K, T):
+        """
+        Implied volatility at (K, T) (flat vol or VolSurface lookup). Returns
+        None for a LocalVolSurface, which engines consume directly.
+        """
+        if isinstance(self.sigma, VolSurface):
+            return self.sigma.vol(K, T)
+        if isinstance(self.sigma, LocalVolSurface):
+            return None
+        return self.sigma
+
+    def _fx_inputs(self, foreign_ccy: str, domestic_ccy: str, K, T):
+        """
+        Garman-Kohlhagen inputs (spot, r_d, r_f, sigma) for an FX option on a
+        currency pair. The FX rate, currency discount curves and the pair's
+        vol surface come from ``self.market`` when it has them; otherwise the
+        engine's spot, rate, dividend yield (as the foreign rate) and
+        volatility are used. K and T may be arrays.
+        """
+        spot = r_d = r_f = sigma = None
+        market = getattr(self, "market", None)
+        if market is not None:
+            spot = market.get_fx_rate(foreign_ccy, domestic_ccy)
+            r_d = _curve_rate(market.get_discount_curve(domestic_ccy), T)
+            r_f = _curve_rate(market.get_discount_curve(foreign_ccy), T)
+            surface = market.get_vol_surface(foreign_ccy + domestic_ccy)
+            if surface is not None:
+                sigma = surface.vol(K, T)
+
+        if spot is None:
+            spot = self.S0
+        if r_d is None:
+            r_d = self._zero_rate(T)
+        if r_f is None:
+            r_f = self.q
+        if sigma is None:
+            sigma = self._implied_vol(K, T)
+        return spot, r_d, r_f, sigma
+
+    @staticmethod
+    def _fx_premium(price, spot, notional, premium_in_foreign):
+        """
+        Scale a price per unit of foreign notional (in domestic currency) by the
+        notional, and convert it to the foreign currency where requested.
+        """
+        premium = price * notional
+        return np.where(premium_in_foreign, premium / spot, premium)
+
+    def price_fx_barrier_options(self, fx_barrier_options) -> np.ndarray:
+        """
+        Price a list of FX barrier options, returning premiums in input order.
+        Engines with a vectorized pass override this.
+        """
+        return np.array([self.price_fx_barrier_option(option) for option in fx_barrier_options], dtype=float)
+
+    def price_batch(self, instruments) -> list:
+        """
+        Price a list of instruments, returning fair values in input order.
+        Engines that can share work across instruments (vectorized formulas,
+        one path set per maturity, ...) override this.
+        """
+        return [instrument.accept_pricer(self) for instrument in instruments]
+
+    def price_with_greeks(self, instrument):
+        """
+        (price, greeks) for an instrument, the Greeks in a dict keyed "delta",
+        "gamma", "vega", ... Engines with adjoint sensitivities override this.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not compute Greeks")
+
+    def price_path_dependent_option(self, option):
+        """
+        Asian, lookback and digital options. Only engines that simulate paths
+        support them by default.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not price {type(option).__name__}")
+
     @abstractmethod
     def price_vanilla_option(self, vanilla_option):
         pass
@@ -21,3 +115,12 @@ class PricingEngine(ABC):
     @abstractmethod
     def price_variance_swap_swaption(self, swaption):
         pass
+
+
+def _curve_rate(curve, T):
+    """Zero rate to T from a YieldCurve, a flat rate, or None."""
+    if curve is None:
+        return None
+    if isinstance(curve, YieldCurve):
+        return curve.zero_rate(T)
+    return curve
@@ -0,0 +1,177 @@
+# src/models/variance_swaption/variance_swaption_functions.py
+"""
+Semi-analytic pricing of variance swap swaptions under the two-factor
+forward variance model of ``variance_swap_swaption_price_mc``:
+
+    d xi_t(u) = 2 nu alpha xi_t(u) [(1 - theta) e^{-k1 (u - t)} dW1 + theta e^{-k2 (u - t)} dW2],
+
+with corr(W1, W2) = rho and a flat initial curve xi_0(u) = var_swap_spot.
+At expiry T1 every forward variance is lognormal in the same two Gaussian
+factors Y_i = int_0^T1 e^{-k_i (T1 - s)} dW_i:
+
+    xi_T1(u) = xi_0 exp(b(u) . Y - 1/2 b(u)' C b(u)),
+    b(u) = 2 nu alpha [(1 - theta) e^{-k1 (u - T1)}, theta e^{-k2 (u - T1)}],
+
+where C is the covariance of Y. The swaption pays
+max(1 / (T2 - T1) int_T1^T2 xi_T1(u) du - K, 0) at T1. The u-integral is
+taken with Gauss-Legendre nodes, and the expectation either by quadrature
+over the factors (closed form in one, Gauss-Hermite in the other) or by
+matching the first two moments of the average to a lognormal (Black's
+formula).
+"""
+import numpy as np
+
+from src.utils.stats import norm
+
+
+def _decay_integral(k: float, T: float) -> float:
+    """int_0^T e^{-k (T - s)} ds."""
+    return T if k == 0 else -np.expm1(-k * T) / k
+
+
+def factor_covariance(T1: float, k1: float, k2: float, rho: float) -> np.ndarray:
+    """Covariance matrix of the two Gaussian factors (Y1, Y2) at T1."""
+    c12 = rho * _decay_integral(k1 + k2, T1)
+    return np.array([[_decay_integral(2 * k1, T1), c12],
+                     [c12, _decay_integral(2 * k2, T1)]])
+
+
+def factor_loadings(u, T1: float, params: dict) -> np.ndarray:
+    """Loadings b(u) of log xi_T1(u) on (Y1, Y2), shape u.shape + (2,)."""
+    nu, theta, k1, k2, rho = params['nu'], params['theta'], params['k1'], params['k2'], params['rho']
+    alpha_theta = 1 / np.sqrt((1 - theta)**2 + theta**2 + 2 * rho * theta * (1 - theta))
+    tau = np.asarray(u, dtype=float) - T1
+    return 2 * nu * alpha_theta * np.stack([(1 - theta) * np.exp(-k1 * tau), theta * np.exp(-k2 * tau)], axis=-1)
+
+
+def averaging_nodes(T1: float, T2, n_u: int):
+    """
+    Gauss-Legendre nodes and weights of the average over [T1, T2] for each
+    T2, shapes (n_T2, n_u); the weights of each row sum to one.
+    """
+    T2 = np.atleast_1d(np.asarray(T2, dtype=float))
+    if np.any(T2 <= T1) or T1 <= 0:
+        raise ValueError("Variance swaption needs 0 < T1 < T2")
+    x, w = np.polynomial.legendre.leggauss(n_u)
+    u = T1 + np.outer(T2 - T1, (x + 1) / 2)
+    return u, np.broadcast_to(w / 2, u.shape)
+
+
+def _check_inputs(K, T2):
+    K = np.asarray(K, dtype=float)
+    if np.any(K < 0):
+        raise ValueError("Variance swaption strikes must be non-negative")
+    return K, np.shape(K) + np.shape(T2)
+
+
+def variance_swap_swaption_price_quad(var_swap_spot, K, r, T1, T2, params, n_nodes: int = 16, n_u: int = 32,
+                                      newton_iterations: int = 6):
+    """
+    Price by quadrature over the two factors.
+
+    Writing Y = L Z with Z1, Z2 independent standard normals and L the
+    Cholesky factor of C, the average forward variance is increasing in Z2
+    for fixed Z1 (theta > 0). The Z2-expectation of the payoff is then closed
+    form once the exercise boundary z* with V(z1, z*) = K is known:
+
+        E[(V - K)^+ | z1] = sum_u w_u A_u(z1) e^{c_u^2 / 2} N(c_u - z*) - K N(-z*),
+
+    where V(z1, z2) = sum_u w_u A_u(z1) e^{c_u z2}. z* is found by Newton's
+    method, which converges monotonically from above since V is convex in z2,
+    and the smooth outer expectation over Z1 uses Gauss-Hermite nodes.
+
+    Parameters
+    ----------
+    var_swap_spot : float
+        Flat initial forward variance xi_0.
+    K : float or array_like
+        Strikes (in variance units).
+    r : float
+        Zero rate to T1.
+    T1 : float
+        Swaption expiry (start of the variance swap).
+    T2 : float or array_like
+        Variance swap maturities, all after T1.
+    params : dict
+        Model parameters ``nu``, ``theta``, ``k1``, ``k2``, ``rho``.
+    n_nodes : int, optional
+        Gauss-Hermite nodes of the outer factor.
+    n_u : int, optional
+        Gauss-Legendre nodes of the average over [T1, T2].
+    newton_iterations : int, optional
+        Newton steps of the exercise boundary search.
+
+    Returns
+    -------
+    np.ndarray
+        Prices of shape ``K.shape + T2.shape``.
+    """
+    K, shape = _check_inputs(K, T2)
+    u, w_u = averaging_nodes(T1, T2, n_u)
+    cov = factor_covariance(T1, params['k1'], params['k2'], params['rho'])
+    b = factor_loadings(u, T1, params)
+
+    # Y = L Z, written out so that the degenerate |rho| = 1 case is allowed
+    l11 = np.sqrt(cov[0, 0])
+    l21 = cov[0, 1] / l11
+    l22 = np.sqrt(max(cov[1, 1] - l21**2, 0.0))
+
+    z1, weights = np.polynomial.hermite_e.hermegauss(n_nodes)
+    weights = weights / np.sqrt(2 * np.pi)
+
+    # log A_u(z1) on (z1 node, T2, u node), and the loadings c_u on Z2
+    variance = np.einsum('tuf,fg,tug->tu', b, cov, b)
+    log_a = (np.log(var_swap_spot) - 0.5 * variance
+             + z1[:, None, None] * (b[..., 0] * l11 + b[..., 1] * l21))
+    c = b[..., 1] * l22
+    strikes = K.reshape(-1)[None, :, None]
+
+    if not np.any(c > 0):
+        # One-factor case: V does not depend on Z2
+        average = np.einsum('ntu,tu->nt', np.exp(log_a), w_u)
+        payoff = np.maximum(average[:, None, :] - strikes, 0.0)
+        prices = np.einsum('n,nkt->kt', weights, payoff)
+        return (np.exp(-r * T1) * prices).reshape(shape)
+
+    # Exercise boundary on (z1 node, strike, T2). Starting from max_u log(K / A_u) / c_u, where every
+    # term of V is at least K, Newton's method decreases monotonically to the root.
+    log_a, c, w = log_a[:, None], c[None, None], w_u[None, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z_star = np.max((np.log(strikes)[..., None] - log_a) / np.where(c > 0, c, np.nan), axis=-1)
+        exercised_always = ~np.isfinite(z_star)
+        z_star = np.where(exercised_always, 0.0, z_star)
+        for _ in range(newton_iterations):
+            terms = w * np.exp(log_a + c * z_star[..., None])
+            z_star = z_star - (terms.sum(axis=-1) - strikes) / np.einsum('...u,...u->...', terms, c)
+    z_star = np.where(exercised_always, -np.inf, z_star)
+
+    conditional = (np.einsum('...u,...u->...', w * np.exp(log_a + 0.5 * c**2), norm.cdf(c - z_star[..., None]))
+                   - strikes * norm.cdf(-z_star))
+    prices = np.exp(-r * T1) * np.einsum('n,nkt->kt', weights, conditional)
+    return prices.reshape(shape)
+
+
+def variance_swap_swaption_price_mm(var_swap_spot, K, r, T1, T2, params, n_u: int = 32):
+    """
+    Price by lognormal moment matching of the average forward variance.
+
+    The average has mean xi_0 and second moment
+    xi_0^2 sum_ij w_i w_j exp(b(u_i)' C b(u_j)); a lognormal with the same two
+    moments has total variance s^2 = log(E[V^2] / xi_0^2), and the price is
+    Black's formula on the forward xi_0. Same parameters and return shape as
+    variance_swap_swaption_price_quad.
+    """
+    K, shape = _check_inputs(K, T2)
+    u, w_u = averaging_nodes(T1, T2, n_u)
+    cov = factor_covariance(T1, params['k1'], params['k2'], params['rho'])
+    b = factor_loadings(u, T1, params)
+
+    second_moment = np.einsum('tu,tuv,tv->t', w_u, np.exp(np.einsum('tuf,fg,tvg->tuv', b, cov, b)), w_u)
+    s = np.sqrt(np.log(second_moment))
+
+    K = K.reshape(-1)[:, None]
+    with np.errstate(divide='ignore'):
+        d1 = (np.log(var_swap_spot / K) + 0.5 * s**2) / s
+    d2 = d1 - s
+    prices = np.exp(-r * T1) * (var_swap_spot * norm.cdf(d1) - K * norm.cdf(d2))
+    return prices.reshape(shape)
@@ -0,0 +1,176 @@
+# src/utils/artifact_store.py
+"""
+Optional on-disk store for large, deterministic intermediate arrays (GBM
+normals or paths, PDE operators), shared between processes through
+read-only memory maps.
+
+Every artifact is a ``<key>.npy`` file plus a ``<key>.json`` record with its
+inputs, shape, dtype, size and SHA-256. Both are written to temporary files
+and renamed into place, the record last, so readers never see a partial
+artifact. Loads check the record against the file header and size (and the
+checksum if ``verify_checksums`` is set); a mismatch drops the artifact and
+it is rebuilt. The store is size-bounded: after each write the least
+recently used artifacts are evicted until it fits in ``max_bytes``.
+
+    store = ArtifactStore("/scratch/pricing-cache", max_bytes=8 * 2**30)
+    normals = store.get_or_create("gbm_normals", {"seed": 7, "n_paths": 10**6, "n_steps": 252},
+                                  lambda: np.random.default_rng(7).standard_normal((10**6, 252)))
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+
+def _canonical(value):
+    if isinstance(value, (np.floating, float)):
+        return repr(float(value))
+    if isinstance(value, (np.integer, int, bool, str)) or value is None:
+        return value
+    if isinstance(value, np.ndarray):
+        return {"sha256": hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest(),
+                "shape": list(value.shape), "dtype": str(value.dtype)}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items())}
+    raise TypeError(f"Cannot use {type(value).__name__} as an artifact input")
+
+
+def _checksum(path: str, offset: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for block in iter(lambda: f.read(1 << 22), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ArtifactStore:
+    def __init__(self, root: str, max_bytes: int = 4 * 2 ** 30, verify_checksums: bool = False):
+        """
+        :param root: Directory of the store (created if needed); may be shared by many processes.
+        :param max_bytes: Total size of the .npy files above which the least recently used are evicted.
+        :param verify_checksums: Re-hash every artifact on load (reads the whole file) instead of
+                                 only checking its header and size.
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.verify_checksums = verify_checksums
+        os.makedirs(root, exist_ok=True)
+
+    @staticmethod
+    def key(namespace: str, inputs: dict) -> str:
+        """Deterministic key of an artifact from its namespace and inputs."""
+        payload = json.dumps({"namespace": namespace, "inputs": _canonical(inputs)}, sort_keys=True)
+        return f"{namespace}-{hashlib.sha256(payload.encode()).hexdigest()[:32]}"
+
+    def _paths(self, key: str):
+        return os.path.join(self.root, key + ".npy"), os.path.join(self.root, key + ".json")
+
+    def get(self, key: str):
+        """Read-only memmap of the artifact, or None if it is missing or fails its checks."""
+        data_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            array = np.load(data_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+        try:
+            valid = (list(array.shape) == meta["shape"] and str(array.dtype) == meta["dtype"]
+                     and os.path.getsize(data_path) == array.offset + meta["nbytes"])
+            if valid and self.verify_checksums:
+                valid = _checksum(data_path, array.offset) == meta["sha256"]
+        except FileNotFoundError:
+            # Evicted by another process while we were checking it
+            return None
+        if not valid:
+            del array
+            self.discard(key)
+            return None
+
+        # Record the access for LRU eviction. Another process may have evicted the
+        # artifact since it was opened; the memmap stays valid after the unlink.
+        try:
+            os.utime(meta_path)
+        except FileNotFoundError:
+            pass
+        return array
+
+    def put(self, key: str, array: np.ndarray, inputs: dict = None):
+        """Store ``array`` under ``key`` and return a read-only memmap of it."""
+        array = np.ascontiguousarray(array)
+        data_path, meta_path = self._paths(key)
+
+        fd, tmp_data = tempfile.mkstemp(dir=self.root, suffix=".npy.tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, array)
+        meta = {
+            "shape": list(array.shape),
+            "dtype": str(array.dtype),
+            "nbytes": int(array.nbytes),
+            "sha256": hashlib.sha256(array.data).hexdigest(),
+            "inputs": _canonical(inputs or {}),
+            "created": time.time(),
+        }
+        fd, tmp_meta = tempfile.mkstemp(dir=self.root, suffix=".json.tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_data, data_path)
+        os.replace(tmp_meta, meta_path)
+
+        self.evict(keep=key)
+        return np.load(data_path, mmap_mode="r")
+
+    def get_or_create(self, namespace: str, inputs: dict, build):
+        """Load the artifact for (namespace, inputs), building and storing it with ``build()`` if needed."""
+        key = self.key(namespace, inputs)
+        array = self.get(key)
+        if array is None:
+            array = self.put(key, build(), inputs)
+        return array
+
+    def discard(self, key: str):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def entries(self) -> list:
+        """(key, size in bytes, last access time) of the stored artifacts, oldest access first."""
+        entries = []
+        for name in os.listdir(self.root):
+            if not name.endswith(".json"):
+                continue
+            key = name[:-5]
+            data_path, meta_path = self._paths(key)
+            try:
+                entries.append((key, os.path.getsize(data_path), os.path.getmtime(meta_path)))
+            except FileNotFoundError:
+                continue
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep: str = None):
+        """Drop least recently used artifacts until the store fits in max_bytes."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for key, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self.discard(key)
+            total -= size
+
+    def clear(self):
+        for key, _, _ in self.entries():
+            self.discard(key)
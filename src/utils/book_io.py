@@ -0,0 +1,111 @@
+# src/utils/book_io.py
+"""
+Bulk loading of option books into columnar OptionBook arrays.
+
+Books are tables with the columns ``strike``, ``maturity``, ``option_type``
+and optionally ``barrier_level``, ``barrier_type`` (empty for vanillas),
+``rebate`` and ``id``, stored as CSV, Parquet or NPZ:
+
+    book = load_book("book.parquet")
+    prices = BlackScholesEngine(0.02, 0.2, 100.0).price_option_book(book)
+
+Nothing is built per row: CSV goes through np.genfromtxt, Parquet string
+columns are dictionary-encoded by Arrow, and labels are parsed once per
+distinct value. Parquet support needs pyarrow, imported on first use.
+"""
+import numpy as np
+
+from src.instruments.option_book import OptionBook
+
+BOOK_FORMATS = ("csv", "parquet", "npz")
+_COLUMNS = ("strike", "maturity", "option_type", "barrier_level", "barrier_type", "rebate", "id")
+
+
+def _format(path: str, fmt: str = None) -> str:
+    if fmt is None:
+        fmt = path.rsplit(".", 1)[-1].lower()
+        fmt = "parquet" if fmt == "pq" else fmt
+    if fmt not in BOOK_FORMATS:
+        raise ValueError(f"Unknown book format '{fmt}', expected one of {BOOK_FORMATS}")
+    return fmt
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Parquet support requires pyarrow (pip install pyarrow)") from None
+    return pyarrow
+
+
+def _book_from_columns(columns: dict) -> OptionBook:
+    missing = [name for name in ("strike", "maturity", "option_type") if name not in columns]
+    if missing:
+        raise ValueError(f"Book is missing required columns {missing}")
+    return OptionBook(columns["strike"], columns["maturity"], columns["option_type"],
+                      columns.get("barrier_level"), columns.get("barrier_type"), columns.get("rebate"),
+                      columns.get("id"))
+
+
+def _arrow_columns(table) -> dict:
+    columns = {}
+    for name in table.column_names:
+        if name not in _COLUMNS:
+            continue
+        column = table.column(name).combine_chunks()
+        if column.type == "string" or column.type == "large_string":
+            # Labels: decode the few distinct values, map rows through the indices
+            encoded = column.fill_null("").dictionary_encode()
+            labels = np.array(encoded.dictionary.to_pylist(), dtype=str)
+            columns[name] = labels[encoded.indices.to_numpy()]
+        else:
+            columns[name] = column.to_numpy(zero_copy_only=False)
+    return columns
+
+
+def load_book(path: str, fmt: str = None) -> OptionBook:
+    """Load a whole book from CSV, Parquet or NPZ (format from the extension unless given)."""
+    fmt = _format(path, fmt)
+    if fmt == "npz":
+        with np.load(path, allow_pickle=False) as data:
+            return _book_from_columns({name: data[name] for name in data.files})
+    if fmt == "parquet":
+        pyarrow = _import_pyarrow()
+        return _book_from_columns(_arrow_columns(pyarrow.parquet.read_table(path)))
+
+    table = np.genfromtxt(path, delimiter=",", names=True, dtype=None, encoding="utf-8", autostrip=True,
+                          ndmin=1)
+    # Empty numeric fields of vanilla rows come back as NaN, empty labels as ""
+    return _book_from_columns({name: table[name] for name in table.dtype.names})
+
+
+def iter_book(path: str, batch_size: int = 100_000, fmt: str = None):
+    """
+    Yield the book as OptionBook batches of at most ``batch_size`` rows.
+    Parquet files are streamed by record batch; other formats are loaded
+    once and sliced.
+    """
+    fmt = _format(path, fmt)
+    if fmt == "parquet":
+        pyarrow = _import_pyarrow()
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            yield _book_from_columns(_arrow_columns(pyarrow.Table.from_batches([batch])))
+        return
+    book = load_book(path, fmt)
+    for start in range(0, len(book), batch_size):
+        yield book.take(slice(start, start + batch_size))
+
+
+def save_book(book: OptionBook, path: str, fmt: str = None):
+    """Write a book to NPZ or Parquet (CSV books are meant to be written by upstream systems)."""
+    fmt = _format(path, fmt)
+    columns = book.columns()
+    if fmt == "npz":
+        np.savez(path, **columns)
+    elif fmt == "parquet":
+        pyarrow = _import_pyarrow()
+        pyarrow.parquet.write_table(pyarrow.table(columns), path)
+    else:
+        raise ValueError("save_book writes npz or parquet")
@@ -0,0 +1,201 @@
+# src/utils/instrumentation.py
+"""
+Opt-in pricing instrumentation.
+
+Engines and numeric kernels mark their phases with ``phase(name)`` and report
+problem sizes with ``record(...)``. Both are no-ops unless a recorder is
+active, so the cost when instrumentation is off is one context-variable
+lookup per call site:
+
+    with instrumented(track_memory=True) as recorder:
+        price = instrument.accept_pricer(engine)
+    recorder.to_dict()
+    # {'timings': {'path_generation': 0.41, 'payoff_reduction': 0.02},
+    #  'calls': {...}, 'counters': {'n_paths': 100000, 'n_steps': 252},
+    #  'peak_memory': {'path_generation': 404000512, ...}}
+
+``ValuationRequest`` does this for you when instrumentation is enabled (per
+request or globally with ``configure``) and passes the result to every hook
+registered with ``add_export_hook``.
+"""
+import time
+import tracemalloc
+from contextvars import ContextVar
+
+# Standard phase names used by the engines
+PATH_GENERATION = "path_generation"
+PAYOFF_REDUCTION = "payoff_reduction"
+MATRIX_BUILD = "matrix_build"
+TIME_STEPPING = "time_stepping"
+CLOSED_FORM = "closed_form"
+
+_active = ContextVar("pricing_instrumentation", default=None)
+_export_hooks = []
+_settings = {"enabled": False, "track_memory": False}
+
+
+class Instrumentation:
+    """
+    Accumulates wall time and call counts per phase, counters (path counts,
+    grid sizes, ...) and, if ``track_memory`` is set, the tracemalloc
+    high-water mark per phase in bytes. Repeated phases add up their times
+    and keep the largest peak. Times are exclusive: a phase nested in another
+    (e.g. a local-vol matrix rebuild inside time stepping) is not counted in
+    the enclosing one, so the phase timings add up to at most the total.
+    """
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory
+        self.timings = {}
+        self.calls = {}
+        self.counters = {}
+        self.peak_memory = {}
+        self._memory_stack = []
+        self._phase_stack = []
+
+    def _enter_memory(self):
+        # Fold the peak reached so far into the enclosing phases before
+        # resetting it for this one.
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in self._memory_stack:
+            frame[0] = max(frame[0], peak)
+        tracemalloc.reset_peak()
+        self._memory_stack.append([0])
+
+    def _exit_memory(self, name: str):
+        frame = self._memory_stack.pop()
+        peak = max(frame[0], tracemalloc.get_traced_memory()[1])
+        for parent in self._memory_stack:
+            parent[0] = max(parent[0], peak)
+        self.peak_memory[name] = max(self.peak_memory.get(name, 0), peak)
+
+    def add_time(self, name: str, elapsed: float):
+        self.timings[name] = self.timings.get(name, 0.0) + elapsed
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def to_dict(self) -> dict:
+        info = {
+            "timings": dict(self.timings),
+            "calls": dict(self.calls),
+            "counters": dict(self.counters),
+        }
+        if self.track_memory:
+            info["peak_memory"] = dict(self.peak_memory)
+        return info
+
+
+class _Phase:
+    __slots__ = ("recorder", "name", "start", "nested")
+
+    def __init__(self, recorder: Instrumentation, name: str):
+        self.recorder = recorder
+        self.name = name
+        self.nested = 0.0
+
+    def __enter__(self):
+        if self.recorder.track_memory:
+            self.recorder._enter_memory()
+        self.recorder._phase_stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        stack = self.recorder._phase_stack
+        stack.pop()
+        if stack:
+            stack[-1].nested += elapsed
+        self.recorder.add_time(self.name, elapsed - self.nested)
+        if self.recorder.track_memory:
+            self.recorder._exit_memory(self.name)
+        return False
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def phase(name: str):
+    """Context manager timing the named phase if a recorder is active."""
+    recorder = _active.get()
+    if recorder is None:
+        return _NULL_PHASE
+    return _Phase(recorder, name)
+
+
+def record(**counters):
+    """Record counters (e.g. n_paths=..., nx=...) if a recorder is active."""
+    recorder = _active.get()
+    if recorder is not None:
+        recorder.counters.update(counters)
+
+
+def is_active() -> bool:
+    return _active.get() is not None
+
+
+class instrumented:
+    """
+    Context manager activating a fresh Instrumentation recorder for the
+    current context. tracemalloc is started for the block if memory tracking
+    is requested and it is not already running.
+    """
+    def __init__(self, track_memory: bool = False):
+        self.recorder = Instrumentation(track_memory)
+        self._token = None
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> Instrumentation:
+        if self.recorder.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._token = _active.set(self.recorder)
+        return self.recorder
+
+    def __exit__(self, *exc):
+        _active.reset(self._token)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        return False
+
+
+def configure(enabled: bool = None, track_memory: bool = None):
+    """
+    Set the global defaults used by ValuationRequest when a request does not
+    say whether it should be instrumented.
+    """
+    if enabled is not None:
+        _settings["enabled"] = enabled
+    if track_memory is not None:
+        _settings["track_memory"] = track_memory
+
+
+def settings() -> dict:
+    return dict(_settings)
+
+
+def add_export_hook(hook):
+    """
+    Register ``hook(info: dict)``, called with the instrumentation info of
+    every instrumented valuation (e.g. to push to a metrics system).
+    """
+    if hook not in _export_hooks:
+        _export_hooks.append(hook)
+
+
+def remove_export_hook(hook):
+    if hook in _export_hooks:
+        _export_hooks.remove(hook)
+
+
+def export(info: dict):
+    for hook in list(_export_hooks):
+        hook(info)
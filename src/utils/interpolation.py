@@ -0,0 +1,87 @@
+# src/utils/interpolation.py
+import numpy as np
+
+
+def natural_cubic_coefficients(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Precompute the piecewise-polynomial coefficients of a natural cubic spline.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Strictly increasing knots, shape (n,).
+    y : np.ndarray
+        Values at the knots. The spline is built along the last axis, so
+        shape (..., n) builds one spline per leading index.
+
+    Returns
+    -------
+    coeffs : np.ndarray
+        Array of shape (..., n-1, 4). For x[i] <= t < x[i+1] the spline is
+        c[i, 0] + c[i, 1]*h + c[i, 2]*h**2 + c[i, 3]*h**3 with h = t - x[i].
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = x.shape[0]
+    if n < 2:
+        raise ValueError("A spline needs at least two knots.")
+
+    h = np.diff(x)
+    if np.any(h <= 0):
+        raise ValueError("Spline knots must be strictly increasing.")
+
+    slope = np.diff(y, axis=-1) / h
+
+    # Second derivatives m[1:-1] from the tridiagonal system, m[0] = m[-1] = 0.
+    m = np.zeros(y.shape)
+    if n > 2:
+        sub = h[1:-1].copy()
+        diag = 2.0 * (h[:-1] + h[1:])
+        rhs = 6.0 * (slope[..., 1:] - slope[..., :-1])
+
+        # Thomas algorithm, vectorised over the leading axes of y
+        for i in range(1, n - 2):
+            w = sub[i - 1] / diag[i - 1]
+            diag[i] -= w * h[i]
+            rhs[..., i] -= w * rhs[..., i - 1]
+        m_inner = np.empty(rhs.shape)
+        m_inner[..., -1] = rhs[..., -1] / diag[-1]
+        for i in range(n - 4, -1, -1):
+            m_inner[..., i] = (rhs[..., i] - h[i + 1] * m_inner[..., i + 1]) / diag[i]
+        m[..., 1:-1] = m_inner
+
+    coeffs = np.empty(y.shape[:-1] + (n - 1, 4))
+    coeffs[..., 0] = y[..., :-1]
+    coeffs[..., 1] = slope - h * (2.0 * m[..., :-1] + m[..., 1:]) / 6.0
+    coeffs[..., 2] = m[..., :-1] / 2.0
+    coeffs[..., 3] = (m[..., 1:] - m[..., :-1]) / (6.0 * h)
+    return coeffs
+
+
+def linear_coefficients(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Piecewise-linear interpolant in the same (..., n-1, 4) layout as
+    natural_cubic_coefficients, so both can be evaluated by evaluate_piecewise.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if np.any(np.diff(x) <= 0):
+        raise ValueError("Interpolation knots must be strictly increasing.")
+
+    coeffs = np.zeros(y.shape[:-1] + (x.shape[0] - 1, 4))
+    coeffs[..., 0] = y[..., :-1]
+    coeffs[..., 1] = np.diff(y, axis=-1) / np.diff(x)
+    return coeffs
+
+
+def evaluate_piecewise(x: np.ndarray, coeffs: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a piecewise cubic at t with flat extrapolation outside [x[0], x[-1]].
+
+    ``coeffs`` has shape (n-1, 4); t may have any shape.
+    """
+    t = np.clip(t, x[0], x[-1])
+    idx = np.clip(np.searchsorted(x, t, side="right") - 1, 0, x.shape[0] - 2)
+    c = coeffs[idx]
+    h = t - x[idx]
+    return c[..., 0] + h * (c[..., 1] + h * (c[..., 2] + h * c[..., 3]))
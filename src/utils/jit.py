@@ -0,0 +1,61 @@
+# src/utils/jit.py
+"""
+Optional Numba backend for the scalar pricing kernels.
+
+Kernels are written as plain Python on floats, bools and NumPy arrays, so
+they run unchanged in the interpreter. A kernel module exposes a builder
+``build(jit)`` that decorates each of its functions with ``jit`` and returns
+them; helpers are closed over, so compiled kernels call compiled helpers.
+``get_kernels(build, backend)`` calls the builder once per backend with
+either an identity decorator ("python") or ``numba.njit`` ("numba").
+
+Numba is only imported when a compiled kernel is first requested; if it is
+not installed the pure-Python kernels are used and a RuntimeWarning is
+issued once.
+"""
+import warnings
+
+BACKENDS = ("python", "numba")
+
+_compiled = {}
+_numba = None
+_numba_missing = False
+
+
+def validate_backend(backend: str) -> str:
+    backend = backend.lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend must be one of {BACKENDS}, got '{backend}'")
+    return backend
+
+
+def numba_available() -> bool:
+    return _load_numba(warn=False) is not None
+
+
+def _load_numba(warn: bool = True):
+    global _numba, _numba_missing
+    if _numba is None and not _numba_missing:
+        try:
+            import numba
+            _numba = numba
+        except ImportError:
+            _numba_missing = True
+            if warn:
+                warnings.warn("numba is not installed; falling back to the pure-Python kernels.", RuntimeWarning)
+    return _numba
+
+
+def _identity(fn):
+    return fn
+
+
+def get_kernels(build, backend: str):
+    """Return ``build(jit)`` for ``backend``, cached per (builder, backend)."""
+    key = (build, backend)
+    kernels = _compiled.get(key)
+    if kernels is None:
+        numba = _load_numba() if backend == "numba" else None
+        kernels = build(_identity if numba is None else numba.njit)
+        _compiled[key] = kernels
+    return kernels
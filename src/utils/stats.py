@@ -0,0 +1,41 @@
+# src/utils/stats.py
+"""
+Light-weight normal distribution helpers.
+
+Importing scipy.stats costs a large part of a pricing worker's start-up, and
+the engines only need the standard normal CDF. Scalars go through
+math.erfc; arrays through scipy.special.ndtr, imported on first use.
+"""
+import math
+
+import numpy as np
+
+_ndtr = None
+
+
+def _load_ndtr():
+    global _ndtr
+    from scipy.special import ndtr
+    _ndtr = ndtr
+    return ndtr
+
+
+def norm_cdf(x):
+    """Standard normal CDF of a scalar or an array."""
+    if isinstance(x, (float, int)):
+        return 0.5 * math.erfc(-x / math.sqrt(2.0))
+    ndtr = _ndtr or _load_ndtr()
+    result = ndtr(x)
+    return float(result) if np.ndim(result) == 0 else result
+
+
+class _StandardNormal:
+    """Drop-in for the ``scipy.stats.norm.cdf`` calls of the pricing kernels."""
+    __slots__ = ()
+
+    @staticmethod
+    def cdf(x):
+        return norm_cdf(x)
+
+
+norm = _StandardNormal()
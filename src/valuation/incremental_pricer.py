@@ -0,0 +1,170 @@
+# src/valuation/incremental_pricer.py
+"""
+Incremental re-pricing of a book on market data ticks.
+
+Every position records the market fields it depends on (spot and vol
+surface of its underlying, the yield curve; or the FX rate, currency curves
+and pair vol surface of an FX option). The pricer subscribes to the Market
+and keeps an index from each field to the positions that read it, so a tick
+only marks those positions stale. ``update()`` then re-prices just the stale
+positions:
+
+    pricer = IncrementalPricer(market, taylor_threshold=0.005)
+    pricer.add_position("call-1", option, "STOCK_XYZ", engine_factory)
+    pricer.price_all()
+    market.set_spot_price("STOCK_XYZ", 100.3)
+    pricer.update()   # {"call-1": ValuationResult(...)}, from a delta/gamma update
+
+A pure spot move of at most ``taylor_threshold`` (relative to the spot of
+the last full valuation) is applied as a second-order Taylor update from
+bump-and-reprice delta and gamma; anything else is a full re-pricing with an
+engine freshly built from the market.
+"""
+import copy
+
+from ..instruments.fx_option import FXBarrierOption
+from ..market_data.market import Market, SPOT, VOL_SURFACE, YIELD_CURVE, FX_RATE, DISCOUNT_CURVE
+from .valuation_result import ValuationResult
+
+
+class Position:
+    def __init__(self, position_id, instrument, symbol: str, engine_factory, quantity: float = 1.0,
+                 depends_on=None):
+        """
+        :param symbol: Underlying symbol in the Market (spot and vol surface key).
+        :param engine_factory: ``engine_factory(market)`` returns the PricingEngine for this
+                               position, reading the current market data.
+        :param depends_on: (field, key) market addresses the price depends on; derived from the
+                           instrument if None.
+        """
+        self.position_id = position_id
+        self.instrument = instrument
+        self.symbol = symbol
+        self.engine_factory = engine_factory
+        self.quantity = quantity
+        self.depends_on = set(depends_on) if depends_on is not None else self._default_dependencies()
+        # State of the last full valuation
+        self.result = None
+        self.anchor_spot = None
+        self.anchor_price = None
+
+    def _default_dependencies(self) -> set:
+        if isinstance(self.instrument, FXBarrierOption):
+            foreign, domestic = self.instrument.foreign_ccy, self.instrument.domestic_ccy
+            return {(FX_RATE, foreign + domestic), (FX_RATE, domestic + foreign),
+                    (DISCOUNT_CURVE, foreign), (DISCOUNT_CURVE, domestic),
+                    (VOL_SURFACE, foreign + domestic), (YIELD_CURVE, None)}
+        return {(SPOT, self.symbol), (VOL_SURFACE, self.symbol), (YIELD_CURVE, None)}
+
+
+class IncrementalPricer:
+    def __init__(self, market: Market, taylor_threshold: float = 0.0, bump: float = 1e-3):
+        """
+        :param taylor_threshold: Largest relative spot move (since the last full valuation) applied
+                                 as a delta/gamma update; 0 always re-prices in full.
+        :param bump: Relative spot bump of the central-difference delta and gamma. Monte Carlo
+                     engines need a ``seed`` for stable bumped prices.
+        """
+        self.market = market
+        self.taylor_threshold = taylor_threshold
+        self.bump = bump
+        self.positions = {}
+        self._index = {}
+        self._stale = {}
+        self.stats = {"full": 0, "taylor": 0, "skipped": 0}
+        market.subscribe(self._on_change)
+
+    def close(self):
+        self.market.unsubscribe(self._on_change)
+
+    def add_position(self, position_id, instrument, symbol: str, engine_factory, quantity: float = 1.0,
+                     depends_on=None) -> Position:
+        position = Position(position_id, instrument, symbol, engine_factory, quantity, depends_on)
+        self.positions[position_id] = position
+        for address in position.depends_on:
+            self._index.setdefault(address, set()).add(position_id)
+        self._stale[position_id] = {None}
+        return position
+
+    def remove_position(self, position_id):
+        position = self.positions.pop(position_id)
+        for address in position.depends_on:
+            self._index[address].discard(position_id)
+        self._stale.pop(position_id, None)
+
+    def dependents(self, field: str, key=None) -> set:
+        """Ids of the positions depending on a market field."""
+        return set(self._index.get((field, key), ()))
+
+    def _on_change(self, change):
+        for position_id in self._index.get(change.address, ()):
+            # None marks a change that cannot be handled by a Taylor update
+            self._stale.setdefault(position_id, set()).add(change.field if change.field == SPOT else None)
+
+    def _spot(self, position: Position):
+        return self.market.get_spot_price(position.symbol)
+
+    def _full_valuation(self, position: Position) -> ValuationResult:
+        engine = position.engine_factory(self.market)
+        price = position.instrument.accept_pricer(engine)
+        greeks = {}
+        spot = getattr(engine, "S0", None)
+        if self.taylor_threshold > 0 and spot and not isinstance(position.instrument, FXBarrierOption):
+            h = spot * self.bump
+            up, down = copy.copy(engine), copy.copy(engine)
+            up.S0, down.S0 = spot + h, spot - h
+            price_up = position.instrument.accept_pricer(up)
+            price_down = position.instrument.accept_pricer(down)
+            greeks = {"delta": (price_up - price_down) / (2 * h),
+                      "gamma": (price_up - 2 * price + price_down) / h ** 2}
+        position.anchor_spot = spot
+        position.anchor_price = float(price)
+        self.stats["full"] += 1
+        return ValuationResult(price, greeks=greeks,
+                               additional_info={"method": "full", "market_version": self.market.version})
+
+    def _taylor_update(self, position: Position):
+        """Delta/gamma update from the last full valuation, or None if the move is too large."""
+        greeks = position.result.greeks
+        spot = self._spot(position)
+        if "delta" not in greeks or spot is None or position.anchor_spot is None:
+            return None
+        move = spot - position.anchor_spot
+        if abs(move) > self.taylor_threshold * position.anchor_spot:
+            return None
+        price = position.anchor_price + greeks["delta"] * move + 0.5 * greeks["gamma"] * move ** 2
+        self.stats["taylor"] += 1
+        return ValuationResult(price, greeks=greeks,
+                               additional_info={"method": "taylor", "market_version": self.market.version,
+                                                "spot_move": move})
+
+    def update(self) -> dict:
+        """Re-price the stale positions; returns {position_id: ValuationResult} of those re-priced."""
+        updated = {}
+        stale, self._stale = self._stale, {}
+        for position_id, fields in stale.items():
+            position = self.positions.get(position_id)
+            if position is None:
+                continue
+            result = None
+            if None not in fields and position.result is not None:
+                result = self._taylor_update(position)
+            if result is None:
+                result = self._full_valuation(position)
+            position.result = result
+            updated[position_id] = result
+        self.stats["skipped"] += len(self.positions) - len(updated)
+        return updated
+
+    def price_all(self) -> dict:
+        """Full valuation of every position; returns {position_id: ValuationResult}."""
+        self._stale = {position_id: {None} for position_id in self.positions}
+        self.update()
+        return self.results()
+
+    def results(self) -> dict:
+        return {position_id: position.result for position_id, position in self.positions.items()}
+
+    def book_value(self) -> float:
+        return sum(position.quantity * position.result.fair_value for position in self.positions.values()
+                   if position.result is not None)
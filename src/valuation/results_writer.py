@@ -0,0 +1,185 @@
+# src/valuation/results_writer.py
+"""
+Streaming writer for valuation results.
+
+Rows are buffered as columns and written out every ``chunk_size`` rows, so
+a multi-million-row run holds at most one chunk in memory:
+
+    with ResultsWriter("results.parquet", chunk_size=250_000) as writer:
+        for batch in iter_book("book.parquet"):
+            writer.write_columns(id=batch.ids, price=engine.price_option_book(batch))
+
+    with ResultsWriter("results.npz") as writer:
+        writer.write_results(valuation_results, ids=position_ids)
+
+Parquet output (via pyarrow, imported on first use) appends one row group
+per chunk. NPZ output appends one ``<column>.<chunk>`` array per chunk to
+the archive; ``read_results`` concatenates them back.
+"""
+import zipfile
+
+import numpy as np
+
+RESULT_FORMATS = ("npz", "parquet")
+
+
+class ResultsWriter:
+    def __init__(self, path: str, fmt: str = None, chunk_size: int = 100_000,
+                 greeks: tuple = ("delta", "gamma", "vega")):
+        """
+        :param fmt: "npz" or "parquet"; taken from the extension of ``path`` if None.
+        :param chunk_size: Rows buffered before they are written out.
+        :param greeks: Greek columns extracted by write_results (NaN where a result has none).
+        """
+        fmt = fmt or path.rsplit(".", 1)[-1].lower()
+        fmt = "parquet" if fmt == "pq" else fmt
+        if fmt not in RESULT_FORMATS:
+            raise ValueError(f"Unknown results format '{fmt}', expected one of {RESULT_FORMATS}")
+        self.path = path
+        self.fmt = fmt
+        self.chunk_size = chunk_size
+        self.greeks = tuple(greeks)
+        self.rows_written = 0
+        self._schema = None
+        # Pending (columns, n_rows) batches; the first ``_offset`` rows of the first one are already written
+        self._buffer = []
+        self._offset = 0
+        self._buffered = 0
+        self._n_chunks = 0
+        self._sink = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def write_columns(self, **columns):
+        """
+        Append rows given as equal-length column arrays (the same columns on
+        every call). The arrays may be reused by the caller once this returns.
+        """
+        columns = {name: np.asarray(values) for name, values in columns.items()}
+        lengths = {values.shape[0] for values in columns.values()}
+        if len(lengths) != 1:
+            raise ValueError("All columns must have the same length")
+        if self._schema is None:
+            self._schema = tuple(columns)
+        elif tuple(columns) != self._schema:
+            raise ValueError(f"Columns {tuple(columns)} do not match the first batch {self._schema}")
+
+        n_rows = lengths.pop()
+        self._buffer.append((columns, n_rows))
+        self._buffered += n_rows
+        while self._buffered >= self.chunk_size:
+            self._flush(self.chunk_size)
+        # Full chunks were written straight from the caller's arrays; the rows still buffered
+        # are copied, as the caller may reuse its arrays for the next batch
+        if self._buffer and self._buffer[-1][0] is columns:
+            offset = self._offset if len(self._buffer) == 1 else 0
+            self._buffer[-1] = ({name: values[offset:].copy() for name, values in columns.items()},
+                                n_rows - offset)
+            if len(self._buffer) == 1:
+                self._offset = 0
+
+    def write_results(self, results, ids=None):
+        """
+        Append ValuationResult objects as rows: price, the configured Greeks,
+        std_error and n_paths (adaptive Monte Carlo) and the valuation time
+        ("total" timing, service or Monte Carlo time, whichever is known).
+        """
+        n = len(results)
+        price = np.fromiter((float(result.fair_value) for result in results), dtype=float, count=n)
+        columns = {} if ids is None else {"id": np.asarray(ids)}
+        columns["price"] = price
+        for greek in self.greeks:
+            columns[greek] = np.fromiter((result.greeks.get(greek, np.nan) for result in results), dtype=float,
+                                         count=n)
+        columns["std_error"] = np.fromiter((result.additional_info.get("std_error", np.nan) for result in results),
+                                           dtype=float, count=n)
+        columns["n_paths"] = np.fromiter((result.additional_info.get("n_paths", -1) for result in results),
+                                         dtype=np.int64, count=n)
+        columns["time"] = np.fromiter((_valuation_time(result.additional_info) for result in results), dtype=float,
+                                      count=n)
+        self.write_columns(**columns)
+
+    def _flush(self, n_rows: int = None):
+        """
+        Write the first ``n_rows`` buffered rows (all of them if None) as one
+        chunk. Rows are sliced out of the pending batches as views; only a
+        chunk that spans several batches is concatenated.
+        """
+        if not self._buffered:
+            return
+        n_rows = self._buffered if n_rows is None else n_rows
+        pieces = []
+        needed = n_rows
+        while needed:
+            columns, length = self._buffer[0]
+            take = min(needed, length - self._offset)
+            pieces.append({name: values[self._offset:self._offset + take] for name, values in columns.items()})
+            needed -= take
+            self._offset += take
+            if self._offset == length:
+                self._buffer.pop(0)
+                self._offset = 0
+        if len(pieces) == 1:
+            chunk = pieces[0]
+        else:
+            chunk = {name: np.concatenate([piece[name] for piece in pieces]) for name in self._schema}
+        self._buffered -= n_rows
+
+        if self.fmt == "parquet":
+            self._write_parquet(chunk)
+        else:
+            self._write_npz(chunk)
+        self.rows_written += n_rows
+        self._n_chunks += 1
+
+    def _write_npz(self, chunk: dict):
+        if self._sink is None:
+            self._sink = zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_STORED, allowZip64=True)
+        for name, values in chunk.items():
+            with self._sink.open(f"{name}.{self._n_chunks:06d}.npy", "w", force_zip64=True) as member:
+                np.lib.format.write_array(member, np.ascontiguousarray(values), allow_pickle=False)
+
+    def _write_parquet(self, chunk: dict):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet output requires pyarrow (pip install pyarrow)") from None
+        table = pyarrow.table(chunk)
+        if self._sink is None:
+            self._sink = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+        self._sink.write_table(table)
+
+    def close(self):
+        self._flush()
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+
+
+def _valuation_time(info: dict) -> float:
+    timings = info.get("timings", {})
+    for value in (timings.get("total"), info.get("service_time"), info.get("mc_time")):
+        if value is not None:
+            return value
+    return np.nan
+
+
+def read_results(path: str) -> dict:
+    """Columns of a results file written by ResultsWriter, as {name: array}."""
+    if path.rsplit(".", 1)[-1].lower() in ("parquet", "pq"):
+        import pyarrow.parquet
+        table = pyarrow.parquet.read_table(path)
+        return {name: table.column(name).to_numpy() for name in table.column_names}
+
+    chunks = {}
+    with np.load(path, allow_pickle=False) as data:
+        for key in sorted(data.files):
+            name = key.rsplit(".", 1)[0]
+            chunks.setdefault(name, []).append(data[key])
+    return {name: np.concatenate(parts) for name, parts in chunks.items()}
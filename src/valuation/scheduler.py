@@ -0,0 +1,222 @@
+# src/valuation/scheduler.py
+"""
+Batch valuation of a whole book across worker processes or remote nodes.
+
+The book is split into shards of roughly equal estimated cost (Monte Carlo
+paths x steps, PDE nx x nt, closed forms as near-free), the shards are
+submitted to a ``concurrent.futures`` executor, failed shards are retried,
+and the prices are merged back in input order:
+
+    scheduler = BookScheduler(max_workers=8, seed=42)
+    prices = scheduler.run(instruments, engine)
+
+Any object with the Executor ``submit`` interface can run the shards, so a
+cluster client can be plugged in as ``executor``; LoopbackExecutor is a
+local stand-in that round-trips every shard through pickle like a remote
+executor would, and can inject failures for testing.
+
+With a ``seed``, every shard prices with copies of its engines whose own
+``seed`` (MonteCarloEngine) is derived from (seed, shard id, engine), so
+Monte Carlo results do not depend on which worker or thread ran a shard or
+on retries; fix ``n_shards`` as well to make them independent of the pool
+size. No global generator state is touched, so shards running concurrently
+on threads cannot interfere. Engines without a ``seed`` draw from the
+global NumPy generator and are not reproducible across runs.
+"""
+import copy
+import pickle
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from ..instruments.variance_swap_swaption import Variance_Swap_Swaption
+
+
+class ShardFailed(RuntimeError):
+    pass
+
+
+def estimate_cost(instrument, engine) -> float:
+    """
+    Relative cost of pricing ``instrument`` with ``engine``: Monte Carlo
+    paths x steps, PDE grid nodes x time steps, 1 for closed forms.
+    """
+    if hasattr(engine, "n_paths") and hasattr(engine, "n_steps"):
+        n_paths = engine.n_paths
+        if getattr(engine, "adaptive", False):
+            n_paths = max(n_paths, engine.batch_size)
+        cost = float(n_paths * engine.n_steps)
+        if isinstance(instrument, Variance_Swap_Swaption):
+            # One pass per integration node of the forward variance curve
+            cost *= 1000
+        return cost
+    if hasattr(engine, "nx") and hasattr(engine, "nt"):
+        cost = float(engine.nx * engine.nt)
+        barrier_type = getattr(instrument, "barrier_type", None)
+        if barrier_type is not None and barrier_type.is_in:
+            # Knock-ins are priced by in-out parity: two grids
+            cost *= 2
+        return cost
+    return 1.0
+
+
+def make_shards(costs, n_shards: int) -> list:
+    """
+    Partition item indices into at most ``n_shards`` shards of similar total
+    cost (longest-processing-time first). Deterministic for given costs;
+    indices within a shard are sorted.
+    """
+    order = sorted(range(len(costs)), key=lambda i: (-costs[i], i))
+    n_shards = max(1, min(n_shards, len(costs)))
+    loads = [0.0] * n_shards
+    shards = [[] for _ in range(n_shards)]
+    for i in order:
+        target = min(range(n_shards), key=lambda s: (loads[s], s))
+        shards[target].append(i)
+        loads[target] += costs[i]
+    return [sorted(shard) for shard in shards if shard]
+
+
+def price_shard(shard_id: int, items: list, seed: int = None) -> list:
+    """
+    Worker entry point: price (index, instrument, engine) items, calling
+    ``price_batch`` once per engine so that engines can share work within
+    the shard. Returns (index, price) pairs.
+    """
+    by_engine = {}
+    for index, instrument, engine in items:
+        by_engine.setdefault(id(engine), (engine, []))[1].append((index, instrument))
+
+    if seed is not None:
+        for k, (key, (engine, entries)) in enumerate(by_engine.items()):
+            if hasattr(engine, "seed"):
+                engine = copy.copy(engine)
+                engine.seed = int(np.random.SeedSequence([seed, shard_id, k]).generate_state(1)[0])
+                by_engine[key] = (engine, entries)
+
+    priced = []
+    for engine, entries in by_engine.values():
+        prices = engine.price_batch([instrument for _, instrument in entries])
+        priced.extend((index, price) for (index, _), price in zip(entries, prices))
+    return priced
+
+
+class LoopbackExecutor:
+    """
+    Local stand-in for a remote executor: calls are pickled and unpickled
+    (as they would be on the wire) and run on a thread pool. ``failure_rate``
+    makes that fraction of calls fail with ConnectionError, to exercise
+    retries.
+    """
+    def __init__(self, max_workers: int = 4, failure_rate: float = 0.0, seed: int = 0):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._max_workers = max_workers
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        payload = pickle.dumps((fn, args, kwargs))
+        fail = self._random.random() < self.failure_rate
+        return self._pool.submit(self._run, payload, fail)
+
+    @staticmethod
+    def _run(payload: bytes, fail: bool):
+        if fail:
+            raise ConnectionError("Simulated worker failure")
+        fn, args, kwargs = pickle.loads(payload)
+        return pickle.loads(pickle.dumps(fn(*args, **kwargs)))
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
+
+
+class BookScheduler:
+    def __init__(self,
+                 executor=None,
+                 max_workers: int = None,
+                 shards_per_worker: int = 4,
+                 max_retries: int = 2,
+                 seed: int = None,
+                 n_shards: int = None):
+        """
+        :param executor: Executor (process pool, cluster client, LoopbackExecutor, ...) running the
+                         shards. If None, a ProcessPoolExecutor with ``max_workers`` workers is created
+                         for each run and shut down afterwards.
+        :param shards_per_worker: Shards per worker, so that uneven cost estimates even out.
+        :param max_retries: Times a failed shard is resubmitted before the run fails with ShardFailed.
+        :param seed: Base seed of the per-shard engine seeds (see module docstring).
+        :param n_shards: Fixed number of shards, instead of workers x shards_per_worker.
+        """
+        self.executor = executor
+        self.max_workers = max_workers
+        self.shards_per_worker = shards_per_worker
+        self.max_retries = max_retries
+        self.seed = seed
+        self.n_shards = n_shards
+        self.stats = {}
+
+    def _workers(self, executor) -> int:
+        return self.max_workers or getattr(executor, "_max_workers", None) or 1
+
+    def run(self, instruments, engines) -> list:
+        """
+        Price ``instruments`` with ``engines`` (one engine for all, or one per
+        instrument) and return the prices in input order.
+        """
+        instruments = list(instruments)
+        if not isinstance(engines, (list, tuple)):
+            engines = [engines] * len(instruments)
+        if len(engines) != len(instruments):
+            raise ValueError("Expected one engine per instrument")
+        if not instruments:
+            return []
+
+        owns_executor = self.executor is None
+        executor = ProcessPoolExecutor(max_workers=self.max_workers) if owns_executor else self.executor
+        start = time.perf_counter()
+        costs = [estimate_cost(instrument, engine) for instrument, engine in zip(instruments, engines)]
+        shards = make_shards(costs, self.n_shards or self._workers(executor) * self.shards_per_worker)
+        payloads = [[(i, instruments[i], engines[i]) for i in shard] for shard in shards]
+
+        prices = [None] * len(instruments)
+        attempts = [0] * len(shards)
+        retries = 0
+        try:
+            pending = {executor.submit(price_shard, shard_id, payloads[shard_id], self.seed): shard_id
+                       for shard_id in range(len(shards))}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    shard_id = pending.pop(future, None)
+                    if shard_id is None:
+                        # Already resubmitted after its pool broke
+                        continue
+                    try:
+                        priced = future.result()
+                    except Exception as e:
+                        attempts[shard_id] += 1
+                        if attempts[shard_id] > self.max_retries:
+                            raise ShardFailed(f"Shard {shard_id} failed {attempts[shard_id]} times") from e
+                        if isinstance(e, BrokenProcessPool) and owns_executor:
+                            # A crashed worker breaks the whole pool: replace it and resubmit everything
+                            # still outstanding
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                            lost = list(pending.values())
+                            pending = {executor.submit(price_shard, lost_id, payloads[lost_id], self.seed): lost_id
+                                       for lost_id in lost}
+                        retries += 1
+                        pending[executor.submit(price_shard, shard_id, payloads[shard_id], self.seed)] = shard_id
+                        continue
+                    for index, price in priced:
+                        prices[index] = price
+        finally:
+            if owns_executor:
+                executor.shutdown()
+
+        self.stats = {"shards": len(shards), "retries": retries, "elapsed": time.perf_counter() - start,
+                      "shard_costs": [sum(costs[i] for i in shard) for shard in shards]}
+        return prices
@@ -1,18 +1,61 @@
 # src/valuation/valuation_request.py
+import time
+
 from ..models.pricing_engine_base import PricingEngine
 from ..instruments.instrument_base import Instrument
 from ..market_data.market import Market
+from ..utils import instrumentation
+from .valuation_result import ValuationResult
 
 class ValuationRequest:
     def __init__(self,
                  instrument: Instrument,
                  pricer: PricingEngine,
-                 market: Market):
+                 market: Market,
+                 instrument_pricing: bool = None,
+                 track_memory: bool = None,
+                 compute_greeks: bool = False):
+        """
+        :param instrument_pricing: record per-phase timings, counters and (optionally) memory
+                                   in ValuationResult.additional_info and send them to the
+                                   export hooks. None follows instrumentation.configure().
+        :param track_memory: record tracemalloc high-water marks per phase (slower).
+        :param compute_greeks: fill ValuationResult.greeks from the pricer's price_with_greeks
+                               (adjoint sensitivities where the engine has them).
+        """
         self.instrument = instrument
         self.pricer = pricer
         self.market = market
+        self.instrument_pricing = instrument_pricing
+        self.track_memory = track_memory
+        self.compute_greeks = compute_greeks
 
     def run_valuation(self):
+        return self.run_valuation_result().fair_value
+
+    def _price(self):
+        """(fair value, greeks); the Greeks are empty unless requested."""
+        if self.compute_greeks:
+            return self.pricer.price_with_greeks(self.instrument)
         # Leverage the instrument's accept_pricer() method
         # or pass relevant market data to the pricer.
-        return self.instrument.accept_pricer(self.pricer)
+        return self.instrument.accept_pricer(self.pricer), {}
+
+    def run_valuation_result(self) -> ValuationResult:
+        settings = instrumentation.settings()
+        enabled = settings["enabled"] if self.instrument_pricing is None else self.instrument_pricing
+        if not enabled:
+            fair_value, greeks = self._price()
+            return ValuationResult(fair_value, greeks=greeks)
+
+        track_memory = settings["track_memory"] if self.track_memory is None else self.track_memory
+        with instrumentation.instrumented(track_memory) as recorder:
+            start = time.perf_counter()
+            fair_value, greeks = self._price()
+            recorder.add_time("total", time.perf_counter() - start)
+
+        info = recorder.to_dict()
+        info["engine"] = type(self.pricer).__name__
+        info["instrument"] = type(self.instrument).__name__
+        instrumentation.export(info)
+        return ValuationResult(fair_value, greeks=greeks, additional_info=info)
@@ -2,8 +2,14 @@
 class ValuationResult:
     """
     Could store the computed fair value, greeks, scenario breakdown, etc.
+
+    Estimates that describe themselves (e.g. adaptive Monte Carlo prices,
+    which report their standard error and path count) have their
+    ``estimate_info()`` merged into additional_info.
     """
     def __init__(self, fair_value, greeks=None, additional_info=None):
         self.fair_value = fair_value
         self.greeks = greeks or {}
-        self.additional_info = additional_info or {}
+        self.additional_info = dict(additional_info or {})
+        if hasattr(fair_value, "estimate_info"):
+            self.additional_info.update(fair_value.estimate_info())
@@ -0,0 +1,222 @@
+# src/valuation/valuation_service.py
+"""
+Asyncio front-end for pricing many concurrent requests.
+
+Requests are queued and coalesced over a short time window into batches
+grouped by (engine, instrument kind, maturity). Each batch is one
+``engine.price_batch`` call offloaded to an executor (a process pool by
+default), so the event loop only does queueing. The queue is bounded, and
+the number of batches in flight is capped, so a slow pool pushes back on
+callers instead of letting the queue grow without limit:
+
+    async with ValuationService(batch_window=0.002) as service:
+        result = await service.submit(ValuationRequest(option, engine, market))
+        result.fair_value
+"""
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .valuation_request import ValuationRequest
+from .valuation_result import ValuationResult
+
+
+class ServiceOverloaded(RuntimeError):
+    pass
+
+
+def _seed_worker():
+    # Forked workers inherit the parent's NumPy random state; give each its own stream
+    import numpy as np
+    np.random.seed()
+
+
+def price_batch(engine, instruments, compute_greeks: bool = False) -> list:
+    """
+    Executor entry point: price a batch, returning (ok, value_or_exception)
+    per instrument. If the batched call fails, the instruments are repriced
+    one by one so that a bad instrument only fails its own request. With
+    ``compute_greeks`` every instrument goes through the engine's
+    price_with_greeks and the values are (price, greeks) pairs.
+    """
+    if compute_greeks:
+        results = []
+        for instrument in instruments:
+            try:
+                results.append((True, engine.price_with_greeks(instrument)))
+            except Exception as e:
+                results.append((False, e))
+        return results
+    try:
+        return [(True, value) for value in engine.price_batch(instruments)]
+    except Exception:
+        results = []
+        for instrument in instruments:
+            try:
+                results.append((True, instrument.accept_pricer(engine)))
+            except Exception as e:
+                results.append((False, e))
+        return results
+
+
+class _Pending:
+    __slots__ = ("engine", "instrument", "future", "compute_greeks", "enqueued")
+
+    def __init__(self, engine, instrument, future, compute_greeks: bool = False):
+        self.engine = engine
+        self.instrument = instrument
+        self.future = future
+        self.compute_greeks = compute_greeks
+        self.enqueued = time.perf_counter()
+
+
+class ValuationService:
+    def __init__(self,
+                 batch_window: float = 0.002,
+                 max_batch_size: int = 512,
+                 max_pending: int = 10000,
+                 max_inflight_batches: int = None,
+                 executor=None,
+                 max_workers: int = None,
+                 overflow: str = "wait"):
+        """
+        :param batch_window: Seconds to keep collecting requests after the first one of a batch arrives.
+        :param max_batch_size: Maximum number of requests coalesced in one window.
+        :param max_pending: Capacity of the request queue.
+        :param max_inflight_batches: Batches running on the executor at once (default 2 x workers).
+        :param executor: concurrent.futures executor for the pricing work; a ProcessPoolExecutor
+                         with ``max_workers`` workers is created (and shut down) by the service if None.
+        :param overflow: "wait" to block submitters while the queue is full, "reject" to raise
+                         ServiceOverloaded instead.
+        """
+        if overflow not in ("wait", "reject"):
+            raise ValueError("overflow must be either 'wait' or 'reject'")
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.max_pending = max_pending
+        self.max_workers = max_workers
+        self.max_inflight_batches = max_inflight_batches
+        self.overflow = overflow
+        self.executor = executor
+        self._owns_executor = executor is None
+        self._queue = None
+        self._dispatcher = None
+        self._inflight = None
+        self._tasks = set()
+        self.stats = {"requests": 0, "batches": 0, "engine_calls": 0}
+
+    async def start(self):
+        if self._dispatcher is not None:
+            return
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_seed_worker)
+        inflight = self.max_inflight_batches or 2 * (getattr(self.executor, "_max_workers", None) or 1)
+        self._inflight = asyncio.Semaphore(inflight)
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._dispatcher = asyncio.create_task(self._dispatch_loop())
+
+    async def stop(self):
+        """Finish the queued and running requests, then release the executor."""
+        if self._dispatcher is None:
+            return
+        await self._queue.join()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._dispatcher.cancel()
+        try:
+            await self._dispatcher
+        except asyncio.CancelledError:
+            pass
+        self._dispatcher = None
+        if self._owns_executor:
+            self.executor.shutdown()
+            self.executor = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+        return False
+
+    async def price(self, instrument, engine, compute_greeks: bool = False) -> ValuationResult:
+        """
+        Price one instrument with ``engine``; resolves when its batch is done.
+        With ``compute_greeks`` the result's Greeks come from the engine's
+        price_with_greeks.
+        """
+        if self._dispatcher is None:
+            raise RuntimeError("ValuationService is not running; use 'async with' or await start().")
+        pending = _Pending(engine, instrument, asyncio.get_running_loop().create_future(), compute_greeks)
+        if self.overflow == "reject":
+            try:
+                self._queue.put_nowait(pending)
+            except asyncio.QueueFull:
+                raise ServiceOverloaded(f"{self.max_pending} valuation requests already pending") from None
+        else:
+            await self._queue.put(pending)
+        self.stats["requests"] += 1
+        return await pending.future
+
+    async def submit(self, request: ValuationRequest) -> ValuationResult:
+        return await self.price(request.instrument, request.pricer, request.compute_greeks)
+
+    async def _collect(self) -> list:
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.batch_window
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _dispatch_loop(self):
+        while True:
+            batch = await self._collect()
+            self.stats["batches"] += 1
+
+            groups = {}
+            for pending in batch:
+                maturity = getattr(pending.instrument, "maturity", None)
+                key = (id(pending.engine), type(pending.instrument), maturity, pending.compute_greeks)
+                groups.setdefault(key, []).append(pending)
+
+            for group in groups.values():
+                # Backpressure: wait for a free slot before taking more work
+                await self._inflight.acquire()
+                task = asyncio.create_task(self._run_group(group))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _run_group(self, group: list):
+        loop = asyncio.get_running_loop()
+        try:
+            started = time.perf_counter()
+            compute_greeks = group[0].compute_greeks
+            results = await loop.run_in_executor(self.executor, price_batch, group[0].engine,
+                                                 [pending.instrument for pending in group], compute_greeks)
+            service_time = time.perf_counter() - started
+            self.stats["engine_calls"] += 1
+            for pending, (ok, value) in zip(group, results):
+                if pending.future.done():
+                    continue
+                if ok:
+                    info = {"batch_size": len(group), "service_time": service_time,
+                            "queue_time": started - pending.enqueued}
+                    fair_value, greeks = value if compute_greeks else (value, None)
+                    pending.future.set_result(ValuationResult(fair_value, greeks=greeks, additional_info=info))
+                else:
+                    pending.future.set_exception(value)
+        except Exception as e:
+            for pending in group:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+        finally:
+            self._inflight.release()
+            for _ in group:
+                self._queue.task_done()
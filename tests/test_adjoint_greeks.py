@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.vanilla_option import VanillaOption
+from src.market_data.market import Market
+from src.models.black_scholes.black_scholes_functions import vanilla_option_price_bs, barrier_option_price_bs
+from src.models.monte_carlo.adjoint import option_greeks_mc_adjoint
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+from src.models.pde.pde_adjoint import option_greeks_pde_adjoint, barrier_option_greeks_pde
+from src.models.pde.pde_functions import barrier_option_price_pde
+from src.models.pde.pde_pricing import PDEPricingEngine
+from src.valuation.valuation_request import ValuationRequest
+
+
+def _central(f, x, h):
+    return (f(x + h) - f(x - h)) / (2 * h)
+
+
+@pytest.mark.parametrize("option_type, x_min, x_max, barrier", [
+    ("call", 0.0, 300.0, None), ("put", 0.0, 125.0, None), ("call", 85.0, 300.0, None), ("call", 0.0, 300.0, 130.0)])
+def test_pde_adjoint_matches_finite_differences_of_the_scheme(option_type, x_min, x_max, barrier):
+    S0, K, T, r, sigma, q, nx, nt = 100.0, 101.0, 1.0, 0.03, 0.25, 0.01, 120, 60
+
+    def price(**bumped):
+        inputs = dict(r=r, sigma=sigma, q=q, x_min=x_min, x_max=x_max) | bumped
+        return option_greeks_pde_adjoint(S0, K, T, inputs["r"], inputs["sigma"], option_type, nx, nt,
+                                         inputs["x_min"], inputs["x_max"], barrier, inputs["q"])["price"]
+
+    greeks = option_greeks_pde_adjoint(S0, K, T, r, sigma, option_type, nx, nt, x_min, x_max, barrier, q)
+    # Moving a bound moves the node read off as the price; the sensitivities keep the spot fixed
+    idx = np.argmin(np.abs(np.linspace(x_min, x_max, nx + 1) - S0))
+    readout_shift = greeks["delta"] * np.array([1 - idx / nx, idx / nx])
+    h = 1e-5
+    assert greeks["vega"] == pytest.approx(_central(lambda v: price(sigma=v), sigma, h), rel=1e-6)
+    assert greeks["rho"] == pytest.approx(_central(lambda v: price(r=v), r, h), rel=1e-6)
+    assert greeks["dividend_rho"] == pytest.approx(_central(lambda v: price(q=v), q, h), rel=1e-6)
+    assert greeks["x_min"] == pytest.approx(_central(lambda v: price(x_min=v), x_min, 1e-4) - readout_shift[0],
+                                            abs=1e-6)
+    assert greeks["x_max"] == pytest.approx(_central(lambda v: price(x_max=v), x_max, 1e-4) - readout_shift[1],
+                                            abs=1e-6)
+
+
+def test_pde_barrier_greeks_against_black_scholes():
+    S0, K, T, r, sigma, q = 100.0, 100.0, 1.0, 0.03, 0.25, 0.01
+    for option_type, B, barrier_type in [("call", 85.0, "down-and-out"), ("call", 85.0, "down-and-in"),
+                                         ("put", 125.0, "up-and-out")]:
+        greeks = barrier_option_greeks_pde(S0, K, T, r, sigma, B, option_type, barrier_type, nx=400, nt=200, q=q)
+
+        def pde(**bumped):
+            inputs = dict(r=r, q=q) | bumped
+            return barrier_option_price_pde(S0, K, T, inputs["r"], sigma, B, option_type, barrier_type, 400, 200,
+                                            q=inputs["q"])
+
+        assert greeks["price"] == pytest.approx(pde(), abs=1e-10)
+        # Knock-in rates sensitivities are small differences of the grids', so compare with the scheme's own
+        assert greeks["rho"] == pytest.approx(_central(lambda v: pde(r=v), r, 1e-5), rel=1e-5)
+        assert greeks["dividend_rho"] == pytest.approx(_central(lambda v: pde(q=v), q, 1e-5), rel=1e-5)
+
+        def bs(**bumped):
+            inputs = dict(S=S0, sigma=sigma, B=B) | bumped
+            return barrier_option_price_bs(inputs["S"], K, T, r, q, inputs["sigma"], inputs["B"], option_type,
+                                           barrier_type)
+
+        assert greeks["delta"] == pytest.approx(_central(lambda v: bs(S=v), S0, 1e-3), abs=5e-3)
+        assert greeks["vega"] == pytest.approx(_central(lambda v: bs(sigma=v), sigma, 1e-4), rel=0.02)
+        assert greeks["barrier_sensitivity"] == pytest.approx(_central(lambda v: bs(B=v), B, 1e-3), abs=5e-3)
+        assert greeks["vanna"] == pytest.approx(
+            _central(lambda v: _central(lambda s: bs(S=s, sigma=v), S0, 1e-2), sigma, 1e-3), abs=0.05)
+        assert greeks["volga"] == pytest.approx(
+            _central(lambda v: _central(lambda s: bs(sigma=s), v, 1e-4), sigma, 1e-3), rel=0.02)
+
+
+def test_mc_adjoint_vanilla_greeks_against_black_scholes():
+    S0, K, T, r, sigma, q = 100.0, 110.0, 1.0, 0.03, 0.25, 0.01
+    z = np.random.default_rng(11).standard_normal((200_000, 4))
+    price, greeks = option_greeks_mc_adjoint(z, S0, K, T, r, q, sigma, "call")
+
+    def bs(**bumped):
+        inputs = dict(S=S0, sigma=sigma, r=r, q=q) | bumped
+        return vanilla_option_price_bs(inputs["S"], K, T, inputs["r"], inputs["q"], inputs["sigma"], "call")
+
+    assert price == pytest.approx(bs(), rel=0.02)
+    assert greeks["delta"] == pytest.approx(_central(lambda v: bs(S=v), S0, 1e-3), rel=0.02)
+    assert greeks["vega"] == pytest.approx(_central(lambda v: bs(sigma=v), sigma, 1e-4), rel=0.03)
+    assert greeks["rho"] == pytest.approx(_central(lambda v: bs(r=v), r, 1e-4), rel=0.03)
+    assert greeks["dividend_rho"] == pytest.approx(_central(lambda v: bs(q=v), q, 1e-4), rel=0.03)
+    assert greeks["gamma"] == pytest.approx(_central(lambda v: _central(lambda s: bs(S=s), v, 1e-2), S0, 1e-2),
+                                            rel=0.05)
+    assert "barrier_sensitivity" not in greeks
+
+
+def test_mc_adjoint_barrier_greeks_match_bump_and_reprice():
+    S0, K, T, r, sigma, q, B = 100.0, 100.0, 1.0, 0.03, 0.25, 0.01, 85.0
+    z = np.random.default_rng(5).standard_normal((20_000, 50))
+    price, greeks = option_greeks_mc_adjoint(z, S0, K, T, r, q, sigma, "call", B, "down-and-out", smoothing=0.003,
+                                             second_order=False)
+
+    def mc(**bumped):
+        inputs = dict(S0=S0, sigma=sigma, barrier_level=B) | bumped
+        return option_greeks_mc_adjoint(z, inputs["S0"], K, T, r, q, inputs["sigma"], "call", inputs["barrier_level"],
+                                        "down-and-out", smoothing=1e-6, second_order=False)[0]
+
+    # Same normals: the bumped prices only differ by the paths that cross the barrier
+    assert greeks["delta"] == pytest.approx(_central(lambda v: mc(S0=v), S0, 0.5), rel=0.05)
+    assert greeks["vega"] == pytest.approx(_central(lambda v: mc(sigma=v), sigma, 0.005), rel=0.05)
+    assert greeks["barrier_sensitivity"] == pytest.approx(_central(lambda v: mc(barrier_level=v), B, 0.5), abs=0.03)
+    assert set(greeks) == {"delta", "vega", "rho", "dividend_rho", "barrier_sensitivity"}
+
+
+def test_valuation_request_fills_greeks():
+    option = BarrierOption(100.0, 1.0, "call", 85.0, "down-and-out", 0.0)
+    pde = PDEPricingEngine(0.03, 0.25, 100.0, dividend_yield=0.01, nx=200, nt=100)
+    request = ValuationRequest(option, pde, Market(), instrument_pricing=False, compute_greeks=True)
+    result = request.run_valuation_result()
+    assert result.fair_value == pytest.approx(option.accept_pricer(pde), abs=1e-10)
+    assert {"delta", "gamma", "vega", "rho", "dividend_rho", "barrier_sensitivity", "vanna", "volga"} <= set(
+        result.greeks)
+
+    mc = MonteCarloEngine(0.03, 0.25, 100.0, dividend_yield=0.01, n_paths=2000, n_steps=20, seed=1)
+    vanilla = VanillaOption(100.0, 1.0, "put")
+    request = ValuationRequest(vanilla, mc, Market(), instrument_pricing=True, compute_greeks=True)
+    result = request.run_valuation_result()
+    assert result.fair_value == pytest.approx(vanilla.accept_pricer(mc), rel=1e-10)
+    assert result.greeks["delta"] < 0 and result.greeks["vega"] > 0
+    assert "total" in result.additional_info["timings"]
+
+    assert ValuationRequest(vanilla, mc, Market()).run_valuation_result().greeks == {}
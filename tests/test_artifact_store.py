@@ -0,0 +1,80 @@
+import os
+
+import numpy as np
+import pytest
+
+from src.instruments.vanilla_option import VanillaOption
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+from src.models.pde.pde_functions import barrier_option_price_pde
+from src.utils.artifact_store import ArtifactStore
+
+
+def test_roundtrip_integrity_and_eviction(tmp_path):
+    store = ArtifactStore(str(tmp_path), max_bytes=3 * 8 * 1000 + 1000)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return np.arange(1000, dtype=float)
+
+    first = store.get_or_create("a", {"n": 1000, "x": 0.1}, build)
+    again = store.get_or_create("a", {"n": 1000, "x": 0.1}, build)
+    assert isinstance(again, np.memmap) and not again.flags.writeable
+    np.testing.assert_array_equal(first, again)
+    assert len(calls) == 1
+
+    # A truncated file is dropped and rebuilt
+    key = store.key("a", {"n": 1000, "x": 0.1})
+    data_path = os.path.join(str(tmp_path), key + ".npy")
+    del first, again
+    with open(data_path, "r+b") as f:
+        f.truncate(os.path.getsize(data_path) - 8)
+    assert store.get(key) is None
+    store.get_or_create("a", {"n": 1000, "x": 0.1}, build)
+    assert len(calls) == 2
+
+    # Corrupted contents are caught when checksums are verified
+    with open(data_path, "r+b") as f:
+        f.seek(-8, os.SEEK_END)
+        f.write(b"\xff" * 8)
+    assert ArtifactStore(str(tmp_path), verify_checksums=True).get(key) is None
+
+    # Least recently used artifacts are evicted beyond max_bytes
+    for i in range(5):
+        store.get_or_create("b", {"i": i}, build)
+    assert store.size() <= store.max_bytes
+    assert store.get(store.key("b", {"i": 4})) is not None
+    assert store.get(store.key("b", {"i": 0})) is None
+
+
+def test_engines_reuse_stored_artifacts(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    option = VanillaOption(strike=100.0, maturity=1.0, option_type="call", exercise_style="european")
+    plain = MonteCarloEngine(0.03, 0.2, 100.0, n_paths=2000, n_steps=20, seed=11)
+    stored = MonteCarloEngine(0.03, 0.2, 100.0, n_paths=2000, n_steps=20, seed=11, artifact_store=store)
+    expected = option.accept_pricer(plain)
+    assert option.accept_pricer(stored) == pytest.approx(expected, rel=1e-12)
+    assert option.accept_pricer(stored) == pytest.approx(expected, rel=1e-12)
+    assert [key.split("-")[0] for key, _, _ in store.entries()] == ["gbm_normals"]
+
+    args = (100.0, 100.0, 1.0, 0.02, 0.2, 130.0, "call", "up-and-out", 120, 60)
+    expected = barrier_option_price_pde(*args)
+    assert barrier_option_price_pde(*args, artifact_store=store) == pytest.approx(expected, abs=1e-12)
+    assert barrier_option_price_pde(*args, artifact_store=store) == pytest.approx(expected, abs=1e-12)
+    assert any(key.startswith("pde_banded") for key, _, _ in store.entries())
+
+
+def test_artifact_evicted_while_being_read(tmp_path, monkeypatch):
+    store = ArtifactStore(str(tmp_path))
+    expected = store.get_or_create("a", {"n": 10}, lambda: np.arange(10, dtype=float))
+    utime = os.utime
+
+    def evict_then_touch(path, *args, **kwargs):
+        # Another process evicts everything between the load and the access-time update
+        for name in os.listdir(tmp_path):
+            os.remove(os.path.join(tmp_path, name))
+        return utime(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "utime", evict_then_touch)
+    array = store.get_or_create("a", {"n": 10}, lambda: np.zeros(10))
+    np.testing.assert_array_equal(array, expected)
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from src.instruments.option_book import OptionBook, NO_BARRIER
+from src.models.black_scholes.black_scholes_pricing import BlackScholesEngine
+from src.utils.book_io import load_book, save_book, iter_book
+from src.valuation.results_writer import ResultsWriter, read_results
+from src.valuation.valuation_result import ValuationResult
+
+CSV = """id,strike,maturity,option_type,barrier_level,barrier_type,rebate
+1,100,1.0,call,,,
+2,95,0.5,Put,120,up-and-out,0
+3,105,1.0,CALL,80,down_and_in,0.5
+"""
+
+
+def test_books_load_into_columns_and_price_like_instruments(tmp_path):
+    csv_path = tmp_path / "book.csv"
+    csv_path.write_text(CSV)
+    book = load_book(str(csv_path))
+    assert list(book.barrier_type) == [NO_BARRIER, 0, 3]
+    assert list(book.ids) == [1, 2, 3] and list(book.rebate) == [0.0, 0.0, 0.5]
+
+    engine = BlackScholesEngine(0.02, 0.2, 100.0)
+    prices = engine.price_option_book(book)
+    assert prices == pytest.approx(engine.price_batch(book.to_instruments()), rel=1e-12)
+
+    npz_path = str(tmp_path / "book.npz")
+    save_book(book, npz_path)
+    batches = list(iter_book(npz_path, batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert np.concatenate([engine.price_option_book(batch) for batch in batches]) == pytest.approx(prices)
+
+    with pytest.raises(ValueError):
+        OptionBook([100.0], [1.0], ["call"], barrier_type=["up-and-in"])
+
+
+def test_results_writer_streams_chunks(tmp_path):
+    path = str(tmp_path / "results.npz")
+    with ResultsWriter(path, chunk_size=4) as writer:
+        writer.write_columns(id=np.arange(3), price=np.arange(3) * 1.5)
+        writer.write_columns(id=np.arange(3, 10), price=np.arange(3, 10) * 1.5)
+        assert writer.rows_written == 8
+        with pytest.raises(ValueError):
+            writer.write_columns(price=np.ones(2))
+    columns = read_results(path)
+    assert list(columns["id"]) == list(range(10))
+    assert columns["price"] == pytest.approx(np.arange(10) * 1.5)
+
+    # A large batch is written out as views of the caller's arrays, chunk by chunk
+    prices = np.arange(1003) * 0.5
+    path = str(tmp_path / "large.npz")
+    with ResultsWriter(path, chunk_size=100) as writer:
+        writer.write_columns(price=prices[:3])
+        written = []
+        write_npz = writer._write_npz
+        writer._write_npz = lambda chunk: (written.append(chunk["price"]), write_npz(chunk))
+        writer.write_columns(price=prices[3:])
+    assert [chunk.shape[0] for chunk in written] == [100] * 10 + [3]
+    # The leftover tail is copied when write_columns returns
+    assert all(np.shares_memory(chunk, prices) for chunk in written[1:-1])
+    assert not np.shares_memory(written[-1], prices)
+    assert read_results(path)["price"] == pytest.approx(prices)
+
+    # Rows left in the buffer are copied, so the caller can reuse its arrays
+    path = str(tmp_path / "reused.npz")
+    buffer = np.empty(3)
+    with ResultsWriter(path, chunk_size=4) as writer:
+        for value in range(3):
+            buffer[:] = value
+            writer.write_columns(price=buffer)
+    assert list(read_results(path)["price"]) == [0, 0, 0, 1, 1, 1, 2, 2, 2]
+
+    results = [ValuationResult(1.0, greeks={"delta": 0.5}, additional_info={"timings": {"total": 0.1}}),
+               ValuationResult(2.0, additional_info={"std_error": 0.01, "n_paths": 5000})]
+    path = str(tmp_path / "valuations.npz")
+    with ResultsWriter(path) as writer:
+        writer.write_results(results, ids=["a", "b"])
+    columns = read_results(path)
+    assert list(columns["id"]) == ["a", "b"]
+    assert columns["delta"][0] == 0.5 and np.isnan(columns["delta"][1])
+    assert columns["std_error"][1] == 0.01 and list(columns["n_paths"]) == [-1, 5000]
+    assert columns["time"][0] == 0.1
+
+
+def test_parquet_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+    book = OptionBook([100.0, 90.0], 1.0, ["call", "put"], [np.nan, 80.0], ["", "down-and-out"])
+    path = str(tmp_path / "book.parquet")
+    save_book(book, path)
+    assert list(load_book(path).barrier_type) == list(book.barrier_type)
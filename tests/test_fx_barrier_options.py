@@ -0,0 +1,61 @@
+import numpy as np
+
+from src.instruments.fx_option import FXBarrierOption
+from src.market_data.market import Market
+from src.market_data.yield_curve import YieldCurve
+from src.models.black_scholes.black_scholes_pricing import BlackScholesEngine
+from src.models.black_scholes.black_scholes_functions import barrier_option_price_bs
+from src.models.pde.pde_pricing import PDEPricingEngine
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+
+market = Market(
+    fx_rates={"EURUSD": 1.10, "USDJPY": 150.0},
+    discount_curves={"USD": YieldCurve([0.5, 1.0, 2.0], [0.045, 0.043, 0.040]), "EUR": 0.03, "JPY": 0.001},
+)
+
+
+def _book():
+    book = []
+    for K, B, option_type, barrier_type in [(1.15, 1.00, "call", "down-and-out"), (1.05, 1.25, "call", "up-and-in"),
+                                            (1.20, 1.00, "put", "down-and-in"), (1.00, 1.20, "put", "up-and-out")]:
+        book.append(FXBarrierOption(K, 1.0, option_type, B, barrier_type, "USD", "EUR", notional=1e6))
+    book.append(FXBarrierOption(1.15, 0.5, "call", 1.00, "down-and-out", "USD", "EUR", notional=2e6,
+                                premium_ccy="EUR"))
+    book.append(FXBarrierOption(0.0070, 1.0, "put", 0.0060, "down-and-out", "USD", "JPY", notional=5e5))
+    return book
+
+
+def test_garman_kohlhagen_uses_domestic_and_foreign_rates():
+    engine = BlackScholesEngine(interest_rate=0.0, volatility=0.1, spot_price=0.0, market=market)
+    option = _book()[0]
+
+    expected = barrier_option_price_bs(1.10, 1.15, 1.0, 0.043, 0.03, 0.1, 1.00, "call", "down-and-out") * 1e6
+    assert np.isclose(option.accept_pricer(engine), expected)
+
+
+def test_batch_matches_single_option_pricing_across_pairs():
+    engine = BlackScholesEngine(interest_rate=0.0, volatility=0.1, spot_price=0.0, market=market)
+    book = _book()
+
+    batch = engine.price_fx_barrier_options(book)
+    single = [option.accept_pricer(engine) for option in book]
+
+    assert np.allclose(batch, single)
+    # The JPY option prices off the inverted USDJPY quote and the JPY curve
+    assert batch[5] > 0
+    # Foreign-currency premium is the domestic premium converted at spot
+    eur_premium = book[4].accept_pricer(engine)
+    book[4].premium_ccy = "USD"
+    assert np.isclose(eur_premium * 1.10, book[4].accept_pricer(engine))
+
+
+def test_pde_and_mc_agree_with_closed_form():
+    option = FXBarrierOption(1.15, 1.0, "call", 1.00, "down-and-out", "USD", "EUR", notional=1.0)
+    bs = option.accept_pricer(BlackScholesEngine(0.0, 0.1, 0.0, market=market))
+    pde = option.accept_pricer(PDEPricingEngine(0.0, 0.1, 0.0, nx=400, nt=200, market=market))
+    np.random.seed(0)
+    mc = option.accept_pricer(MonteCarloEngine(0.0, 0.1, 0.0, n_paths=50000, n_steps=100, market=market))
+
+    # The PDE reads the grid node nearest to spot, hence the looser tolerance
+    assert abs(pde - bs) < 0.05 * bs
+    assert abs(mc - bs) < 1e-3
@@ -0,0 +1,60 @@
+import numpy as np
+
+from src.instruments.vanilla_option import VanillaOption
+from src.instruments.barrier_option import BarrierOption
+from src.market_data.yield_curve import YieldCurve
+from src.models.heston.heston_pricing import HestonEngine
+from src.models.black_scholes.black_scholes_functions import vanilla_option_price_bs, barrier_option_price_bs
+
+
+def test_cos_price_matches_reference_value():
+    # Fang & Oosterlee (2008), Heston test case: reference call price 5.785155450
+    engine = HestonEngine(interest_rate=0.0, spot_price=100.0, v0=0.0175, kappa=1.5768, theta=0.0398,
+                          vol_of_vol=0.5751, rho=-0.5711)
+    price = VanillaOption(strike=100, maturity=1.0, option_type="call").accept_pricer(engine)
+
+    assert abs(price - 5.785155450) < 1e-6
+
+
+def test_strike_strip_reuses_cached_transform_and_respects_parity():
+    engine = HestonEngine(interest_rate=0.02, spot_price=100.0, v0=0.04, kappa=2.0, theta=0.05,
+                          vol_of_vol=0.4, rho=-0.6, dividend_yield=0.01)
+    strikes = np.linspace(60.0, 150.0, 500)
+
+    calls = engine.price_vanilla_strip(strikes, 1.0, "call")
+    puts = engine.price_vanilla_strip(strikes, 1.0, "put")
+
+    assert len(engine._cos_cache) == 1
+    assert np.allclose(calls - puts, 100.0 * np.exp(-0.01) - strikes * np.exp(-0.02))
+    assert np.all(np.diff(calls) < 0)
+
+
+def test_cached_transform_follows_curve_and_parameter_changes():
+    params = dict(spot_price=100.0, v0=0.04, kappa=2.0, theta=0.05, vol_of_vol=0.4, rho=-0.6)
+    option = VanillaOption(strike=100, maturity=1.0, option_type="call")
+    curve = YieldCurve.flat(0.01)
+    engine = HestonEngine(interest_rate=curve, **params)
+    option.accept_pricer(engine)
+
+    curve.update_node(0, 0.05)
+    fresh = HestonEngine(interest_rate=YieldCurve.flat(0.05), **params)
+    assert abs(option.accept_pricer(engine) - option.accept_pricer(fresh)) < 1e-12
+
+    engine.v0 = 0.09
+    fresh = HestonEngine(interest_rate=YieldCurve.flat(0.05), **params | {"v0": 0.09})
+    assert abs(option.accept_pricer(engine) - option.accept_pricer(fresh)) < 1e-12
+
+
+def test_vanishing_vol_of_vol_recovers_black_scholes():
+    engine = HestonEngine(interest_rate=0.02, spot_price=100.0, v0=0.04, kappa=1.0, theta=0.04,
+                          vol_of_vol=1e-4, rho=0.0, n_paths=40000, n_steps=100)
+    strikes = np.array([80.0, 100.0, 120.0])
+    expected = [vanilla_option_price_bs(100.0, K, 1.0, 0.02, 0.0, 0.2, "call") for K in strikes]
+
+    assert np.allclose(engine.price_vanilla_strip(strikes, 1.0, "call"), expected, atol=1e-6)
+
+    np.random.seed(0)
+    barrier = BarrierOption(strike=110, maturity=1.0, option_type="call", barrier_level=80,
+                            barrier_type="down-and-out")
+    reference = barrier_option_price_bs(100.0, 110.0, 1.0, 0.02, 0.0, 0.2, 80.0, "call", "down-and-out")
+    assert abs(barrier.accept_pricer(engine) - reference) < 0.15
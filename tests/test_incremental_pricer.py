@@ -0,0 +1,58 @@
+import pytest
+
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.vanilla_option import VanillaOption
+from src.market_data.market import Market, SPOT, VOL_SURFACE
+from src.market_data.vol_surface import VolSurface
+from src.models.black_scholes.black_scholes_pricing import BlackScholesEngine
+from src.valuation.incremental_pricer import IncrementalPricer
+
+
+def engine_for(symbol):
+    def factory(market):
+        return BlackScholesEngine(0.02, market.get_vol_surface(symbol), market.get_spot_price(symbol))
+    return factory
+
+
+def build_book(taylor_threshold):
+    market = Market(vol_surface_dict={"AAA": VolSurface.flat(0.2), "BBB": VolSurface.flat(0.3)},
+                    spot_prices={"AAA": 100.0, "BBB": 50.0})
+    pricer = IncrementalPricer(market, taylor_threshold=taylor_threshold)
+    pricer.add_position("aaa-call", VanillaOption(100.0, 1.0, "call"), "AAA", engine_for("AAA"))
+    pricer.add_position("aaa-barrier", BarrierOption(100.0, 1.0, "call", 80.0, "down-and-out"), "AAA",
+                        engine_for("AAA"), quantity=2.0)
+    pricer.add_position("bbb-put", VanillaOption(50.0, 0.5, "put"), "BBB", engine_for("BBB"))
+    pricer.price_all()
+    return market, pricer
+
+
+def test_tick_reprices_only_dependent_positions():
+    market, pricer = build_book(taylor_threshold=0.0)
+    assert pricer.dependents(SPOT, "BBB") == {"bbb-put"}
+    before = pricer.results()
+
+    market.set_spot_price("BBB", 51.0)
+    updated = pricer.update()
+    assert set(updated) == {"bbb-put"}
+    assert pricer.results()["aaa-call"] is before["aaa-call"]
+    assert updated["bbb-put"].fair_value == pytest.approx(
+        VanillaOption(50.0, 0.5, "put").accept_pricer(BlackScholesEngine(0.02, 0.3, 51.0)))
+
+    market.set_vol_surface("AAA", VolSurface.flat(0.25))
+    assert set(pricer.update()) == {"aaa-call", "aaa-barrier"}
+    assert pricer.update() == {}
+
+
+def test_small_spot_moves_use_taylor_updates():
+    market, pricer = build_book(taylor_threshold=0.01)
+    market.set_spot_price("AAA", 100.5)
+    updated = pricer.update()
+    assert {result.additional_info["method"] for result in updated.values()} == {"taylor"}
+    exact = VanillaOption(100.0, 1.0, "call").accept_pricer(BlackScholesEngine(0.02, 0.2, 100.5))
+    assert updated["aaa-call"].fair_value == pytest.approx(exact, abs=1e-4)
+
+    # Moves are measured from the last full valuation, so drift eventually forces one
+    market.set_spot_price("AAA", 101.5)
+    assert pricer.update()["aaa-call"].additional_info["method"] == "full"
+    market.notify(VOL_SURFACE, "BBB")
+    assert pricer.update()["bbb-put"].additional_info["method"] == "full"
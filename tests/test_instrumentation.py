@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from src.instruments.vanilla_option import VanillaOption
+from src.market_data.local_vol import LocalVolSurface
+from src.market_data.market import Market
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+from src.models.pde.pde_pricing import PDEPricingEngine
+from src.utils import instrumentation
+from src.valuation.valuation_request import ValuationRequest
+
+market = Market(spot_prices={"STOCK_XYZ": 100.0})
+option = VanillaOption(strike=100, maturity=1.0, option_type="call", exercise_style="european")
+
+
+def test_disabled_by_default_and_same_price():
+    engine = PDEPricingEngine(interest_rate=0.02, volatility=0.2, spot_price=100.0, nx=100, nt=50)
+    plain = ValuationRequest(option, engine, market).run_valuation_result()
+    traced = ValuationRequest(option, engine, market, instrument_pricing=True).run_valuation_result()
+
+    assert plain.additional_info == {}
+    assert traced.fair_value == plain.fair_value
+    assert set(traced.additional_info["timings"]) == {"matrix_build", "time_stepping", "total"}
+    assert traced.additional_info["counters"] == {"nx": 100, "nt": 50}
+    assert "peak_memory" not in traced.additional_info
+
+
+def test_monte_carlo_phases_memory_and_export_hook():
+    exported = []
+    instrumentation.add_export_hook(exported.append)
+    try:
+        engine = MonteCarloEngine(interest_rate=0.02, volatility=0.2, spot_price=100.0, n_paths=2000, n_steps=20)
+        result = ValuationRequest(option, engine, market, instrument_pricing=True,
+                                  track_memory=True).run_valuation_result()
+    finally:
+        instrumentation.remove_export_hook(exported.append)
+
+    info = result.additional_info
+    assert exported == [info]
+    assert info["engine"] == "MonteCarloEngine"
+    assert info["counters"] == {"n_paths": 2000, "n_steps": 20}
+    assert info["calls"]["path_generation"] == 1
+    # The paths array alone is n_paths * (n_steps + 1) doubles
+    assert info["peak_memory"]["path_generation"] >= 2000 * 21 * 8
+    assert info["timings"]["total"] >= info["timings"]["path_generation"] + info["timings"]["payoff_reduction"]
+
+
+def test_phases_accumulate_and_recorders_nest_independently():
+    with instrumentation.instrumented() as outer:
+        with instrumentation.phase("a"):
+            pass
+        with instrumentation.instrumented() as inner:
+            with instrumentation.phase("a"):
+                pass
+        with instrumentation.phase("a"):
+            instrumentation.record(n=np.int64(3))
+
+    assert outer.calls == {"a": 2}
+    assert inner.calls == {"a": 1}
+    assert outer.counters == {"n": 3}
+    assert not instrumentation.is_active()
+
+
+def test_nested_phase_time_is_not_counted_twice(monkeypatch):
+    # A fake clock, advanced by hand, so the timings do not depend on real sleeps
+    clock = [0.0]
+    monkeypatch.setattr(instrumentation.time, "perf_counter", lambda: clock[0])
+    with instrumentation.instrumented() as recorder:
+        with instrumentation.phase("outer"):
+            clock[0] += 0.02
+            with instrumentation.phase("inner"):
+                clock[0] += 0.05
+            clock[0] += 0.01
+    assert recorder.timings == pytest.approx({"outer": 0.03, "inner": 0.05})
+    monkeypatch.undo()
+
+    # Local-vol PDE runs rebuild the matrix inside time stepping
+    surface = LocalVolSurface([0.5, 1.0], [50.0, 100.0, 200.0], np.full((2, 3), 0.2))
+    request = ValuationRequest(VanillaOption(100.0, 1.0, "call"), PDEPricingEngine(0.02, surface, 100.0, nx=80, nt=40),
+                               Market(), instrument_pricing=True)
+    timings = request.run_valuation_result().additional_info["timings"]
+    assert timings["matrix_build"] + timings["time_stepping"] <= timings["total"]
@@ -0,0 +1,50 @@
+import itertools
+import warnings
+
+import numpy as np
+import pytest
+
+from src.instruments.barrier_option import BarrierOption
+from src.models.black_scholes import black_scholes_kernels
+from src.models.black_scholes.black_scholes_functions import barrier_option_price_bs
+from src.models.black_scholes.black_scholes_pricing import BlackScholesEngine
+from src.models.pde.pde_functions import barrier_option_price_pde
+from src.utils.jit import get_kernels, validate_backend
+
+
+def test_scalar_kernels_match_reference_formulas():
+    _, barrier = get_kernels(black_scholes_kernels.build, "python")
+    for K, B, is_call, is_down, is_in in itertools.product([90.0, 105.0], [80.0, 95.0, 120.0],
+                                                           [True, False], [True, False], [True, False]):
+        option_type = "call" if is_call else "put"
+        barrier_type = ("down" if is_down else "up") + ("-and-in" if is_in else "-and-out")
+        try:
+            expected = barrier_option_price_bs(100.0, K, 1.0, 0.03, 0.01, 0.25, B, option_type, barrier_type)
+        except ValueError:
+            with pytest.raises(ValueError):
+                barrier(100.0, K, 1.0, 0.03, 0.01, 0.25, B, is_call, is_down, is_in)
+            continue
+        assert barrier(100.0, K, 1.0, 0.03, 0.01, 0.25, B, is_call, is_down, is_in) == pytest.approx(expected, abs=1e-12)
+
+
+def test_engine_backends_agree():
+    option = BarrierOption(strike=100.0, maturity=1.0, option_type="put", barrier_level=120.0,
+                           barrier_type="up-and-in", rebate=0.0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        compiled = BlackScholesEngine(0.02, 0.2, 100.0, 0.01, backend="numba")
+    reference = BlackScholesEngine(0.02, 0.2, 100.0, 0.01)
+    assert compiled.price_barrier_option(option) == pytest.approx(reference.price_barrier_option(option), abs=1e-12)
+
+    with pytest.raises(ValueError):
+        validate_backend("cuda")
+
+
+def test_pde_time_stepping_kernel_matches_banded_solver():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for option_type, B, barrier_type in [("call", 130.0, "up-and-out"), ("put", 80.0, "down-and-in")]:
+            args = (100.0, 100.0, 1.0, 0.02, 0.2, B, option_type, barrier_type, 120, 60)
+            expected = barrier_option_price_pde(*args, q=0.01)
+            assert barrier_option_price_pde(*args, q=0.01, backend="numba") == pytest.approx(expected, abs=1e-10)
+            assert np.isfinite(expected)
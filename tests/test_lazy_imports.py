@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+from scipy.stats import norm as scipy_norm
+
+from src.utils.stats import norm, norm_cdf
+
+
+def test_norm_cdf_matches_scipy_for_scalars_and_arrays():
+    x = np.linspace(-8.0, 8.0, 161)
+    assert np.allclose(norm.cdf(x), scipy_norm.cdf(x), rtol=1e-14, atol=1e-16)
+    for value in [-8.0, -1.3, 0.0, 0.7, 6.0, np.float64(1.1), 2]:
+        assert abs(norm_cdf(value) - scipy_norm.cdf(value)) < 1e-15
+        assert isinstance(norm_cdf(value), float)
+
+
+def test_engine_imports_do_not_load_heavy_dependencies():
+    code = ("import sys\n"
+            "import src.models.black_scholes.black_scholes_pricing, src.models.monte_carlo.monte_carlo_pricing\n"
+            "import src.models.pde.pde_pricing, src.valuation.valuation_request\n"
+            "print([m for m in ('scipy.stats', 'scipy.integrate', 'scipy.linalg', 'tqdm') if m in sys.modules])")
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", code], cwd=repo_root, check=True,
+                         capture_output=True, text=True).stdout
+    assert out.strip() == "[]"
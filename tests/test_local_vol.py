@@ -0,0 +1,63 @@
+import numpy as np
+
+from src.instruments.barrier_option import BarrierOption
+from src.market_data.market import Market
+from src.market_data.vol_surface import VolSurface
+from src.models.black_scholes.black_scholes_pricing import BlackScholesEngine
+from src.models.pde.pde_pricing import PDEPricingEngine
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+
+
+def _skewed_market():
+    strikes = np.linspace(60.0, 160.0, 11)
+    expiries = np.array([0.25, 0.5, 1.0, 2.0])
+    vols = 0.2 - 0.1 * np.log(strikes / 100.0)[None, :] + 0.0 * expiries[:, None]
+    return Market(vol_surface_dict={"STOCK_XYZ": VolSurface(strikes, expiries, vols)},
+                  spot_prices={"STOCK_XYZ": 100.0})
+
+
+def test_flat_implied_surface_gives_flat_local_vol():
+    market = Market(vol_surface_dict={"STOCK_XYZ": VolSurface.flat(0.2)}, spot_prices={"STOCK_XYZ": 100.0})
+    local_vol = market.get_local_vol_surface("STOCK_XYZ", interest_rate=0.02)
+
+    assert np.allclose(local_vol.local_vols, 0.2, atol=1e-6)
+
+
+def test_local_vol_surface_is_cached_until_the_implied_surface_changes():
+    market = _skewed_market()
+    first = market.get_local_vol_surface("STOCK_XYZ", interest_rate=0.02)
+    assert market.get_local_vol_surface("STOCK_XYZ", interest_rate=0.02) is first
+
+    market.get_vol_surface("STOCK_XYZ").update_vol(0, 0, 0.5)
+    assert market.get_local_vol_surface("STOCK_XYZ", interest_rate=0.02) is not first
+
+
+def test_pde_on_flat_local_vol_matches_constant_vol():
+    market = Market(vol_surface_dict={"STOCK_XYZ": VolSurface.flat(0.2)}, spot_prices={"STOCK_XYZ": 100.0})
+    local_vol = market.get_local_vol_surface("STOCK_XYZ", interest_rate=0.02)
+    option = BarrierOption(strike=110, maturity=1.0, option_type="call", barrier_level=80,
+                           barrier_type="down-and-out")
+
+    flat_price = option.accept_pricer(PDEPricingEngine(0.02, 0.2, 100.0, nx=200, nt=100))
+    local_price = option.accept_pricer(PDEPricingEngine(0.02, local_vol, 100.0, nx=200, nt=100))
+
+    assert np.isclose(flat_price, local_price, atol=1e-4)
+
+
+def test_local_vol_pde_and_mc_agree_with_implied_vanilla_price():
+    market = _skewed_market()
+    local_vol = market.get_local_vol_surface("STOCK_XYZ", interest_rate=0.02)
+    option = BarrierOption(strike=90, maturity=1.0, option_type="call", barrier_level=200,
+                           barrier_type="up-and-out")
+
+    # A far barrier leaves (almost) a vanilla, which the implied surface prices exactly
+    implied = BlackScholesEngine(0.02, market.get_vol_surface("STOCK_XYZ"), 100.0)
+    from src.instruments.vanilla_option import VanillaOption
+    reference = VanillaOption(strike=90, maturity=1.0, option_type="call").accept_pricer(implied)
+
+    pde_price = option.accept_pricer(PDEPricingEngine(0.02, local_vol, 100.0, nx=600, nt=200))
+    np.random.seed(0)
+    mc_price = option.accept_pricer(MonteCarloEngine(0.02, local_vol, 100.0, n_paths=40000, n_steps=100))
+
+    assert abs(pde_price - reference) < 0.15
+    assert abs(mc_price - reference) < 0.25
@@ -0,0 +1,114 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.vanilla_option import VanillaOption
+from src.models.black_scholes.black_scholes_functions import vanilla_option_price_bs
+from src.models.monte_carlo.monte_carlo_functions import (simulate_paths_gbm, simulate_paths_gbm_multi_asset, RunningStats,
+                                                          barrier_option_payoffs_mc,
+                                                          barrier_option_payoffs_mc_streaming)
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+from src.valuation.valuation_request import ValuationRequest
+from src.valuation.valuation_result import ValuationResult
+
+
+def test_float32_paths_match_float64_on_the_same_normals():
+    z = np.random.default_rng(5).standard_normal((2000, 50))
+    paths64 = simulate_paths_gbm(2000, 50, 1.0, 0.02, 0.01, 0.25, 100.0, z=z)
+    paths32 = simulate_paths_gbm(2000, 50, 1.0, 0.02, 0.01, 0.25, 100.0, z=z, dtype=np.float32)
+    assert paths32.dtype == np.float32 and paths64.dtype == np.float64
+    assert np.all(paths64[:, 0] == 100.0)
+    np.testing.assert_allclose(paths32, paths64, rtol=1e-5)
+
+    option = BarrierOption(strike=100.0, maturity=1.0, option_type="call", barrier_level=80.0,
+                           barrier_type="down-and-out")
+    price32 = option.accept_pricer(MonteCarloEngine(0.02, 0.25, 100.0, n_paths=20000, n_steps=50, seed=3,
+                                                    dtype="float32"))
+    price64 = option.accept_pricer(MonteCarloEngine(0.02, 0.25, 100.0, n_paths=20000, n_steps=50, seed=3))
+    assert isinstance(price32, float)
+    assert price32 == pytest.approx(price64, abs=0.3)
+
+    with pytest.raises(ValueError):
+        MonteCarloEngine(0.02, 0.25, 100.0, dtype="float16")
+
+
+def test_adaptive_mode_stops_at_the_target_and_reports_it():
+    samples = np.random.default_rng(1).exponential(size=10001)
+    stats = RunningStats()
+    for chunk in np.array_split(samples, 7):
+        stats.update(chunk)
+    assert stats.mean == pytest.approx(samples.mean(), rel=1e-12)
+    assert stats.variance == pytest.approx(samples.var(ddof=1), rel=1e-12)
+
+    option = VanillaOption(strike=105.0, maturity=1.0, option_type="call", exercise_style="european")
+    engine = MonteCarloEngine(0.02, 0.2, 100.0, n_steps=10, seed=4, target_abs_error=0.03, batch_size=5000)
+    result = ValuationRequest(option, engine, None).run_valuation_result()
+    info = result.additional_info
+    assert info["stop_reason"] == "abs_error" and info["std_error"] <= 0.03
+    assert info["n_paths"] % 5000 == 0 and info["n_paths"] > 5000
+    assert result.fair_value == pytest.approx(vanilla_option_price_bs(100.0, 105.0, 1.0, 0.02, 0.0, 0.2, "call"),
+                                              abs=4 * info["std_error"])
+
+    capped = MonteCarloEngine(0.02, 0.2, 100.0, n_steps=10, target_rel_error=1e-6, batch_size=3000, max_paths=7000)
+    estimate = option.accept_pricer(capped)
+    assert (estimate.stop_reason, estimate.n_paths) == ("max_paths", 7000)
+
+    # The estimate's info goes into a copy of the caller's dict
+    shared = {"engine": "MonteCarloEngine"}
+    assert ValuationResult(estimate, additional_info=shared).additional_info["n_paths"] == 7000
+    assert shared == {"engine": "MonteCarloEngine"}
+
+
+def test_multi_asset_paths_are_correlated_and_stream_extrema():
+    correlation = np.array([[1.0, 0.6, 0.1], [0.6, 1.0, -0.4], [0.1, -0.4, 1.0]])
+    S0, sigma, q = np.array([100.0, 50.0, 10.0]), np.array([0.2, 0.3, 0.4]), np.array([0.0, 0.01, 0.02])
+    full = simulate_paths_gbm_multi_asset(20000, 30, 1.0, 0.03, S0, sigma, q, correlation, chunk_steps=7,
+                                          keep_paths=True, seed=8)
+    streamed = simulate_paths_gbm_multi_asset(20000, 30, 1.0, 0.03, S0, sigma, q, correlation, chunk_steps=7,
+                                              seed=8)
+    assert streamed.paths is None
+    np.testing.assert_array_equal(streamed.running_max, full.paths.max(axis=1))
+    np.testing.assert_array_equal(streamed.running_min, full.paths.min(axis=1))
+    np.testing.assert_array_equal(streamed.terminal, full.paths[:, -1])
+
+    log_returns = np.diff(np.log(full.paths), axis=1).reshape(-1, 3)
+    np.testing.assert_allclose(np.corrcoef(log_returns.T), correlation, atol=0.02)
+    np.testing.assert_allclose(full.terminal.mean(axis=0), S0 * np.exp(0.03 - q), rtol=0.02)
+
+    with pytest.raises(ValueError):
+        simulate_paths_gbm_multi_asset(10, 5, 1.0, 0.03, S0, sigma, q, -correlation)
+
+
+@pytest.mark.parametrize("option_type, barrier_level, barrier_type", [
+    ("call", 85.0, "down-and-out"), ("put", 85.0, "down-and-in"), ("put", 120.0, "up-and-out"),
+    ("call", 120.0, "up-and-in"), ("call", 100.0, "up-and-in")])
+def test_streaming_barrier_payoffs_match_stored_paths(option_type, barrier_level, barrier_type):
+    n_paths, n_steps = 5000, 40
+    # The streaming kernel draws one step of n_paths normals at a time
+    z = np.random.default_rng(4).standard_normal((n_steps, n_paths)).T
+    paths = simulate_paths_gbm(n_paths, n_steps, 1.0, 0.02, 0.01, 0.25, 100.0, z=z)
+    expected = barrier_option_payoffs_mc(paths, 100.0, 1.0, 0.02, barrier_level, 1.5, option_type, barrier_type)
+    payoffs = barrier_option_payoffs_mc_streaming(n_paths, n_steps, 1.0, 0.02, 0.01, 0.25, 100.0, 100.0,
+                                                  barrier_level, 1.5, option_type, barrier_type, seed=4)
+    np.testing.assert_allclose(payoffs, expected, rtol=1e-10, atol=1e-10)
+
+
+def test_streaming_barrier_engine_uses_memory_per_path_only():
+    option = BarrierOption(strike=100.0, maturity=1.0, option_type="call", barrier_level=85.0,
+                           barrier_type="down-and-out")
+    n_paths, n_steps = 20000, 250
+    stored = MonteCarloEngine(0.02, 0.25, 100.0, n_paths=n_paths, n_steps=n_steps, seed=3)
+    streaming = MonteCarloEngine(0.02, 0.25, 100.0, n_paths=n_paths, n_steps=n_steps, seed=3, stream_barriers=True)
+
+    tracemalloc.start()
+    try:
+        price = option.accept_pricer(streaming)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # A handful of n_paths vectors, far below the 40 MB path matrix
+    assert peak < 20 * n_paths * 8
+    assert price == pytest.approx(option.accept_pricer(stored), abs=0.3)
+    assert streaming.price_batch([option, VanillaOption(100.0, 1.0, "call")])[0] == price
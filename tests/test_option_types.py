@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.option_types import OptionType, BarrierType, option_type_codes, barrier_type_codes
+from src.models.black_scholes.black_scholes_functions import barrier_option_price_bs, barrier_option_price_bs_codes
+
+
+def test_parse_accepts_all_spellings_once_at_construction():
+    for spelling in ["down-and-out", "down_and_out", "Down and Out", "DOWN-AND-OUT", BarrierType.DOWN_AND_OUT, 2]:
+        assert BarrierType.parse(spelling) is BarrierType.DOWN_AND_OUT
+
+    option = BarrierOption(strike=100.0, maturity=1.0, option_type="Put", barrier_level=120.0,
+                           barrier_type="up_and_in")
+    assert option.option_type is OptionType.PUT
+    assert option.barrier_type is BarrierType.UP_AND_IN
+    assert (option.barrier_type.is_up, option.barrier_type.is_in) == (True, True)
+    assert f"{option.barrier_type}" == "up-and-in"
+
+    with pytest.raises(ValueError):
+        BarrierOption(100.0, 1.0, "call", 120.0, "sideways-and-out")
+    with pytest.raises(ValueError):
+        OptionType.parse("straddle")
+
+
+def test_code_arrays_drive_vectorized_pricing():
+    book = [BarrierOption(K, 1.0, option_type, B, barrier_type)
+            for K, B, option_type, barrier_type in [(100.0, 80.0, "call", "down-and-in"),
+                                                    (100.0, 120.0, "call", "up_and_out"),
+                                                    (105.0, 90.0, "put", "down-and-out"),
+                                                    (95.0, 110.0, "put", "up_and_in")]]
+    option_codes, barrier_codes = option_type_codes(book), barrier_type_codes(book)
+    assert option_codes.tolist() == [0, 0, 1, 1]
+    assert barrier_codes.tolist() == [3, 0, 2, 1]
+
+    K = np.array([o.strike for o in book])
+    B = np.array([o.barrier_level for o in book])
+    prices = barrier_option_price_bs_codes(100.0, K, 1.0, 0.02, 0.01, 0.2, B, option_codes, barrier_codes)
+    expected = [barrier_option_price_bs(100.0, o.strike, 1.0, 0.02, 0.01, 0.2, o.barrier_level,
+                                        o.option_type, o.barrier_type) for o in book]
+    assert np.allclose(prices, expected, rtol=1e-12, atol=1e-12)
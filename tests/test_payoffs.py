@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from src.instruments.asian_option import AsianOption
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.digital_option import DigitalOption
+from src.instruments.lookback_option import LookbackOption
+from src.instruments.vanilla_option import VanillaOption
+from src.models.black_scholes.black_scholes_functions import geometric_asian_option_price_bs
+from src.models.black_scholes.black_scholes_pricing import BlackScholesEngine
+from src.models.monte_carlo.monte_carlo_functions import simulate_paths_gbm, barrier_option_price_mc
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+from src.models.monte_carlo.payoffs import AsianPayoff, BarrierPayoff, price_payoffs
+
+S0, R, Q, SIGMA, T = 100.0, 0.03, 0.01, 0.25, 1.0
+
+
+def test_geometric_asian_closed_form_and_control_variate():
+    np.random.seed(0)
+    paths = simulate_paths_gbm(200000, 20, T, R, Q, SIGMA, S0)
+    geometric, arithmetic, barrier = price_payoffs(
+        paths, [AsianPayoff(100.0, "put", "geometric"), AsianPayoff(100.0, "call"),
+                BarrierPayoff(100.0, "call", 85.0, "down-and-out", rebate=1.0)], T, R, gbm=(S0, Q, SIGMA))
+    assert geometric == pytest.approx(geometric_asian_option_price_bs(S0, 100.0, T, R, Q, SIGMA, 20, "put"), abs=0.03)
+    assert barrier == pytest.approx(barrier_option_price_mc(paths, 100.0, T, R, 85.0, 1.0, "call", "down-and-out"),
+                                    abs=1e-12)
+
+    # The control variate removes most of the seed-to-seed noise of the arithmetic Asian
+    with_cv, without_cv = [], []
+    for seed in range(10):
+        np.random.seed(seed)
+        paths = simulate_paths_gbm(5000, 20, T, R, Q, SIGMA, S0)
+        with_cv.append(price_payoffs(paths, [AsianPayoff(100.0, "call")], T, R, gbm=(S0, Q, SIGMA))[0])
+        without_cv.append(price_payoffs(paths, [AsianPayoff(100.0, "call")], T, R)[0])
+    assert np.std(with_cv) < 0.1 * np.std(without_cv)
+    assert np.mean(with_cv) == pytest.approx(arithmetic, abs=0.02)
+
+
+def test_batch_prices_path_dependent_options_off_one_path_set():
+    options = [AsianOption(100.0, T, "call"), AsianOption(95.0, T, "put", "geometric", n_fixings=4),
+               LookbackOption(T, "call"), LookbackOption(T, "put", strike=100.0), DigitalOption(105.0, T, "call"),
+               BarrierOption(100.0, T, "call", 80.0, "down-and-out"), VanillaOption(100.0, T, "put")]
+    engine = MonteCarloEngine(R, SIGMA, S0, Q, n_paths=20000, n_steps=20, seed=5)
+    batch = engine.price_batch(options)
+    assert batch == pytest.approx([option.accept_pricer(engine) for option in options], rel=1e-12)
+    assert batch[2] > 0.0 and 0.0 < batch[4] < np.exp(-R * T)
+
+    with pytest.raises(ValueError):
+        AsianOption(100.0, T, "call", n_fixings=3).accept_pricer(engine)
+    with pytest.raises(NotImplementedError):
+        AsianOption(100.0, T, "call").accept_pricer(BlackScholesEngine(R, SIGMA, S0))
@@ -0,0 +1,59 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.vanilla_option import VanillaOption
+from src.market_data.yield_curve import YieldCurve
+from src.models.pde.pde_functions import (barrier_option_price_pde, vanilla_option_price_pde,
+                                          barrier_option_price_pde_batch, option_price_pde_batch)
+from src.models.pde.pde_pricing import PDEPricingEngine
+
+
+def test_batch_matches_one_grid_per_option():
+    rows = []
+    for (option_type, is_call), (barrier_type, is_down, is_in), B in itertools.product(
+            [("call", True), ("put", False)],
+            [("down-and-out", True, False), ("down-and-in", True, True),
+             ("up-and-out", False, False), ("up-and-in", False, True)],
+            [None, 85.0, 120.0]):
+        if B is not None and (B < 100.0) != is_down:
+            continue
+        rows.append((option_type, is_call, barrier_type, is_down, is_in, B))
+
+    rng = np.random.default_rng(7)
+    n = len(rows)
+    K, T = rng.uniform(90.0, 110.0, n), rng.uniform(0.25, 2.0, n)
+    r, sigma, q = rng.uniform(0.0, 0.05, n), rng.uniform(0.1, 0.4, n), rng.uniform(0.0, 0.03, n)
+
+    expected = []
+    for i, (option_type, _, barrier_type, _, _, B) in enumerate(rows):
+        if B is None:
+            expected.append(vanilla_option_price_pde(100.0, K[i], T[i], r[i], sigma[i], option_type, 300.0, 120, 60,
+                                                     q=q[i]))
+        else:
+            expected.append(barrier_option_price_pde(100.0, K[i], T[i], r[i], sigma[i], B, option_type,
+                                                     barrier_type, 120, 60, q=q[i]))
+
+    B = np.array([np.nan if row[5] is None else row[5] for row in rows])
+    is_call, is_down, is_in = (np.array([row[j] for row in rows]) for j in (1, 3, 4))
+    prices = barrier_option_price_pde_batch(100.0, K, T, r, sigma, B, is_call, is_down, is_in, 120, 60, q)
+    assert np.allclose(prices, expected, rtol=0, atol=1e-10)
+
+    # Scalar inputs broadcast to a batch of one
+    single = option_price_pde_batch(100.0, 100.0, 1.0, 0.02, 0.2, True, 120, 60, 0.0, 300.0)
+    assert single.shape == (1,)
+    assert single[0] == pytest.approx(vanilla_option_price_pde(100.0, 100.0, 1.0, 0.02, 0.2, "call", 300.0, 120, 60),
+                                      abs=1e-10)
+
+
+def test_engine_price_batch_matches_single_pricing():
+    curve = YieldCurve([0.5, 1.0, 2.0], [0.01, 0.02, 0.025])
+    engine = PDEPricingEngine(curve, 0.25, 100.0, dividend_yield=0.01, nx=100, nt=50)
+    instruments = [VanillaOption(95.0, 0.5, "call"), VanillaOption(105.0, 2.0, "put"),
+                   BarrierOption(100.0, 1.0, "call", 80.0, "down-and-in", 0.0),
+                   BarrierOption(100.0, 1.5, "put", 125.0, "up-and-out", 0.0),
+                   BarrierOption(90.0, 1.0, "call", 130.0, "up-and-out", 0.0)]
+    expected = [instrument.accept_pricer(engine) for instrument in instruments]
+    assert engine.price_batch(instruments) == pytest.approx(expected, abs=1e-10)
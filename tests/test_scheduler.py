@@ -0,0 +1,62 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.vanilla_option import VanillaOption
+from src.models.black_scholes.black_scholes_pricing import BlackScholesEngine
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+from src.models.pde.pde_pricing import PDEPricingEngine
+from src.valuation.scheduler import BookScheduler, LoopbackExecutor, ShardFailed, estimate_cost, make_shards
+
+
+def build_book():
+    engines = [BlackScholesEngine(0.02, 0.2, 100.0),
+               MonteCarloEngine(0.02, 0.2, 100.0, n_paths=2000, n_steps=20),
+               PDEPricingEngine(0.02, 0.2, 100.0, nx=100, nt=50)]
+    instruments, book_engines = [], []
+    for i, K in enumerate(range(80, 121, 5)):
+        instruments += [VanillaOption(float(K), 1.0, "call"),
+                        BarrierOption(float(K), 0.5, "put", 130.0, "up-and-out")]
+        book_engines += [engines[i % 3], engines[(i + 1) % 3]]
+    return instruments, book_engines
+
+
+def test_shards_balance_estimated_costs():
+    instruments, engines = build_book()
+    costs = [estimate_cost(instrument, engine) for instrument, engine in zip(instruments, engines)]
+    assert min(costs) == 1.0 and max(costs) == 2000 * 20
+    shards = make_shards(costs, 4)
+    assert sorted(i for shard in shards for i in shard) == list(range(len(instruments)))
+    loads = [sum(costs[i] for i in shard) for shard in shards]
+    assert max(loads) <= 2 * min(loads)
+    assert make_shards(costs, 4) == shards
+
+
+def test_results_are_deterministic_across_executors_and_retries():
+    instruments, engines = build_book()
+    serial = BookScheduler(executor=LoopbackExecutor(max_workers=1), seed=7, n_shards=6)
+    expected = serial.run(instruments, engines)
+    assert expected[0] == pytest.approx(instruments[0].accept_pricer(engines[0]))
+
+    flaky = BookScheduler(executor=LoopbackExecutor(max_workers=3, failure_rate=0.3, seed=1), seed=7, n_shards=6,
+                          max_retries=10)
+    assert flaky.run(instruments, engines) == expected
+    assert flaky.stats["retries"] > 0
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        assert BookScheduler(executor=pool, seed=7, n_shards=6).run(instruments, engines) == expected
+
+    with pytest.raises(ShardFailed):
+        BookScheduler(executor=LoopbackExecutor(failure_rate=1.0), max_retries=1).run(instruments, engines)
+
+
+def test_concurrent_thread_shards_match_serial_run():
+    # Distinct maturities, so that every option simulates its own paths
+    engine = MonteCarloEngine(0.02, 0.2, 100.0, n_paths=4000, n_steps=50)
+    instruments = [VanillaOption(100.0, 0.25 + 0.05 * i, "call") for i in range(40)]
+    expected = BookScheduler(executor=LoopbackExecutor(max_workers=1), seed=3, n_shards=8).run(instruments, engine)
+    for _ in range(3):
+        threaded = BookScheduler(executor=LoopbackExecutor(max_workers=8), seed=3, n_shards=8)
+        assert threaded.run(instruments, engine) == expected
+    assert engine.seed is None
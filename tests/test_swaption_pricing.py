@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from src.instruments.variance_swap_swaption import Variance_Swap_Swaption
+from src.market_data.yield_curve import YieldCurve
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+from src.models.variance_swaption.variance_swaption_functions import (variance_swap_swaption_price_quad,
+                                                                     variance_swap_swaption_price_mm)
+from src.models.variance_swaption.variance_swaption_pricing import VarianceSwaptionEngine
+
+PARAMS = {'nu': 0.8, 'theta': 0.3, 'k1': 3.0, 'k2': 0.3, 'rho': 0.2}
+XI0, R = 0.2, 0.01
+
+
+def test_quadrature_limits_and_convergence():
+    # A zero strike is the discounted forward variance swap; far out-of-the-money is worthless
+    prices = variance_swap_swaption_price_quad(XI0, [0.0, 5.0], R, 0.5, 1.0, PARAMS)
+    assert prices[0] == pytest.approx(XI0 * np.exp(-R * 0.5), rel=1e-12)
+    assert prices[1] == pytest.approx(0.0, abs=1e-9)
+
+    strikes = np.linspace(0.1, 0.4, 7)
+    reference = variance_swap_swaption_price_quad(XI0, strikes, R, 0.5, [1.0, 3.0], PARAMS, n_nodes=64, n_u=128,
+                                                  newton_iterations=20)
+    assert np.allclose(variance_swap_swaption_price_quad(XI0, strikes, R, 0.5, [1.0, 3.0], PARAMS), reference,
+                       rtol=1e-6, atol=1e-10)
+
+    # Moment matching is an approximation of the same distribution
+    assert np.allclose(variance_swap_swaption_price_mm(XI0, strikes, R, 0.5, [1.0, 3.0], PARAMS), reference,
+                       rtol=0.05, atol=5e-4)
+
+    # Degenerate one-factor model (theta = 0)
+    one_factor = variance_swap_swaption_price_quad(XI0, strikes, R, 0.5, 1.0, dict(PARAMS, theta=0.0))
+    assert np.all(np.diff(one_factor) < 0)
+
+
+def test_engine_grid_and_batch():
+    curve = YieldCurve([0.5, 1.0, 2.0], [0.01, 0.015, 0.02])
+    engine = VarianceSwaptionEngine(curve, XI0, PARAMS)
+    strikes, expiries, tenors = np.linspace(0.1, 0.3, 5), np.array([0.5, 1.0]), np.array([1.0, 2.0])
+    grid = engine.price_grid(strikes, expiries, tenors)
+
+    assert grid.shape == (5, 2, 2)
+    assert np.all(np.isnan(grid[:, 1, 0]))
+    swaptions = [Variance_Swap_Swaption(K, 1.0, 2.0) for K in strikes]
+    assert np.allclose(engine.price_batch(swaptions), grid[:, 1, 1], rtol=1e-12)
+    assert swaptions[2].accept_pricer(engine) == pytest.approx(grid[2, 1, 1], rel=1e-12)
+
+    with pytest.raises(ValueError):
+        VarianceSwaptionEngine(0.01, XI0, PARAMS, method="fft")
+    with pytest.raises(ValueError):
+        engine.price_variance_swap_swaption(Variance_Swap_Swaption(0.2, 1.0, 1.0))
+
+
+def test_against_monte_carlo_engine():
+    swaption = Variance_Swap_Swaption(0.2, 0.5, 1.0)
+    np.random.seed(3)
+    mc = MonteCarloEngine(R, 0.2, XI0, n_paths=4000, n_steps=50, params=PARAMS).price_variance_swap_swaption(swaption)
+    for method in ("quadrature", "moment_matching"):
+        price = VarianceSwaptionEngine(R, XI0, PARAMS, method=method).price_variance_swap_swaption(swaption)
+        # About three standard errors of the Monte Carlo estimate (the Euler bias is small at 50 steps)
+        assert price == pytest.approx(mc, abs=0.003)
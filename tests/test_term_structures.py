@@ -0,0 +1,73 @@
+import numpy as np
+
+from src.instruments.vanilla_option import VanillaOption
+from src.instruments.barrier_option import BarrierOption
+from src.market_data.yield_curve import YieldCurve
+from src.market_data.vol_surface import VolSurface
+from src.models.black_scholes.black_scholes_pricing import BlackScholesEngine
+
+
+def test_yield_curve_reprices_nodes_and_extrapolates_flat():
+    curve = YieldCurve([0.5, 1.0, 2.0, 5.0], [0.01, 0.015, 0.02, 0.025])
+
+    assert np.allclose(curve.zero_rate(np.array([0.5, 1.0, 2.0, 5.0])), [0.01, 0.015, 0.02, 0.025])
+    assert curve.zero_rate(0.1) == 0.01
+    assert curve.zero_rate(10.0) == 0.025
+    assert np.isclose(curve.discount(2.0), np.exp(-0.04))
+    # Scalar fast path and vectorised path agree
+    t = np.linspace(0.0, 6.0, 25)
+    assert np.allclose(curve.discount(t), [curve.discount(x) for x in t])
+
+
+def test_yield_curve_rebuilds_after_node_update():
+    curve = YieldCurve([1.0, 2.0], [0.02, 0.03], interpolation="linear")
+    assert np.isclose(curve.zero_rate(1.5), 0.025)
+
+    curve.update_node(1, 0.04)
+    assert np.isclose(curve.zero_rate(1.5), 0.03)
+
+    # Node arrays are copied: an update never leaks into the caller's array or other curves built from it
+    rates = np.array([0.02, 0.03])
+    first, second = YieldCurve([1.0, 2.0], rates), YieldCurve([1.0, 2.0], rates)
+    first.update_node(0, 0.05)
+    assert rates[0] == 0.02 and second.zero_rate(1.0) == 0.02
+
+    vols = np.array([[0.2, 0.25]])
+    surface = VolSurface([90.0, 110.0], [1.0], vols)
+    surface.update_vol(0, 0, 0.3)
+    assert vols[0, 0] == 0.2
+
+
+def test_vol_surface_interpolation():
+    strikes = [80.0, 90.0, 100.0, 110.0, 120.0]
+    expiries = [0.5, 1.0]
+    vols = [[0.25, 0.22, 0.20, 0.19, 0.185],
+            [0.24, 0.215, 0.20, 0.195, 0.19]]
+    surface = VolSurface(strikes, expiries, vols)
+
+    assert np.isclose(surface.vol(90.0, 0.5), 0.22)
+    assert np.isclose(surface.vol(100.0, 0.75), 0.20)
+    # Flat extrapolation in strike and time
+    assert np.isclose(surface.vol(50.0, 1.0), 0.24)
+    assert np.isclose(surface.vol(110.0, 3.0), 0.195)
+
+    K = np.array([85.0, 95.0, 105.0])
+    T = np.array([0.6, 0.8, 0.9])
+    assert np.allclose(surface.vol(K, T), [surface.vol(k, t) for k, t in zip(K, T)])
+
+    surface.update_vol(1, 2, 0.3)
+    assert np.isclose(surface.vol(100.0, 1.0), 0.3)
+
+
+def test_engine_with_flat_term_structures_matches_scalar_inputs():
+    scalar_engine = BlackScholesEngine(interest_rate=0.02, volatility=0.2, spot_price=100.0)
+    curve_engine = BlackScholesEngine(interest_rate=YieldCurve.flat(0.02),
+                                      volatility=VolSurface.flat(0.2),
+                                      spot_price=100.0)
+
+    call = VanillaOption(strike=105, maturity=1.5, option_type="call")
+    barrier = BarrierOption(strike=110, maturity=1.0, option_type="call", barrier_level=80,
+                            barrier_type="down-and-out")
+
+    assert np.isclose(call.accept_pricer(scalar_engine), call.accept_pricer(curve_engine))
+    assert np.isclose(barrier.accept_pricer(scalar_engine), barrier.accept_pricer(curve_engine))
@@ -0,0 +1,112 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.instruments.barrier_option import BarrierOption
+from src.instruments.vanilla_option import VanillaOption
+from src.market_data.market import Market
+from src.models.black_scholes.black_scholes_pricing import BlackScholesEngine
+from src.models.monte_carlo.monte_carlo_pricing import MonteCarloEngine
+from src.models.pde.pde_pricing import PDEPricingEngine
+from src.valuation.valuation_request import ValuationRequest
+from src.valuation.valuation_service import ValuationService, ServiceOverloaded
+
+market = Market(spot_prices={"STOCK_XYZ": 100.0})
+bs_engine = BlackScholesEngine(interest_rate=0.02, volatility=0.2, spot_price=100.0)
+
+
+def _options(n):
+    options = []
+    for i in range(n):
+        K = 80.0 + i % 40
+        if i % 3 == 0:
+            options.append(BarrierOption(K, 1.0, "call", 70.0, "down-and-out"))
+        else:
+            options.append(VanillaOption(K, 0.5 + (i % 2) * 0.5, "put" if i % 2 else "call"))
+    return options
+
+
+def test_coalesced_results_match_single_valuations():
+    options = _options(60)
+
+    async def run():
+        with ThreadPoolExecutor(2) as executor:
+            async with ValuationService(batch_window=0.01, executor=executor) as service:
+                results = await asyncio.gather(*(service.submit(ValuationRequest(o, bs_engine, market))
+                                                  for o in options))
+                return results, dict(service.stats)
+
+    results, stats = asyncio.run(run())
+    expected = [ValuationRequest(o, bs_engine, market).run_valuation() for o in options]
+    assert [r.fair_value for r in results] == pytest.approx(expected, rel=1e-12)
+    assert stats["requests"] == 60
+    # 60 requests grouped by kind and maturity: far fewer engine calls than requests
+    assert stats["engine_calls"] < 10
+    assert max(r.additional_info["batch_size"] for r in results) > 1
+
+
+def test_bad_request_fails_alone_and_overflow_rejects():
+    good = VanillaOption(100.0, 1.0, "call")
+    # Up-and-out call with B <= K has no price in the BS formulas
+    bad = BarrierOption(100.0, 1.0, "call", 90.0, "up-and-out")
+    ok_barrier = BarrierOption(100.0, 1.0, "call", 130.0, "up-and-out")
+
+    async def run():
+        with ThreadPoolExecutor(1) as executor:
+            async with ValuationService(batch_window=0.01, executor=executor) as service:
+                return await asyncio.gather(service.price(good, bs_engine), service.price(bad, bs_engine),
+                                            service.price(ok_barrier, bs_engine), return_exceptions=True)
+
+    good_result, bad_result, barrier_result = asyncio.run(run())
+    assert good_result.fair_value == pytest.approx(bs_engine.price_vanilla_option(good))
+    assert isinstance(bad_result, ValueError)
+    assert barrier_result.fair_value == pytest.approx(bs_engine.price_barrier_option(ok_barrier))
+
+    async def flood():
+        with ThreadPoolExecutor(1) as executor:
+            async with ValuationService(batch_window=0.05, max_pending=2, overflow="reject",
+                                        executor=executor) as service:
+                return await asyncio.gather(*(service.price(good, bs_engine) for _ in range(10)),
+                                            return_exceptions=True)
+
+    outcomes = asyncio.run(flood())
+    assert any(isinstance(o, ServiceOverloaded) for o in outcomes)
+    assert any(not isinstance(o, Exception) for o in outcomes)
+
+
+def test_process_pool_shares_monte_carlo_paths_per_maturity():
+    engine = MonteCarloEngine(interest_rate=0.02, volatility=0.2, spot_price=100.0, n_paths=20000, n_steps=10)
+    options = [VanillaOption(K, 1.0, "call") for K in (90.0, 100.0, 110.0)]
+
+    async def run():
+        async with ValuationService(batch_window=0.02, max_workers=1) as service:
+            return await asyncio.gather(*(service.price(o, engine) for o in options))
+
+    results = asyncio.run(run())
+    prices = [r.fair_value for r in results]
+    # Priced off one path set, so strictly decreasing in the strike
+    assert prices[0] > prices[1] > prices[2]
+    assert all(r.additional_info["batch_size"] == 3 for r in results)
+    for price, option in zip(prices, options):
+        assert price == pytest.approx(bs_engine.price_vanilla_option(option), rel=0.05)
+
+
+def test_requests_for_greeks_get_them_through_the_service():
+    pde = PDEPricingEngine(0.02, 0.2, 100.0, nx=100, nt=50)
+    options = [VanillaOption(95.0, 1.0, "call"), BarrierOption(100.0, 1.0, "call", 85.0, "down-and-out")]
+
+    async def run():
+        with ThreadPoolExecutor(2) as executor:
+            async with ValuationService(batch_window=0.01, executor=executor) as service:
+                requests = [ValuationRequest(o, pde, market, compute_greeks=True) for o in options]
+                return await asyncio.gather(*(service.submit(request) for request in requests),
+                                            service.submit(ValuationRequest(options[0], pde, market)))
+
+    *with_greeks, plain = asyncio.run(run())
+    for option, result in zip(options, with_greeks):
+        expected = ValuationRequest(option, pde, market, compute_greeks=True).run_valuation_result()
+        assert result.fair_value == pytest.approx(expected.fair_value, abs=1e-12)
+        assert result.greeks == pytest.approx(expected.greeks, abs=1e-12)
+    assert plain.greeks == {}
+    assert plain.fair_value == pytest.approx(with_greeks[0].fair_value, abs=1e-12)